@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the stdio bridge HTTP client
+
+Starts a local stand-in MCP server over TLS (self-signed certificate generated
+with the ``openssl`` CLI) and measures per-call latency for:
+
+  * baseline - one ``requests.post`` per call (fresh TCP + TLS handshake)
+  * bridge   - ``StdioMCPWrapper.send_to_server`` on the pooled client
+
+Usage:
+    python benchmark_bridge.py [--calls 500] [--payload-kb 16]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import socket
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+
+def make_certificate(directory):
+    """Create a throwaway self-signed certificate for 127.0.0.1."""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def make_handler(payload_kb):
+    """Stand-in for the FAC endpoint: echoes a tools/list-sized result."""
+    filler = "x" * (payload_kb * 1024)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # Headers and body are written separately; without NODELAY the
+            # stand-in adds delayed-ACK stalls a real server would not.
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            request = json.loads(body)
+
+            data = json.dumps(
+                {"message": {"jsonrpc": "2.0", "id": request.get("id"), "result": {"blob": filler}}}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                data = gzip.compress(data)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label, samples):
+    print(
+        f"{label:<10} p50={percentile(samples, 50) * 1000:7.2f} ms  "
+        f"p99={percentile(samples, 99) * 1000:7.2f} ms  "
+        f"mean={statistics.mean(samples) * 1000:7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--payload-kb", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = make_certificate(tmp)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.payload_kb))
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        server_url = f"https://127.0.0.1:{server.server_address[1]}"
+        os.environ.update(
+            {
+                "FRAPPE_SERVER_URL": server_url,
+                "FRAPPE_API_KEY": "benchmark-key",
+                "FRAPPE_API_SECRET": "benchmark-secret",
+                "REQUESTS_CA_BUNDLE": cert,
+            }
+        )
+
+        sys.path.insert(0, str(Path(__file__).parent / "server"))
+        from frappe_assistant_stdio_bridge import StdioMCPWrapper
+
+        bridge = StdioMCPWrapper()
+        url = bridge.endpoint_url
+        request = {"jsonrpc": "2.0", "method": "tools/list", "params": {}}
+
+        baseline = []
+        for i in range(args.calls):
+            start = time.perf_counter()
+            requests.post(url, headers=bridge.headers, json={**request, "id": i}, timeout=30).json()
+            baseline.append(time.perf_counter() - start)
+
+        pooled = []
+        for i in range(args.calls):
+            start = time.perf_counter()
+            result = bridge.send_to_server({**request, "id": i})
+            pooled.append(time.perf_counter() - start)
+            assert "result" in result, result
+
+        bridge.transport.close()
+        server.shutdown()
+
+    print(f"{args.calls} calls, {args.payload_kb} KiB result, TLS on 127.0.0.1")
+    report("baseline", baseline)
+    report("bridge", pooled)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,99 @@
 """
 Stdio assistant Wrapper for Frappe MCP Server
 This wrapper allows Claude Desktop to communicate with your HTTP-based MCP server
+
+All requests share one persistent HTTP client, so JSON-RPC calls reuse
+pooled keep-alive connections instead of paying a TCP/TLS handshake each.
+Responses are gzip-negotiated and failed connects / 429 / 503 are retried
+with exponential backoff. Set MCP_HTTP2=1 (requires ``httpx[http2]``) to
+multiplex calls over a single HTTP/2 connection.
+
+Tunables (environment):
+    MCP_MAX_INFLIGHT       Concurrent requests to the server (default 8)
+    MCP_HTTP_RETRIES       Retries for failed connects / 429 / 503 (default 3)
+    MCP_HTTP2              "1" to use HTTP/2 when httpx + h2 are installed
+    MCP_COMPRESS_REQUESTS  "1" to gzip request bodies of 1 KiB or more
 """
 
+import gzip
 import json
 import os
 import queue
 import sys
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Request bodies smaller than this are sent uncompressed (gzip overhead
+# outweighs the savings for typical JSON-RPC calls).
+COMPRESS_MIN_BYTES = 1024
+
+
+class RequestsTransport:
+    """HTTP/1.1 transport: a shared requests.Session over a keep-alive pool."""
+
+    def __init__(self, headers: Dict[str, str], pool_size: int, retries: int):
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+
+        # POST is retried only where the server cannot have processed the
+        # call: connection failures, 429 and 503. Read errors are not retried
+        # so a slow tools/call is never executed twice.
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset({"POST"}),
+            backoff_factor=0.5,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str], timeout: float):
+        try:
+            return self.session.post(url, data=body, headers=headers, timeout=timeout)
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError(str(e)) from e
+
+    def close(self):
+        self.session.close()
+
+
+class HttpxTransport:
+    """HTTP/2 transport: concurrent calls are multiplexed over one connection."""
+
+    def __init__(self, headers: Dict[str, str], pool_size: int, retries: int):
+        import httpx
+
+        self._httpx = httpx
+        self.client = httpx.Client(
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            transport=httpx.HTTPTransport(http2=True, retries=retries),
+        )
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str], timeout: float):
+        try:
+            return self.client.post(url, content=body, headers=headers, timeout=timeout)
+        except self._httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+
+    def close(self):
+        self.client.close()
 
 
 class StdioMCPWrapper:
@@ -42,13 +123,51 @@ class StdioMCPWrapper:
         self.headers = {
             "Authorization": f"token {self.api_key}:{self.api_secret}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
             "Mcp-Session-Id": self.session_id,
             "X-Assistant-Client-Id": self.client_id,
         }
-
-        # Thread pool for handling concurrent requests
-        self.executor = ThreadPoolExecutor(max_workers=5)
-        self.output_lock = threading.Lock()
+        self.endpoint_url = f"{self.server_url}/api/method/frappe_assistant_core.api.fac_endpoint.handle_mcp"
+
+        self.max_inflight = max(1, int(os.environ.get("MCP_MAX_INFLIGHT", "8")))
+        self.compress_requests = os.environ.get("MCP_COMPRESS_REQUESTS") == "1"
+        self.transport = self.create_transport()
+
+        # Bounded concurrency: stdin is not read past max_inflight pending
+        # requests, and responses go through a bounded queue drained by a
+        # single writer thread, so a slow stdout reader throttles the workers.
+        self.executor = ThreadPoolExecutor(max_workers=self.max_inflight)
+        self.inflight = threading.BoundedSemaphore(self.max_inflight)
+        self.output_queue = queue.Queue(maxsize=self.max_inflight * 2)
+        self.writer = threading.Thread(target=self.write_loop, name="mcp-stdout-writer", daemon=True)
+        self.writer.start()
+
+    def create_transport(self):
+        """Build the shared HTTP client (HTTP/2 when requested and available)."""
+        retries = int(os.environ.get("MCP_HTTP_RETRIES", "3"))
+
+        if os.environ.get("MCP_HTTP2") == "1":
+            try:
+                transport = HttpxTransport(self.headers, self.max_inflight, retries)
+                self.log_debug("Using HTTP/2 transport")
+                return transport
+            except ImportError:
+                self.log_error("MCP_HTTP2=1 requires 'httpx[http2]'; falling back to HTTP/1.1")
+
+        return RequestsTransport(self.headers, self.max_inflight, retries)
+
+    def write_loop(self):
+        """Write queued responses to stdout, one JSON document per line."""
+        while True:
+            line = self.output_queue.get()
+            if line is None:
+                break
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    def emit(self, response: Dict[str, Any]):
+        """Queue a response for stdout; blocks while the writer is behind."""
+        self.output_queue.put(json.dumps(response))
 
     def log_error(self, message: str):
         """Log error to stderr"""
@@ -72,12 +191,16 @@ class StdioMCPWrapper:
             else:
                 timeout = int(os.environ.get("MCP_REQUEST_TIMEOUT", "30"))
 
-            response = requests.post(
-                f"{self.server_url}/api/method/frappe_assistant_core.api.fac_endpoint.handle_mcp",
-                headers=self.headers,
-                json=request_data,
-                timeout=timeout,
-            )
+            body = json.dumps(request_data).encode("utf-8")
+            extra_headers = {}
+            if self.compress_requests and len(body) >= COMPRESS_MIN_BYTES:
+                body = gzip.compress(body)
+                # Not labelled application/json: Frappe would try to parse the
+                # compressed bytes as form data before the MCP endpoint runs.
+                extra_headers["Content-Encoding"] = "gzip"
+                extra_headers["Content-Type"] = "application/octet-stream"
+
+            response = self.transport.post(self.endpoint_url, body, extra_headers, timeout)
 
             # 202 = notification accepted (no response body expected)
             if response.status_code == 202:
@@ -101,12 +224,12 @@ class StdioMCPWrapper:
                     -32603, f"Server error: {response.status_code}", response.text, request_data.get("id")
                 )
 
-        except requests.exceptions.Timeout:
+        except TimeoutError:
             self.log_error("Request timed out")
             return self.format_error_response(
                 -32001, "Request timed out", "Server took too long to respond", request_data.get("id")
             )
-        except requests.exceptions.ConnectionError:
+        except ConnectionError:
             self.log_error("Cannot connect to assistant server. Make sure it's running on " + self.server_url)
             return self.format_error_response(
                 -32603,
@@ -204,16 +327,16 @@ class StdioMCPWrapper:
             # Only send response if request had an id and we got a response
             # (notifications return None from send_to_server)
             if request_id is not None and response is not None:
-                with self.output_lock:
-                    print(json.dumps(response), flush=True)
+                self.emit(response)
             else:
                 self.log_debug(f"Notification processed: {method}")
 
         except Exception as e:
             self.log_error(f"Error processing request: {e}")
             error_response = self.format_error_response(-32603, "Internal error", str(e), request.get("id"))
-            with self.output_lock:
-                print(json.dumps(error_response), flush=True)
+            self.emit(error_response)
+        finally:
+            self.inflight.release()
 
     def run(self):
         """Main stdio loop"""
@@ -229,13 +352,14 @@ class StdioMCPWrapper:
                     request = json.loads(line)
                     self.log_debug(f"Received request: {request}")
 
-                    # Submit request to thread pool for concurrent processing
+                    # Wait for a free slot, then process concurrently
+                    self.inflight.acquire()
                     self.executor.submit(self.process_request, request)
 
                 except json.JSONDecodeError as e:
                     self.log_error(f"Invalid JSON received: {e}")
                     error_response = self.format_error_response(-32700, "Parse error", str(e), None)
-                    print(json.dumps(error_response), flush=True)
+                    self.emit(error_response)
 
         except KeyboardInterrupt:
             self.log_debug("Wrapper stopped by user")
@@ -244,6 +368,9 @@ class StdioMCPWrapper:
             sys.exit(1)
         finally:
             self.executor.shutdown(wait=True)
+            self.output_queue.put(None)
+            self.writer.join()
+            self.transport.close()
 
 
 if __name__ == "__main__":
@@ -76,7 +76,7 @@ def get_tool_stats() -> dict:
         plugin_manager = get_plugin_manager()
         tool_registry = get_tool_registry()
 
-        tools = plugin_manager.get_all_tools()
+        tools = dict(plugin_manager.get_all_tools())
 
         external_tools = tool_registry._get_external_tools()
         tools.update(external_tools)
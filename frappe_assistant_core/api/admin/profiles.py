@@ -0,0 +1,74 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# AGPL-3.0-or-later — see <https://www.gnu.org/licenses/>.
+
+import frappe
+
+
+@frappe.whitelist()
+def get_tool_profiles(limit: int = 50) -> dict:
+    """
+    List recent tool profiles for the admin dashboard.
+    """
+    frappe.only_for(["System Manager", "Assistant Admin"])
+    try:
+        profiles = frappe.get_all(
+            "Assistant Tool Profile",
+            fields=[
+                "name",
+                "tool_name",
+                "user",
+                "started_at",
+                "wall_time",
+                "sample_count",
+                "query_count",
+                "db_time",
+            ],
+            order_by="creation desc",
+            limit=min(frappe.utils.cint(limit) or 50, 500),
+        )
+        audit_logs = dict(
+            frappe.get_all(
+                "Assistant Audit Log",
+                filters={"profile": ("in", [p.name for p in profiles])},
+                fields=["profile", "name"],
+                as_list=True,
+            )
+            if profiles
+            else []
+        )
+        for profile in profiles:
+            profile["audit_log"] = audit_logs.get(profile.name)
+        return {"success": True, "profiles": profiles}
+    except Exception as e:
+        frappe.log_error(f"Failed to get tool profiles: {str(e)}")
+        return {"success": False, "error": str(e), "profiles": []}
+
+
+@frappe.whitelist()
+def get_tool_profile(name: str) -> dict:
+    """
+    One tool profile with its hottest frames and raw collapsed stacks.
+    """
+    from frappe_assistant_core.utils.profiler import PROFILE_DOCTYPE, summarize_collapsed
+
+    frappe.only_for(["System Manager", "Assistant Admin"])
+    if not frappe.db.exists(PROFILE_DOCTYPE, name):
+        return {"success": False, "error": f"Profile '{name}' not found"}
+
+    doc = frappe.get_doc(PROFILE_DOCTYPE, name)
+    return {
+        "success": True,
+        "profile": {
+            "name": doc.name,
+            "tool_name": doc.tool_name,
+            "wall_time": doc.wall_time,
+            "sample_count": doc.sample_count,
+            "sample_interval_ms": doc.sample_interval_ms,
+            "query_count": doc.query_count,
+            "db_time": doc.db_time,
+            "collapsed_stacks": doc.collapsed_stacks,
+        },
+        "summary": summarize_collapsed(doc.collapsed_stacks),
+    }
@@ -27,11 +27,13 @@ def get_usage_statistics() -> dict:
         today = frappe.utils.today()
         week_start = frappe.utils.add_days(today, -7)
 
-        # Audit log statistics
+        # Audit log statistics from the hourly rollups (plus the live tail)
         try:
-            total_audit = frappe.db.count("Assistant Audit Log") or 0
-            today_audit = frappe.db.count("Assistant Audit Log", {"creation": (">=", today)}) or 0
-            week_audit = frappe.db.count("Assistant Audit Log", {"creation": (">=", week_start)}) or 0
+            from frappe_assistant_core.utils.audit_rollup import get_audit_summary
+
+            total_audit = get_audit_summary()["total"]
+            today_audit = get_audit_summary(today)["total"]
+            week_audit = get_audit_summary(week_start)["total"]
         except Exception as e:
             api_logger.warning(f"Audit stats error: {e}")
             total_audit = today_audit = week_audit = 0
@@ -23,7 +23,7 @@ def get_tool_configurations() -> dict:
     try:
         plugin_manager = get_plugin_manager()
         tool_registry = get_tool_registry()
-        all_tools = plugin_manager.get_all_tools()
+        all_tools = dict(plugin_manager.get_all_tools())
         enabled_plugins = plugin_manager.get_enabled_plugins()
 
         # Include external tools from hooks (registered via assistant_tools)
@@ -136,7 +136,7 @@ def toggle_tool(tool_name: str, enabled: bool):
         # Validate tool exists
         plugin_manager = get_plugin_manager()
         tool_registry = get_tool_registry()
-        all_tools = plugin_manager.get_all_tools()
+        all_tools = dict(plugin_manager.get_all_tools())
 
         # Include external tools from hooks
         external_tools = tool_registry._get_external_tools()
@@ -346,7 +346,7 @@ def update_tool_category(tool_name: str, category: str, override: bool = True):
         # Validate tool exists
         plugin_manager = get_plugin_manager()
         tool_registry = get_tool_registry()
-        all_tools = plugin_manager.get_all_tools()
+        all_tools = dict(plugin_manager.get_all_tools())
 
         # Include external tools from hooks
         external_tools = tool_registry._get_external_tools()
@@ -418,7 +418,7 @@ def update_tool_role_access(tool_name: str, role_access_mode: str, roles: list |
         # Validate tool exists
         plugin_manager = get_plugin_manager()
         tool_registry = get_tool_registry()
-        all_tools = plugin_manager.get_all_tools()
+        all_tools = dict(plugin_manager.get_all_tools())
 
         # Include external tools from hooks
         external_tools = tool_registry._get_external_tools()
@@ -34,6 +34,12 @@ from frappe_assistant_core.api.admin.plugins import (  # noqa: F401
     toggle_plugin,
 )
 
+# Tool profiling
+from frappe_assistant_core.api.admin.profiles import (  # noqa: F401
+    get_tool_profile,
+    get_tool_profiles,
+)
+
 # Prompt template management
 from frappe_assistant_core.api.admin.prompts import (  # noqa: F401
     get_prompt_templates_list,
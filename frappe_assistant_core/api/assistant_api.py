@@ -55,25 +55,21 @@ def get_usage_statistics() -> Dict[str, Any]:
         today = frappe.utils.today()
         week_start = frappe.utils.add_days(today, -7)
 
-        # Connection statistics are no longer tracked (Assistant Connection Log removed)
-        # Using audit log activity as a proxy for connection activity
+        # Audit log statistics from the hourly rollups (plus the live tail)
         try:
-            total_connections = frappe.db.count("Assistant Audit Log") or 0
-            today_connections = frappe.db.count("Assistant Audit Log", {"creation": (">=", today)}) or 0
-            week_connections = frappe.db.count("Assistant Audit Log", {"creation": (">=", week_start)}) or 0
-        except Exception as e:
-            api_logger.warning(f"Connection stats error: {e}")
-            total_connections = today_connections = week_connections = 0
+            from frappe_assistant_core.utils.audit_rollup import get_audit_summary
 
-        # Audit log statistics with error handling
-        try:
-            total_audit = frappe.db.count("Assistant Audit Log") or 0
-            today_audit = frappe.db.count("Assistant Audit Log", {"creation": (">=", today)}) or 0
-            week_audit = frappe.db.count("Assistant Audit Log", {"creation": (">=", week_start)}) or 0
+            total_audit = get_audit_summary()["total"]
+            today_audit = get_audit_summary(today)["total"]
+            week_audit = get_audit_summary(week_start)["total"]
         except Exception as e:
             api_logger.warning(f"Audit stats error: {e}")
             total_audit = today_audit = week_audit = 0
 
+        # Connection statistics are no longer tracked (Assistant Connection Log removed)
+        # Using audit log activity as a proxy for connection activity
+        total_connections, today_connections, week_connections = total_audit, today_audit, week_audit
+
         # Tool statistics from plugin manager
         try:
             from frappe_assistant_core.utils.plugin_manager import get_plugin_manager
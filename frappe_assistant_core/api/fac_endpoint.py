@@ -21,17 +21,20 @@ Custom MCP implementation that properly handles JSON serialization
 and integrates seamlessly with Frappe's existing tool infrastructure.
 """
 
+import time
+
 import frappe
 from frappe import _
 
 from frappe_assistant_core.mcp.server import MCPServer
+from frappe_assistant_core.utils.metrics import observe
+from frappe_assistant_core.utils.settings import get_assistant_settings
 
 
 def _get_mcp_server_name():
     """Get MCP server name from settings or use default."""
     try:
-        settings = frappe.get_single("Assistant Core Settings")
-        return settings.mcp_server_name or "frappe-assistant-core"
+        return get_assistant_settings().mcp_server_name
     except Exception:
         return "frappe-assistant-core"
 
@@ -118,7 +121,10 @@ def _resolve_tool_categories(tool_names: list, registry) -> dict:
       2. Auto-detected category via ``detect_tool_category`` (no config row yet).
       3. ``"read_write"`` fallback (maps to no annotation hints — safe default).
 
-    Stored categories are batch-fetched in one query to avoid a DB read per tool.
+    Stored categories come from the registry's cached configuration map, so
+    a normal request does no category query. Auto-detection is memoized per
+    tool class in the worker; config rows for new tools are created by the
+    tool sync at migrate, never on this read path.
 
     Args:
         tool_names: Tool names to resolve.
@@ -131,19 +137,15 @@ def _resolve_tool_categories(tool_names: list, registry) -> dict:
 
     categories = {}
 
-    # 1. Batch-fetch stored categories.
+    # 1. Stored categories from the cached configuration map.
     try:
-        rows = frappe.get_all(
-            "FAC Tool Configuration",
-            filters={"tool_name": ["in", tool_names]} if tool_names else {},
-            fields=["tool_name", "tool_category"],
-            ignore_permissions=True,
-        )
-        for row in rows:
-            if row.get("tool_category"):
-                categories[row["tool_name"]] = row["tool_category"]
+        configs = registry._get_tool_configurations()
+        for tool_name in tool_names:
+            category = (configs.get(tool_name) or {}).get("tool_category")
+            if category:
+                categories[tool_name] = category
     except Exception as e:
-        frappe.logger().warning(f"Could not batch-fetch tool categories: {e}")
+        frappe.logger().warning(f"Could not load stored tool categories: {e}")
 
     # 2 & 3. Fill gaps via auto-detection, defaulting to read_write.
     for tool_name in tool_names:
@@ -151,7 +153,10 @@ def _resolve_tool_categories(tool_names: list, registry) -> dict:
             continue
         try:
             tool_instance = registry.get_tool(tool_name)
-            categories[tool_name] = detect_tool_category(tool_instance) if tool_instance else "read_write"
+            if tool_instance:
+                categories[tool_name] = detect_tool_category(tool_instance)
+            else:
+                categories[tool_name] = "read_write"
         except Exception:
             categories[tool_name] = "read_write"
 
@@ -173,9 +178,20 @@ def _authenticate_mcp_request():
     from werkzeug.wrappers import Response
 
     from frappe_assistant_core.api.oauth_discovery import get_public_base_url
+    from frappe_assistant_core.utils.auth import get_cached_auth, set_cached_auth
 
+    frappe.local.fac_assistant_enabled = None
     auth_header = frappe.request.headers.get("Authorization", "")
 
+    # Fast path: a credential validated within the last AUTH_CACHE_TTL seconds
+    # skips the token lookup / secret decryption and the User query.
+    cached = get_cached_auth(auth_header) if auth_header else None
+    if cached:
+        # nosemgrep: frappe-setuser — user resolved from a previously validated credential
+        frappe.set_user(cached["user"])
+        frappe.local.fac_assistant_enabled = cached["assistant_enabled"]
+        return cached["user"]
+
     # Try OAuth Bearer token authentication first
     if auth_header.startswith("Bearer "):
         token = auth_header[7:]  # Remove "Bearer " prefix
@@ -203,6 +219,16 @@ def _authenticate_mcp_request():
             # nosemgrep: frappe-setuser — user resolved from validated, non-expired OAuth bearer token
             frappe.set_user(bearer_token.user)
             frappe.logger().info(f"OAuth token validated successfully for user: {bearer_token.user}")
+
+            assistant_enabled = _check_assistant_enabled(bearer_token.user)
+            set_cached_auth(
+                auth_header,
+                bearer_token.user,
+                assistant_enabled,
+                bearer_token.expiration_time,
+                token_name=bearer_token.name,
+            )
+            frappe.local.fac_assistant_enabled = assistant_enabled
             return bearer_token.user
 
         except frappe.DoesNotExistError:
@@ -270,6 +296,10 @@ def _authenticate_mcp_request():
                         # nosemgrep: frappe-setuser — user authenticated via API key:secret comparison above
                         frappe.set_user(str(user))
                         frappe.logger().info(f"API key authentication successful for user: {user}")
+
+                        assistant_enabled = _check_assistant_enabled(str(user))
+                        set_cached_auth(auth_header, str(user), assistant_enabled)
+                        frappe.local.fac_assistant_enabled = assistant_enabled
                         return str(user)
                     else:
                         frappe.logger().warning("API secret mismatch")
@@ -360,7 +390,13 @@ def handle_mcp():
         return response
 
     # Authenticate the request (supports both OAuth and API key)
+    auth_start = time.perf_counter()
     auth_result = _authenticate_mcp_request()
+    observe(
+        "fac_auth_duration_seconds",
+        time.perf_counter() - auth_start,
+        {"result": "denied" if isinstance(auth_result, Response) else "ok"},
+    )
 
     # If authentication failed, auth_result is a Response object with 401
     if isinstance(auth_result, Response):
@@ -369,8 +405,11 @@ def handle_mcp():
     # Authentication successful - auth_result is the username
     authenticated_user = auth_result
 
-    # Check if user has assistant access enabled
-    if not _check_assistant_enabled(authenticated_user):
+    # Check if user has assistant access enabled (resolved during authentication)
+    assistant_enabled = getattr(frappe.local, "fac_assistant_enabled", None)
+    if assistant_enabled is None:
+        assistant_enabled = _check_assistant_enabled(authenticated_user)
+    if not assistant_enabled:
         frappe.throw(
             _("Assistant access is disabled for user {0}").format(authenticated_user), frappe.PermissionError
         )
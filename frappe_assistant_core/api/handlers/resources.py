@@ -22,11 +22,93 @@ from frappe_assistant_core.utils.logger import api_logger
 _SKILL_URI_PREFIX = "fac://skills/"
 _SKILL_ID_RE = re.compile(r"^[a-z0-9_-]+$")
 
+# Skill catalog cache. The catalog (every skill's metadata, content and
+# shared roles) is stored in Redis under the current catalog generation and
+# memoized per worker, so resources/read and tools/list never touch the DB
+# once warm. Any FAC Skill save/trash bumps the generation.
+_CATALOG_VERSION = "skill_catalog"
+_CATALOG_TTL = 3600
+_catalog_state: Dict[str, Dict[str, Any]] = {}
+
+# Usage counters are accumulated in Redis hashes (skill name -> count /
+# last-used timestamp) and written to the DB by flush_skill_usage.
+_USAGE_COUNT_KEY = "fac_skill_usage_count"
+_USAGE_LAST_USED_KEY = "fac_skill_usage_last_used"
+
+
+def _build_skill_catalog() -> Dict[str, frappe._dict]:
+    """Load every FAC Skill with its content and shared roles, keyed by skill_id."""
+    rows = frappe.get_all(
+        "FAC Skill",
+        fields=list(SkillManager._LIST_FIELDS) + ["content"],
+    )
+    shared = frappe.db.sql(
+        """
+        SELECT parent, role
+        FROM `tabHas Role`
+        WHERE parenttype = 'FAC Skill'
+        """,
+        as_dict=True,
+    )
+    roles_by_skill: Dict[str, List[str]] = {}
+    for r in shared:
+        roles_by_skill.setdefault(r.parent, []).append(r.role)
+
+    catalog = {}
+    for row in rows:
+        row["shared_roles"] = roles_by_skill.get(row.name, [])
+        catalog[row.skill_id] = row
+    return catalog
+
+
+def get_skill_catalog() -> Dict[str, frappe._dict]:
+    """
+    Return the skill catalog for the current site.
+
+    Lookup order: worker memo (same generation) -> Redis -> DB rebuild.
+    """
+    from frappe_assistant_core.utils.cache import get_cache_version
+
+    version = get_cache_version(_CATALOG_VERSION)
+    site = frappe.local.site
+    state = _catalog_state.get(site)
+    if state and state["version"] == version:
+        return state["catalog"]
+
+    from frappe_assistant_core.utils.metrics import record_cache_lookup
+
+    cache_key = f"fac_skill_catalog_{version}"
+    catalog = frappe.cache.get_value(cache_key)
+    record_cache_lookup("skill_catalog", catalog is not None)
+    if catalog is None:
+        catalog = _build_skill_catalog()
+        frappe.cache.set_value(cache_key, catalog, expires_in_sec=_CATALOG_TTL)
+    else:
+        catalog = {k: frappe._dict(v) for k, v in catalog.items()}
+
+    _catalog_state[site] = {"version": version, "catalog": catalog, "by_roles": {}}
+    return catalog
+
+
+def invalidate_skill_catalog():
+    """
+    Advance the catalog generation. Called again after commit so a reader that
+    rebuilt the catalog mid-transaction cannot pin pre-commit data.
+    """
+    from frappe_assistant_core.utils.cache import bump_cache_version
+
+    bump_cache_version(_CATALOG_VERSION)
+    try:
+        frappe.db.after_commit.add(lambda: bump_cache_version(_CATALOG_VERSION))
+    except AttributeError:
+        pass
+
 
 class SkillManager:
     """
-    Stateless helper for skill queries, filtering, and permission checks.
-    Construct per call — no shared state across requests.
+    Helper for skill queries, filtering, and permission checks.
+    Construct per call. Reads are served from the shared skill catalog
+    (see ``get_skill_catalog``); the manager itself holds no state.
     """
 
     _LIST_FIELDS = (
@@ -54,65 +136,40 @@ class SkillManager:
         Results are deduplicated by ``skill_id``.
         """
         user = user or frappe.session.user
-        user_roles = frappe.get_roles(user)
+        catalog = get_skill_catalog()
 
-        # Single OR-filter covers own skills (any status) + published public/system.
-        base = frappe.get_all(
-            "FAC Skill",
-            filters={},
-            or_filters=[
-                ["owner_user", "=", user],
-                ["visibility", "=", "Public"],
-                ["is_system", "=", 1],
-            ],
-            fields=list(self._LIST_FIELDS),
-        )
+        accessible = set(self._get_published_ids_for_roles(frappe.get_roles(user)))
+        accessible.update(sid for sid, s in catalog.items() if s.owner_user == user)
 
-        # The or_filter doesn't express "status must be Published unless owner".
-        # Filter that in Python (cheap — result set is already scoped).
-        skills = [s for s in base if s.owner_user == user or s.status == "Published"]
-
-        # Add Shared-with-role skills (requires a join against Has Role).
-        if user_roles:
-            shared = self._get_shared_skills_for_user(user, user_roles)
-            seen = {s.skill_id for s in skills}
-            for s in shared:
-                if s.skill_id not in seen:
-                    skills.append(s)
-                    seen.add(s.skill_id)
-
-        # Dedup (own skill may also be Public/system).
-        deduped: List[Dict[str, Any]] = []
-        seen_ids = set()
-        for s in skills:
-            if s.skill_id in seen_ids:
-                continue
-            seen_ids.add(s.skill_id)
-            deduped.append(s)
-        return deduped
-
-    def _get_shared_skills_for_user(self, user: str, user_roles: List[str]) -> List[Dict]:
-        """Skills shared with roles the user has (Published only)."""
-        try:
-            return frappe.db.sql(
-                """
-                SELECT DISTINCT sk.name, sk.skill_id, sk.title, sk.description,
-                       sk.status, sk.skill_type, sk.linked_tool, sk.category,
-                       sk.owner_user, sk.visibility, sk.is_system
-                FROM `tabFAC Skill` sk
-                INNER JOIN `tabHas Role` hr
-                    ON hr.parent = sk.name AND hr.parenttype = 'FAC Skill'
-                WHERE sk.status = 'Published'
-                  AND sk.visibility = 'Shared'
-                  AND hr.role IN %(roles)s
-                  AND sk.owner_user != %(user)s
-                """,
-                {"roles": user_roles, "user": user},
-                as_dict=True,
+        return [
+            frappe._dict({f: catalog[sid].get(f) for f in self._LIST_FIELDS})
+            for sid in catalog
+            if sid in accessible
+        ]
+
+    def _get_published_ids_for_roles(self, user_roles: List[str]) -> List[str]:
+        """
+        Published skills visible to a role-set (Public, system, or Shared with
+        one of ``user_roles``). Memoized per role-set for the current catalog.
+        """
+        catalog = get_skill_catalog()
+        by_roles = _catalog_state[frappe.local.site]["by_roles"]
+        role_key = frozenset(user_roles or ())
+        if role_key in by_roles:
+            return by_roles[role_key]
+
+        ids = [
+            sid
+            for sid, s in catalog.items()
+            if s.status == "Published"
+            and (
+                s.visibility == "Public"
+                or s.is_system
+                or (s.visibility == "Shared" and role_key.intersection(s.shared_roles))
             )
-        except Exception as e:
-            frappe.logger("skill_manager").warning(f"Error fetching shared skills: {e}")
-            return []
+        ]
+        by_roles[role_key] = ids
+        return ids
 
     def get_skill_as_resource(self, skill_info: Dict) -> Dict[str, Any]:
         """Convert a skill row to an MCP resource descriptor."""
@@ -131,51 +188,63 @@ class SkillManager:
         Raises ``frappe.PermissionError`` when the caller is not permitted.
         Returns None when the skill does not exist.
         """
-        skill_name = frappe.db.get_value("FAC Skill", {"skill_id": skill_id}, "name")
-        if not skill_name:
+        skill = get_skill_catalog().get(skill_id)
+        if not skill:
             return None
 
-        skill_doc = frappe.get_doc("FAC Skill", skill_name)
         user = frappe.session.user
 
-        is_owner = skill_doc.owner_user == user
-        if skill_doc.status != "Published" and not is_owner:
+        is_owner = skill.owner_user == user
+        if skill.status != "Published" and not is_owner:
             frappe.throw(_("You don't have permission to access this skill"), frappe.PermissionError)
 
-        if not self._user_can_access_skill(skill_doc):
+        if not self._user_can_access_skill(skill):
             frappe.throw(_("You don't have permission to access this skill"), frappe.PermissionError)
 
-        # TODO: batch usage-counter writes if traffic grows.
-        self.increment_usage(skill_name)
+        self.increment_usage(skill.name)
 
-        return skill_doc.content
+        return skill.content
 
     def get_skill_by_tool(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Find a Published skill linked to ``tool_name`` that the caller can see."""
-        skill_name = frappe.db.get_value(
-            "FAC Skill",
-            {"linked_tool": tool_name, "status": "Published"},
-            "name",
+        skill = next(
+            (
+                s
+                for s in get_skill_catalog().values()
+                if s.linked_tool == tool_name and s.status == "Published"
+            ),
+            None,
         )
-        if not skill_name:
-            return None
-
-        skill_doc = frappe.get_doc("FAC Skill", skill_name)
-        if not self._user_can_access_skill(skill_doc):
+        if not skill or not self._user_can_access_skill(skill):
             return None
 
         return {
-            "name": skill_doc.name,
-            "skill_id": skill_doc.skill_id,
-            "title": skill_doc.title,
-            "description": skill_doc.description,
-            "content": skill_doc.content,
-            "skill_type": skill_doc.skill_type,
-            "linked_tool": skill_doc.linked_tool,
+            "name": skill.name,
+            "skill_id": skill.skill_id,
+            "title": skill.title,
+            "description": skill.description,
+            "content": skill.content,
+            "skill_type": skill.skill_type,
+            "linked_tool": skill.linked_tool,
         }
 
     def increment_usage(self, skill_name: str):
-        """Increment usage counter for analytics."""
+        """
+        Record a skill read for analytics.
+
+        Counts are accumulated in Redis and written by ``flush_skill_usage``,
+        so hot skills don't serialize readers on a row lock. Falls back to a
+        direct UPDATE when Redis is unavailable.
+        """
+        try:
+            pipe = frappe.cache.pipeline()
+            pipe.hincrby(frappe.cache.make_key(_USAGE_COUNT_KEY), skill_name, 1)
+            pipe.hset(frappe.cache.make_key(_USAGE_LAST_USED_KEY), skill_name, frappe.utils.now())
+            pipe.execute()
+            return
+        except Exception as e:
+            frappe.logger("skill_manager").debug(f"Usage counter not buffered for {skill_name}: {e}")
+
         try:
             frappe.db.sql(
                 """
@@ -188,45 +257,65 @@ class SkillManager:
         except Exception as e:
             frappe.logger("skill_manager").warning(f"Failed to increment usage for {skill_name}: {e}")
 
-    def _user_can_access_skill(self, skill_doc) -> bool:
-        """Check if current user can access the skill."""
+    def _user_can_access_skill(self, skill) -> bool:
+        """Check if current user can access the skill (a catalog entry)."""
         user = frappe.session.user
 
-        if skill_doc.owner_user == user:
+        if skill.owner_user == user:
             return True
 
-        if "System Manager" in frappe.get_roles(user):
-            return True
-
-        if skill_doc.visibility == "Public" and skill_doc.status == "Published":
-            return True
-
-        if skill_doc.visibility == "Shared" and skill_doc.status == "Published":
-            user_roles = set(frappe.get_roles(user))
-            shared_roles = {r.role for r in skill_doc.shared_with_roles}
-            if user_roles & shared_roles:
-                return True
-
-        if skill_doc.is_system and skill_doc.status == "Published":
+        user_roles = frappe.get_roles(user)
+        if "System Manager" in user_roles:
             return True
 
-        return False
+        return skill.skill_id in self._get_published_ids_for_roles(user_roles)
 
     def get_tool_skill_map(self) -> Dict[str, Dict[str, str]]:
         """
         Map of ``tool_name -> {description, skill_id}`` for all Published
         Tool-Usage skills. Drives token-optimization in replace mode.
         """
-        skills = frappe.get_all(
-            "FAC Skill",
-            filters={
-                "status": "Published",
-                "skill_type": "Tool Usage",
-                "linked_tool": ["is", "set"],
-            },
-            fields=["linked_tool", "description", "skill_id"],
+        return {
+            s.linked_tool: {"description": s.description, "skill_id": s.skill_id}
+            for s in get_skill_catalog().values()
+            if s.status == "Published" and s.skill_type == "Tool Usage" and s.linked_tool
+        }
+
+
+def flush_skill_usage():
+    """
+    Write buffered skill usage counters to FAC Skill (scheduled task).
+
+    The Redis hashes are read and cleared in one MULTI/EXEC so increments
+    landing during the flush are kept for the next run.
+    """
+    try:
+        count_key = frappe.cache.make_key(_USAGE_COUNT_KEY)
+        last_used_key = frappe.cache.make_key(_USAGE_LAST_USED_KEY)
+
+        pipe = frappe.cache.pipeline()
+        pipe.hgetall(count_key)
+        pipe.hgetall(last_used_key)
+        pipe.delete(count_key, last_used_key)
+        counts, last_used, _deleted = pipe.execute()
+    except Exception as e:
+        frappe.logger("skill_manager").warning(f"Failed to read skill usage counters: {e}")
+        return
+
+    for raw_name, raw_count in (counts or {}).items():
+        skill_name = frappe.safe_decode(raw_name)
+        used_at = frappe.safe_decode(last_used.get(raw_name)) if last_used.get(raw_name) else None
+        frappe.db.sql(
+            """
+            UPDATE `tabFAC Skill`
+            SET use_count = use_count + %s, last_used = COALESCE(%s, last_used)
+            WHERE name = %s
+            """,
+            (frappe.utils.cint(raw_count), used_at, skill_name),
         )
-        return {s.linked_tool: {"description": s.description, "skill_id": s.skill_id} for s in skills}
+
+    if counts:
+        frappe.db.commit()
 
 
 def get_skill_manager() -> SkillManager:
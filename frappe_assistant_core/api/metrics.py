@@ -0,0 +1,62 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Prometheus metrics endpoint.
+
+Served at ``/metrics`` (page renderer) and at
+``/api/method/frappe_assistant_core.api.metrics.metrics``. Both require a
+System Manager or Assistant Admin; Prometheus can authenticate with an API
+key via ``authorization: {type: token, credentials: "<key>:<secret>"}``.
+"""
+
+import frappe
+from werkzeug.wrappers import Response
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _metrics_response() -> Response:
+    from frappe_assistant_core.utils.metrics import render_metrics
+
+    frappe.only_for(["System Manager", "Assistant Admin"])
+
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = CONTENT_TYPE
+    response.headers["Cache-Control"] = "no-store"
+    response.data = render_metrics()
+    return response
+
+
+@frappe.whitelist(methods=["GET"])
+def metrics():
+    """Metrics for the current site in Prometheus text format."""
+    return _metrics_response()
+
+
+class MetricsRenderer:
+    """Page renderer exposing ``GET /metrics``."""
+
+    def __init__(self, path, http_status_code=200):
+        self.path = path
+        self.http_status_code = http_status_code
+
+    def can_render(self):
+        return self.path == "metrics" and frappe.request.method == "GET"
+
+    def render(self):
+        return _metrics_response()
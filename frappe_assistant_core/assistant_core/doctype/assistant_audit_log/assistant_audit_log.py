@@ -54,44 +54,24 @@ class AssistantAuditLog(Document):
 @frappe.whitelist()
 def get_audit_statistics():
     """Get audit statistics for dashboard"""
+    from frappe_assistant_core.utils.audit_rollup import get_audit_summary, get_most_used_tools
+
     today = frappe.utils.today()
+    summary = get_audit_summary(today)
 
     # Total actions today
-    total_today = frappe.db.count("Assistant Audit Log", filters={"creation": [">=", today]})
+    total_today = summary["total"]
 
     # Success rate today
-    successful_today = frappe.db.count(
-        "Assistant Audit Log", filters={"creation": [">=", today], "status": "Success"}
-    )
+    successful_today = summary["by_status"].get("Success", 0)
 
     success_rate = (successful_today / total_today * 100) if total_today > 0 else 0
 
     # Most used tools today
-    most_used_tools = frappe.db.sql(
-        """
-        SELECT tool_name, COUNT(*) as count
-        FROM `tabAssistant Audit Log`
-        WHERE DATE(creation) = %s AND tool_name IS NOT NULL
-        GROUP BY tool_name
-        ORDER BY count DESC
-        LIMIT 5
-    """,
-        (today,),
-        as_dict=True,
-    )
+    most_used_tools = get_most_used_tools(today, limit=5)
 
     # Average execution time
-    avg_execution_time = (
-        frappe.db.sql(
-            """
-        SELECT AVG(execution_time) as avg_time
-        FROM `tabAssistant Audit Log`
-        WHERE DATE(creation) = %s AND execution_time IS NOT NULL
-    """,
-            (today,),
-        )[0][0]
-        or 0
-    )
+    avg_execution_time = summary["avg_execution_time"]
 
     return {
         "total_actions_today": total_today,
@@ -101,6 +81,11 @@ def get_audit_statistics():
     }
 
 
+def on_doctype_update():
+    """Index creation so time-range scans (rollups, retention) avoid full table scans."""
+    frappe.db.add_index("Assistant Audit Log", ["creation"])
+
+
 def get_context(context):
     context.title = _("Assistant Audit Log")
     context.docs = get_audit_logs()
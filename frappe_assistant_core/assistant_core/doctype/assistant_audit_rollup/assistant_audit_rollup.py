@@ -0,0 +1,23 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Assistant Audit Rollup - hourly aggregates of Assistant Audit Log."""
+
+from frappe.model.document import Document
+
+
+class AssistantAuditRollup(Document):
+    """
+    One row per (hour, tool_name, user, status).
+
+    Rows are written in bulk by
+    ``frappe_assistant_core.utils.audit_rollup.rollup_audit_logs`` and are
+    never edited by hand.
+    """
+
+    pass
@@ -126,7 +126,7 @@ class AssistantCoreSettings(Document):
             # Get statistics
             discovered_plugins = plugin_manager.get_discovered_plugins()
             enabled_plugins = plugin_manager.get_enabled_plugins()
-            available_tools = plugin_manager.get_all_tools()
+            available_tools = dict(plugin_manager.get_all_tools())
 
             # Include external tools from hooks
             tool_registry = get_tool_registry()
@@ -193,7 +193,7 @@ class AssistantCoreSettings(Document):
             tool_registry = get_tool_registry()
             discovered_plugins = plugin_manager.get_discovered_plugins()
             enabled_plugins = plugin_manager.get_enabled_plugins()
-            available_tools = plugin_manager.get_all_tools()
+            available_tools = dict(plugin_manager.get_all_tools())
 
             # Include external tools from hooks (registered via assistant_tools)
             external_tools = tool_registry._get_external_tools()
@@ -0,0 +1,21 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Assistant Tool Profile - sampled stack profile of one tool call."""
+
+from frappe.model.document import Document
+
+
+class AssistantToolProfile(Document):
+    """
+    Written by ``frappe_assistant_core.utils.profiler`` when a tool call is
+    selected for profiling, and linked from the call's Assistant Audit Log
+    row.
+    """
+
+    pass
@@ -12,6 +12,8 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 
+from frappe_assistant_core.utils.cache import bump_cache_version
+
 
 class FACPluginConfiguration(Document):
     """
@@ -47,6 +49,18 @@ class FACPluginConfiguration(Document):
         cache.delete_keys("plugin_*")
         cache.delete_keys("tool_registry_*")
 
+        # Other workers reload on a new generation, so bump only once the row is
+        # committed: a bump before commit lets a worker cache the old rows under it
+        try:
+            frappe.db.after_commit.add(_bump_plugin_versions)
+        except AttributeError:
+            _bump_plugin_versions()
+
+        # Plugin lookups later in this request should see the change too
+        from frappe_assistant_core.utils.plugin_manager import clear_request_plugin_state
+
+        clear_request_plugin_state()
+
         # Clear document cache for this specific document
         frappe.clear_document_cache("FAC Plugin Configuration", self.plugin_name)
 
@@ -54,6 +68,11 @@ class FACPluginConfiguration(Document):
         frappe.clear_document_cache("Assistant Core Settings", "Assistant Core Settings")
 
 
+def _bump_plugin_versions():
+    bump_cache_version("tool_catalog")
+    bump_cache_version("plugin_state")
+
+
 @frappe.whitelist(methods=["GET"])
 def get_plugin_enabled_status(plugin_name: str) -> dict:
     """
@@ -79,4 +79,7 @@ class FACSkill(Document):
 
     def clear_skill_cache(self):
         """Clear skill-related caches."""
+        from frappe_assistant_core.api.handlers.resources import invalidate_skill_catalog
+
         frappe.cache.hdel("skills", frappe.local.site)
+        invalidate_skill_catalog()
@@ -12,6 +12,8 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 
+from frappe_assistant_core.utils.cache import bump_cache_version
+
 
 class FACToolConfiguration(Document):
     """
@@ -29,6 +31,7 @@ class FACToolConfiguration(Document):
         role_access: Child table of roles with access
         source_app: Source application providing the tool
         module_path: Python module path for the tool
+        category_source_hash: Hash of the tool's source file when auto_detected_category was set
     """
 
     def validate(self):
@@ -64,6 +67,11 @@ class FACToolConfiguration(Document):
         cache.delete_keys(f"fac_tool_config_{self.tool_name}")
         cache.delete_keys("fac_tool_configurations")
         cache.delete_keys("fac_tool_registry_*")
+        # After commit, so no worker caches the old rows under the new generation
+        try:
+            frappe.db.after_commit.add(lambda: bump_cache_version("tool_catalog"))
+        except AttributeError:
+            bump_cache_version("tool_catalog")
 
     def user_has_access(self, user: str = None) -> bool:
         """
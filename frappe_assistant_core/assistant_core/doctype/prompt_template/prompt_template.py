@@ -20,6 +20,8 @@ from frappe.model.document import Document
 from jinja2 import BaseLoader, TemplateSyntaxError
 from jinja2.sandbox import SandboxedEnvironment
 
+from frappe_assistant_core.utils.cache import bump_cache_version
+
 
 class PromptTemplate(Document):
     def validate(self):
@@ -167,6 +169,7 @@ class PromptTemplate(Document):
     def clear_prompt_cache(self):
         """Clear prompt-related caches."""
         frappe.cache.hdel("prompt_templates", frappe.local.site)
+        bump_cache_version("prompt_catalog")
 
     @frappe.whitelist()
     def create_version(self, notes: str = None) -> str:
@@ -18,6 +18,7 @@ frappe.pages['fac-admin'].on_page_load = function(wrapper) {
             openConfigPanels: {},
             promptsData: [],
             skillsData: [],
+            profilesData: [],
         },
     };
 
@@ -117,6 +118,9 @@ frappe.pages['fac-admin'].on_page_load = function(wrapper) {
                     <button class="fac-top-tab" data-tab="skills" role="tab" id="tab-skills" aria-selected="false" aria-controls="tab-panel-skills" tabindex="-1">
                         <i class="fa fa-graduation-cap" aria-hidden="true"></i> Skills
                     </button>
+                    <button class="fac-top-tab" data-tab="profiles" role="tab" id="tab-profiles" aria-selected="false" aria-controls="tab-panel-profiles" tabindex="-1">
+                        <i class="fa fa-tachometer" aria-hidden="true"></i> Profiles
+                    </button>
                 </div>
 
                 <!-- TOOLS TAB PANEL -->
@@ -222,6 +226,20 @@ frappe.pages['fac-admin'].on_page_load = function(wrapper) {
                     </div>
                 </div>
 
+                <!-- PROFILES TAB PANEL -->
+                <div class="fac-tab-panel" id="tab-panel-profiles" role="tabpanel" aria-labelledby="tab-profiles" tabindex="0">
+                    <div class="fac-card-header" style="margin-top: 0;">
+                        <div style="display: flex; gap: 8px; flex: 1; align-items: center;">
+                            <input type="text" class="fac-filter-input" id="profile-search"
+                                   placeholder="Filter by tool or user..." style="flex: 1; max-width: 300px;">
+                        </div>
+                        <button class="btn btn-sm btn-default" id="refresh-profiles" aria-label="Refresh profiles">
+                            <i class="fa fa-refresh" aria-hidden="true"></i> <span class="fac-btn-label">Refresh</span>
+                        </button>
+                    </div>
+                    <div id="profiles-list" style="max-height: 600px; overflow-y: auto;"></div>
+                </div>
+
             </div>
 
             <!-- Recent Activity -->
@@ -247,7 +265,8 @@ frappe.pages['fac-admin'].on_page_load = function(wrapper) {
         "/assets/frappe_assistant_core/js/fac_admin_utils.js",
         "/assets/frappe_assistant_core/js/fac_admin_tools.js",
         "/assets/frappe_assistant_core/js/fac_admin_prompts.js",
-        "/assets/frappe_assistant_core/js/fac_admin_skills.js"
+        "/assets/frappe_assistant_core/js/fac_admin_skills.js",
+        "/assets/frappe_assistant_core/js/fac_admin_profiles.js"
     ]).then(function() {
 
         // =====================================================================
@@ -351,6 +370,8 @@ frappe.pages['fac-admin'].on_page_load = function(wrapper) {
                 ns.loadPromptTemplatesView();
             } else if (tabName === 'skills' && ns.state.skillsData.length === 0) {
                 ns.loadSkillsView();
+            } else if (tabName === 'profiles' && ns.state.profilesData.length === 0) {
+                ns.loadProfilesView();
             }
         };
 
@@ -409,6 +430,13 @@ frappe.pages['fac-admin'].on_page_load = function(wrapper) {
 
         $('#refresh-skills').on('click', ns.loadSkillsView);
 
+        // Profiles filter handlers
+        $('#profile-search').on('input', frappe.utils.debounce(function() {
+            if (ns.state.activeTab === 'profiles') ns.renderProfilesList();
+        }, 300));
+
+        $('#refresh-profiles').on('click', ns.loadProfilesView);
+
         // =====================================================================
         // Initial data load
         // =====================================================================
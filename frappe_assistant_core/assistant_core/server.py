@@ -21,6 +21,8 @@ from typing import Optional
 import frappe
 from frappe import _
 
+from frappe_assistant_core.utils.settings import get_assistant_settings
+
 # Constants
 DEFAULT_PORT = 8000  # Frappe's default port fallback
 
@@ -75,7 +77,7 @@ class assistantServer:
     def enable(self):
         """Enable the assistant MCP API endpoints"""
         try:
-            settings = frappe.get_single("Assistant Core Settings")
+            settings = get_assistant_settings()
 
             if not settings.server_enabled:
                 return {"success": False, "message": "MCP API is disabled in settings"}
@@ -110,8 +112,7 @@ class assistantServer:
 
     def get_status(self):
         """Get server status"""
-        # Read directly from database to avoid cache issues
-        settings = frappe.get_single("Assistant Core Settings")
+        settings = get_assistant_settings()
 
         # Check if Assistant Core is enabled
         is_enabled = bool(settings.server_enabled)
@@ -168,31 +169,37 @@ def get_server_status():
 
 
 def cleanup_old_logs():
-    """Cleanup old audit log entries (scheduled task, runs daily).
+    """Cleanup old audit log entries (scheduled task, runs hourly).
 
     Retention period is configured in Assistant Core Settings > Security > Audit Log Retention.
     Defaults to 180 days. Set to 0 to disable automatic cleanup.
+
+    Rows are deleted in small committed batches within a per-run time budget
+    (see ``utils.audit_retention``); a backlog is finished by later runs.
+    Audit rollups and tool profiles follow the same retention period.
     """
-    try:
-        days_to_keep = frappe.db.get_single_value("Assistant Core Settings", "audit_log_retention_days")
-        if days_to_keep is None:
-            days_to_keep = 180
+    from frappe_assistant_core.utils.audit_retention import purge_audit_logs
+    from frappe_assistant_core.utils.audit_rollup import purge_audit_rollups
+    from frappe_assistant_core.utils.profiler import purge_tool_profiles
 
-        days_to_keep = int(days_to_keep)
+    try:
+        settings = get_assistant_settings()
+        days_to_keep = settings.audit_log_retention_days
         if days_to_keep <= 0:
             frappe.logger().info("Audit log cleanup disabled (retention set to 0)")
             return
 
-        frappe.db.sql(
-            """
-            DELETE FROM `tabAssistant Audit Log`
-            WHERE creation < DATE_SUB(NOW(), INTERVAL %s DAY)
-        """,
-            (days_to_keep,),
-        )
+        result = purge_audit_logs(days_to_keep, settings.audit_payload_retention_days)
+
+        if result["deleted"] or result["payloads_cleared"]:
+            frappe.logger().info(
+                f"Cleaned up assistant audit logs older than {days_to_keep} days: "
+                f"{result['deleted']} deleted, {result['payloads_cleared']} payloads cleared"
+                + ("" if result["complete"] else " (time budget reached, continuing next run)")
+            )
 
-        frappe.db.commit()
-        frappe.logger().info(f"Cleaned up assistant audit logs older than {days_to_keep} days")
+        purge_audit_rollups(days_to_keep)
+        purge_tool_profiles(days_to_keep)
 
     except Exception as e:
         frappe.log_error(f"Failed to cleanup assistant logs: {str(e)}")
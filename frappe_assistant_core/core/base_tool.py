@@ -18,6 +18,7 @@
 Base class for all MCP tools with configuration and dependency management.
 """
 
+import importlib.util
 import json
 import re
 import time
@@ -28,6 +29,9 @@ from typing import Any, Dict, List, Optional, Tuple
 import frappe
 from frappe import _
 
+from frappe_assistant_core.utils.profiler import pop_current_profile, profile_tool_call
+from frappe_assistant_core.utils.query_stats import QueryStats
+
 # Substrings that always indicate a credential. Matched case-insensitively
 # anywhere in the key name.
 _ALWAYS_SENSITIVE = (
@@ -77,6 +81,7 @@ class BaseTool(ABC):
         category: Tool category for organization
         source_app: App that provides this tool
         dependencies: List of required dependencies
+        optional_dependencies: Modules whose availability changes the description
         default_config: Default configuration values
     """
 
@@ -88,6 +93,7 @@ class BaseTool(ABC):
         self.category: str = "Custom"
         self.source_app: str = "frappe_assistant_core"
         self.dependencies: List[str] = []
+        self.optional_dependencies: List[str] = []
         self.default_config: Dict[str, Any] = {}
         self.logger = frappe.logger(self.__class__.__module__)
         self._config_cache: Optional[Dict[str, Any]] = None
@@ -181,6 +187,7 @@ class BaseTool(ABC):
             Execution result with success/error status
         """
         start_time = time.time()
+        query_stats = QueryStats()
 
         try:
             # Check dependencies
@@ -188,14 +195,16 @@ class BaseTool(ABC):
             if not deps_valid:
                 return {"success": False, "error": deps_error, "error_type": "DependencyError"}
 
-            # Check permissions
-            self.check_permission()
+            with query_stats:
+                # Check permissions
+                self.check_permission()
 
-            # Validate arguments
-            self.validate_arguments(arguments)
+                # Validate arguments
+                self.validate_arguments(arguments)
 
-            # Execute tool
-            result = self.execute(arguments)
+                # Execute tool (profiled when selected in Assistant Core Settings)
+                with profile_tool_call(self.name):
+                    result = self.execute(arguments)
 
             # Calculate execution time
             execution_time = time.time() - start_time
@@ -214,13 +223,17 @@ class BaseTool(ABC):
                     "error_type": "ToolReportedError",
                     "execution_time": execution_time,
                 }
-                self.log_execution(arguments, response, execution_time, status="Error")
+                self.log_execution(
+                    arguments, response, execution_time, status="Error", query_stats=query_stats
+                )
                 self.logger.info(
                     f"{self.name} reported failure in {execution_time:.3f}s: {response['error']}"
                 )
             else:
                 response = {"success": True, "result": result, "execution_time": execution_time}
-                self.log_execution(arguments, response, execution_time, status="Success")
+                self.log_execution(
+                    arguments, response, execution_time, status="Success", query_stats=query_stats
+                )
                 self.logger.info(f"Successfully executed {self.name} in {execution_time:.3f}s")
 
             return response
@@ -234,7 +247,9 @@ class BaseTool(ABC):
                 "execution_time": execution_time,
             }
 
-            self.log_execution(arguments, response, execution_time, status="Permission Denied")
+            self.log_execution(
+                arguments, response, execution_time, status="Permission Denied", query_stats=query_stats
+            )
 
             frappe.log_error(title=_("Permission Error"), message=f"{self.name}: {str(e)}")
 
@@ -249,7 +264,7 @@ class BaseTool(ABC):
                 "execution_time": execution_time,
             }
 
-            self.log_execution(arguments, response, execution_time, status="Error")
+            self.log_execution(arguments, response, execution_time, status="Error", query_stats=query_stats)
 
             frappe.log_error(title=_("Validation Error"), message=f"{self.name}: {str(e)}")
 
@@ -270,6 +285,7 @@ class BaseTool(ABC):
                 execution_time,
                 status="Timeout",
                 traceback_str=traceback.format_exc(),
+                query_stats=query_stats,
             )
 
             frappe.log_error(title=_("Tool Timeout"), message=f"{self.name}: {str(e)}")
@@ -292,6 +308,7 @@ class BaseTool(ABC):
                 execution_time,
                 status="Error",
                 traceback_str=tb,
+                query_stats=query_stats,
             )
 
             self.logger.error(f"Tool execution failed: {self.name} - {str(e)}", exc_info=True)
@@ -377,13 +394,8 @@ class BaseTool(ABC):
         if not self.dependencies:
             return True, None
 
-        missing_deps = []
-        for dep in self.dependencies:
-            try:
-                # Try to import the dependency
-                __import__(dep)
-            except ImportError:
-                missing_deps.append(dep)
+        # find_spec locates a package without importing it
+        missing_deps = [dep for dep in self.dependencies if importlib.util.find_spec(dep) is None]
 
         if missing_deps:
             return False, f"Missing dependencies: {', '.join(missing_deps)}"
@@ -401,6 +413,7 @@ class BaseTool(ABC):
         execution_time: float,
         status: str = "Success",
         traceback_str: Optional[str] = None,
+        query_stats: Optional[QueryStats] = None,
     ):
         """
         Log tool execution for audit purposes.
@@ -412,9 +425,19 @@ class BaseTool(ABC):
             status: Audit-log status value — one of "Success", "Error",
                 "Timeout", "Permission Denied". Must match the DocType Select.
             traceback_str: Full Python traceback on exception paths. None otherwise.
+            query_stats: SQL issued by the call. Recorded on the audit row and,
+                when ``fac_debug_query_stats`` is set in site config, added to
+                ``result`` under "query_stats".
         """
         try:
             from frappe_assistant_core.utils.audit_trail import log_tool_execution
+            from frappe_assistant_core.utils.metrics import observe
+
+            observe(
+                "fac_tool_call_duration_seconds",
+                execution_time,
+                {"tool": self.name, "status": status, "plugin": self.source_app or "unknown"},
+            )
 
             # Extract the actual tool result (not the wrapper) for audit logging
             if result.get("success") and "result" in result:
@@ -424,6 +447,16 @@ class BaseTool(ABC):
 
             sanitized_output = self._sanitize_data(actual_tool_output)
 
+            db_stats = query_stats.as_dict() if query_stats else None
+            if db_stats:
+                if db_stats["n_plus_one"]:
+                    self.logger.warning(
+                        f"{self.name} repeated a query {db_stats['n_plus_one'][0]['count']} times "
+                        f"(possible N+1): {db_stats['n_plus_one'][0]['query'][:200]}"
+                    )
+                if frappe.conf.get("fac_debug_query_stats"):
+                    result["query_stats"] = db_stats
+
             log_tool_execution(
                 tool_name=self.name,
                 user=frappe.session.user,
@@ -435,6 +468,8 @@ class BaseTool(ABC):
                 error_type=result.get("error_type"),
                 traceback_str=traceback_str,
                 output_data=sanitized_output,
+                profile=pop_current_profile(),
+                query_stats=db_stats,
             )
         except Exception as e:
             # Don't fail tool execution due to logging issues
@@ -235,7 +235,7 @@ class ToolRegistry:
         plugin_manager = get_plugin_manager()
 
         # Step 1: Get tools from enabled plugins
-        tools = plugin_manager.get_all_tools()
+        tools = dict(plugin_manager.get_all_tools())
 
         # Add external tools from hooks
         external_tools = self._get_external_tools()
@@ -138,6 +138,23 @@ permission_query_conditions = {
 doc_events = {
     "Assistant Core Settings": {"on_update": "frappe_assistant_core.utils.cache.invalidate_settings_cache"},
     "Assistant Audit Log": {"after_insert": "frappe_assistant_core.utils.cache.invalidate_dashboard_cache"},
+    "User": {
+        "on_update": "frappe_assistant_core.utils.auth.invalidate_auth_cache",
+        "on_trash": "frappe_assistant_core.utils.auth.invalidate_auth_cache",
+    },
+    "OAuth Bearer Token": {
+        "on_update": "frappe_assistant_core.utils.auth.invalidate_auth_cache",
+        "on_trash": "frappe_assistant_core.utils.auth.invalidate_auth_cache",
+    },
+    # DocPerm rows are saved with their DocType
+    "DocType": {
+        "on_update": "frappe_assistant_core.utils.cache.invalidate_search_doctypes_cache",
+        "on_trash": "frappe_assistant_core.utils.cache.invalidate_search_doctypes_cache",
+    },
+    "Custom DocPerm": {
+        "on_update": "frappe_assistant_core.utils.cache.invalidate_search_doctypes_cache",
+        "on_trash": "frappe_assistant_core.utils.cache.invalidate_search_doctypes_cache",
+    },
 }
 
 # Scheduled Tasks
@@ -145,8 +162,10 @@ doc_events = {
 
 scheduler_events = {
     "cron": {
-        "0 0 * * *": ["frappe_assistant_core.assistant_core.server.cleanup_old_logs"],
+        "15 * * * *": ["frappe_assistant_core.assistant_core.server.cleanup_old_logs"],
+        "5 * * * *": ["frappe_assistant_core.utils.audit_rollup.rollup_audit_logs"],
         "*/30 * * * *": ["frappe_assistant_core.utils.cache.warm_cache"],
+        "*/5 * * * *": ["frappe_assistant_core.api.handlers.resources.flush_skill_usage"],
     },
     # Hourly tasks removed - no longer needed after Assistant Connection Log removal
 }
@@ -171,7 +190,10 @@ override_whitelisted_methods = {
 # ----------------------
 
 # Handle .well-known OAuth endpoints with custom renderer
-page_renderer = ["frappe_assistant_core.api.oauth_wellknown_renderer.WellKnownRenderer"]
+page_renderer = [
+    "frappe_assistant_core.api.oauth_wellknown_renderer.WellKnownRenderer",
+    "frappe_assistant_core.api.metrics.MetricsRenderer",
+]
 
 #
 # each overriding function accepts a `data` argument;
@@ -230,6 +252,9 @@ page_renderer = ["frappe_assistant_core.api.oauth_wellknown_renderer.WellKnownRe
 # "Allowed Public Client Origins" setting - works immediately without restart
 before_request = ["frappe_assistant_core.api.oauth_cors.set_cors_for_oauth_endpoints"]
 
+# Push this worker's buffered metrics to Redis (no-op within the flush interval)
+after_request = ["frappe_assistant_core.utils.metrics.flush_if_due"]
+
 # Automatically update python controller files with type annotations for DocTypes
 # Use Developer Mode in Bench set up to auto append type annotation
 # export_python_type_annotations = True
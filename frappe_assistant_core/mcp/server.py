@@ -29,13 +29,57 @@ Key improvements over frappe-mcp:
 - Frappe-native integration
 """
 
+import contextvars
+import gzip
+import hashlib
 import json
+import queue
+import threading
 import traceback
+import zlib
 from collections import OrderedDict
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 from werkzeug.wrappers import Request, Response
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Upper bound for gzip-encoded request bodies once decompressed.
+_MAX_DECOMPRESSED_REQUEST_BYTES = 50 * 1024 * 1024
+
+# Responses smaller than this are sent uncompressed.
+_COMPRESS_MIN_BYTES = 1024
+
+# Serialized tools/prompts/resources list results kept per worker.
+_LIST_CACHE_SIZE = 256
+
+# Idle seconds between SSE comment lines on a streamed tools/call, so
+# proxies do not close a quiet connection.
+_SSE_KEEPALIVE_SECONDS = 15
+
+# Methods reported individually in request metrics.
+_KNOWN_METHODS = frozenset(
+    {
+        "initialize",
+        "ping",
+        "tools/list",
+        "tools/call",
+        "resources/list",
+        "resources/read",
+        "resources/templates/list",
+        "prompts/list",
+        "prompts/get",
+    }
+)
+
+
+def _sse_event(message: Dict) -> str:
+    """One SSE ``message`` event carrying a JSON-RPC message."""
+    return f"event: message\ndata: {json.dumps(message, default=str)}\n\n"
+
 
 class MCPServer:
     """
@@ -73,6 +117,9 @@ class MCPServer:
         self.name = name
         self._tool_registry = OrderedDict()
         self._entry_fn = None
+        # (site, method, cache key) -> (serialized result, list hash)
+        self._list_cache = OrderedDict()
+        self._list_cache_lock = threading.Lock()
 
     def register(
         self,
@@ -173,7 +220,7 @@ class MCPServer:
 
         # Parse JSON request
         try:
-            data = request.get_json(force=True)
+            data = self._parse_request_body(request)
             # Log incoming request for debugging
             frappe.logger().debug(f"MCP Request: method={data.get('method')}, id={data.get('id')}")
         except Exception as e:
@@ -204,6 +251,7 @@ class MCPServer:
         # Route method
         method = data.get("method")
         params = data.get("params", {})
+        self._count_request(method)
 
         result = None
 
@@ -211,20 +259,44 @@ class MCPServer:
             if method == "initialize":
                 result = self._handle_initialize(params)
             elif method == "tools/list":
-                result = self._handle_tools_list(params, tool_registry)
+                skill_mode = self._get_skill_mode()
+                return self._list_response(
+                    request,
+                    response,
+                    request_id,
+                    self._tools_list_cache_key(tool_registry, skill_mode),
+                    lambda: self._handle_tools_list(params, tool_registry, skill_mode),
+                )
             elif method == "tools/call":
                 frappe.logger().info(
                     f"MCP tools/call: tool={params.get('name')}, args={json.dumps(params.get('arguments', {}), default=str)[:200]}"
                 )
+                progress_token = (params.get("_meta") or {}).get("progressToken")
+                if progress_token is not None and self._accepts_event_stream(request):
+                    return self._stream_tools_call(
+                        response, request_id, params, tool_registry, progress_token
+                    )
                 result = self._handle_tools_call(params, tool_registry)
             elif method == "resources/list":
-                result = self._handle_resources_list(params, request_id)
+                return self._list_response(
+                    request,
+                    response,
+                    request_id,
+                    self._user_list_cache_key(method, "skill_catalog"),
+                    lambda: self._handle_resources_list(params, request_id),
+                )
             elif method == "resources/read":
                 result = self._handle_resources_read(params, request_id)
             elif method == "resources/templates/list":
                 result = {"resourceTemplates": []}
             elif method == "prompts/list":
-                result = self._handle_prompts_list(params, request_id)
+                return self._list_response(
+                    request,
+                    response,
+                    request_id,
+                    self._user_list_cache_key(method, "prompt_catalog"),
+                    lambda: self._handle_prompts_list(params, request_id),
+                )
             elif method == "prompts/get":
                 result = self._handle_prompts_get(params, request_id)
             elif method == "ping":
@@ -242,6 +314,29 @@ class MCPServer:
         # Success response
         return self._success_response(response, request_id, result)
 
+    def _count_request(self, method: Any):
+        """Count a request by method; unknown names share one label to bound cardinality."""
+        from frappe_assistant_core.utils.metrics import inc
+
+        inc("fac_mcp_requests_total", {"method": method if method in _KNOWN_METHODS else "other"})
+
+    def _parse_request_body(self, request: Request) -> Dict:
+        """
+        Decode the JSON-RPC body, accepting gzip-encoded requests.
+
+        Clients such as the stdio bridge may gzip large request bodies. The
+        decompressed size is capped so a small payload cannot expand without
+        bound.
+        """
+        if request.headers.get("Content-Encoding", "").lower() != "gzip":
+            return request.get_json(force=True)
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        raw = decompressor.decompress(request.get_data(), _MAX_DECOMPRESSED_REQUEST_BYTES)
+        if decompressor.unconsumed_tail:
+            raise ValueError("Decompressed request body exceeds size limit")
+        return json.loads(raw)
+
     def add_tool(self, tool_dict: Dict):
         """
         Programmatically add a tool.
@@ -293,13 +388,12 @@ class MCPServer:
         Declares server capabilities according to MCP 2025-06-18 spec.
         We only support tools (not prompts, resources, or sampling).
         """
-        import frappe
+        from frappe_assistant_core.utils.settings import get_assistant_settings
 
         # Get protocol version from settings
         protocol_version = "2025-06-18"  # Default
         try:
-            settings = frappe.get_single("Assistant Core Settings")
-            protocol_version = settings.mcp_protocol_version or protocol_version
+            protocol_version = get_assistant_settings().mcp_protocol_version
         except Exception:
             pass
 
@@ -313,25 +407,35 @@ class MCPServer:
             "serverInfo": {"name": self.name, "version": "2.0.0"},
         }
 
-    def _handle_tools_list(self, params: Dict, tool_registry: Optional[Dict] = None) -> Dict:
-        """Handle tools/list request with optional token optimization."""
-        import frappe
+    def _get_skill_mode(self) -> str:
+        """Return the configured skill_mode ("supplementary" or "replace")."""
+        from frappe_assistant_core.utils.settings import get_assistant_settings
+
+        try:
+            return get_assistant_settings().skill_mode
+        except Exception:
+            return "supplementary"
 
+    def _handle_tools_list(
+        self, params: Dict, tool_registry: Optional[Dict] = None, skill_mode: Optional[str] = None
+    ) -> Dict:
+        """Handle tools/list request with optional token optimization."""
         if tool_registry is None:
             tool_registry = self._tool_registry
+        if skill_mode is None:
+            skill_mode = self._get_skill_mode()
 
         tools_list = []
 
         # Check skill_mode for token optimization
         skill_replace_map = {}
-        try:
-            settings = frappe.get_single("Assistant Core Settings")
-            if getattr(settings, "skill_mode", "supplementary") == "replace":
+        if skill_mode == "replace":
+            try:
                 from frappe_assistant_core.api.handlers.resources import get_skill_manager
 
                 skill_replace_map = get_skill_manager().get_tool_skill_map()
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         for tool in tool_registry.values():
             description = tool["description"]
@@ -440,22 +544,269 @@ class MCPServer:
 
             return {"content": [{"type": "text", "text": error_text}], "isError": True}
 
-    def _success_response(self, response: Response, request_id: Any, result: Dict) -> Response:
-        """Create JSON-RPC success response."""
+    def _accepts_event_stream(self, request: Request) -> bool:
+        return "text/event-stream" in (request.headers.get("Accept") or "")
+
+    def _stream_tools_call(
+        self, response: Response, request_id: Any, params: Dict, tool_registry: Dict, progress_token: Any
+    ) -> Response:
+        """
+        Answer a tools/call as a ``text/event-stream`` (StreamableHTTP).
+
+        Used when the client accepts SSE and sent ``_meta.progressToken``.
+        ProgressTracker updates made by the tool (``update_progress``) are
+        sent as ``notifications/progress`` events for that token, comment
+        lines keep an idle connection open, and the JSON-RPC result is the
+        last event.
+        """
+        # Captured now: Frappe releases frappe.local before the body is iterated
+        context = contextvars.copy_context()
+        response.response = self._tools_call_events(
+            context, request_id, params, tool_registry, progress_token
+        )
+        response.mimetype = "text/event-stream"
+        response.status_code = 200
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        self._echo_protocol_version(response)
+        return response
+
+    def _tools_call_events(
+        self,
+        context: contextvars.Context,
+        request_id: Any,
+        params: Dict,
+        tool_registry: Dict,
+        progress_token: Any,
+    ) -> Iterator[str]:
+        """
+        Run the tool on a helper thread and yield its events.
+
+        The body is iterated after Frappe has finished the request, so the
+        tool starts here rather than in ``handle``. The thread runs in the
+        request's captured context, so it sees the same frappe.local (user,
+        site, database handle, reconnected on first query) while this
+        thread only waits on the queue; it commits or rolls back its own work.
+        """
+        events: queue.Queue = queue.Queue()
+        worker = threading.Thread(
+            target=context.run,
+            args=(self._run_streamed_tool, events, params, tool_registry),
+            name="fac-mcp-stream",
+            daemon=True,
+        )
+        worker.start()
+
+        last_progress = -1
+        while True:
+            try:
+                kind, payload = events.get(timeout=_SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+
+            if kind == "result":
+                yield _sse_event({"jsonrpc": "2.0", "id": request_id, "result": payload})
+                return
+
+            # notifications/progress must carry increasing progress values
+            progress = payload.progress_percent or 0
+            if progress <= last_progress:
+                continue
+            last_progress = progress
+            notification = {
+                "progressToken": progress_token,
+                "progress": progress,
+                "total": 100,
+            }
+            if payload.message:
+                notification["message"] = payload.message
+            yield _sse_event({"jsonrpc": "2.0", "method": "notifications/progress", "params": notification})
+
+    def _run_streamed_tool(self, events: queue.Queue, params: Dict, tool_registry: Dict):
+        """Body of the streaming helper thread: run the call with a ProgressTracker attached."""
         import frappe
 
-        response_data = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        from frappe_assistant_core.utils.progress_streaming import ProgressStatus, get_progress_service
 
-        # Use default=str here too for consistency
-        response.data = json.dumps(response_data, default=str)
+        service = get_progress_service()
+        operation_id = frappe.generate_hash(length=10)
+        tracker = service.create_tracker(
+            operation_id, frappe.session.user, f"tools/call {params.get('name')}"
+        )
+        tracker.add_callback(lambda update: events.put(("progress", update)))
+        threading.current_thread().progress_tracker = tracker
+
+        result = None
+        try:
+            result = self._handle_tools_call(params, tool_registry)
+            if result.get("isError"):
+                frappe.db.rollback()
+            else:
+                frappe.db.commit()
+        except Exception as e:
+            frappe.db.rollback()
+            result = {"content": [{"type": "text", "text": f"Internal error: {e}"}], "isError": True}
+        finally:
+            # A final status, so the operation is not listed as running (or
+            # cancellable) for the rest of the stream's TTL
+            try:
+                if result is None or result.get("isError"):
+                    content = (result or {}).get("content") or [{}]
+                    if not tracker.is_cancelled():
+                        tracker.update_progress(
+                            ProgressStatus.FAILED, message="Tool call failed", error=content[0].get("text")
+                        )
+                else:
+                    tracker.update_progress(
+                        ProgressStatus.COMPLETED, progress_percent=100, message="Tool call completed"
+                    )
+            except Exception as e:
+                frappe.logger().warning(f"Failed to record the end of operation {operation_id}: {e}")
+            service.remove_tracker(operation_id)
+            events.put(("result", result))
+            frappe.db.close()
+
+    def _tools_list_cache_key(self, tool_registry: Dict, skill_mode: str) -> Tuple:
+        """
+        Cache key for a tools/list result.
+
+        The registry was already filtered for this user, so its tool names plus
+        the role-set and skill_mode identify the catalog. Tool/plugin
+        configuration and skill changes bump the generations included here.
+        """
+        import frappe
+
+        from frappe_assistant_core.utils.cache import get_cache_version
+
+        return (
+            "tools/list",
+            tuple(sorted(frappe.get_roles())),
+            skill_mode,
+            get_cache_version("tool_catalog"),
+            get_cache_version("skill_catalog") if skill_mode == "replace" else 0,
+            tuple(tool_registry.keys()),
+        )
+
+    def _user_list_cache_key(self, method: str, version_name: str) -> Tuple:
+        """Cache key for per-user lists (owners see their own drafts)."""
+        import frappe
+
+        from frappe_assistant_core.utils.cache import get_cache_version
+
+        return (
+            method,
+            frappe.session.user,
+            tuple(sorted(frappe.get_roles())),
+            get_cache_version(version_name),
+        )
+
+    def _list_response(
+        self,
+        request: Request,
+        response: Response,
+        request_id: Any,
+        cache_key: Tuple,
+        build: Callable[[], Dict],
+    ) -> Response:
+        """
+        Serve a list result from the per-worker serialized cache.
+
+        The result carries ``_meta["fac/listHash"]`` (also sent as an ETag), so
+        a client that presents the hash via ``If-None-Match`` gets a 304 and
+        keeps its copy of the unchanged catalog.
+        """
+        import frappe
+
+        from frappe_assistant_core.utils.metrics import record_cache_lookup
+
+        key = (frappe.local.site, *cache_key)
+        with self._list_cache_lock:
+            entry = self._list_cache.get(key)
+            if entry is not None:
+                self._list_cache.move_to_end(key)
+        record_cache_lookup("mcp_list", entry is not None)
+
+        if entry is None:
+            result = build()
+            canonical = json.dumps(result, default=str, sort_keys=True)
+            list_hash = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+            result["_meta"] = {**(result.get("_meta") or {}), "fac/listHash": list_hash}
+            entry = (json.dumps(result, default=str), list_hash)
+            with self._list_cache_lock:
+                self._list_cache[key] = entry
+                while len(self._list_cache) > _LIST_CACHE_SIZE:
+                    self._list_cache.popitem(last=False)
+
+        blob, list_hash = entry
+        etag = f'"{list_hash}"'
+        response.headers["ETag"] = etag
+
+        if etag in (request.headers.get("If-None-Match") or ""):
+            response.status_code = 304
+            self._echo_protocol_version(response)
+            return response
+
+        body = f'{{"jsonrpc": "2.0", "id": {json.dumps(request_id, default=str)}, "result": {blob}}}'
+        self._set_body(response, body)
         response.mimetype = "application/json"
         response.status_code = 200
+        self._echo_protocol_version(response)
+        return response
+
+    def _set_body(self, response: Response, body: str):
+        """Set the response body, compressed when the client accepts br/gzip."""
+        import frappe
+
+        data = body.encode("utf-8")
+        response.headers["Vary"] = "Accept-Encoding"
+        if len(data) < _COMPRESS_MIN_BYTES:
+            response.data = data
+            return
+
+        encoding = self._negotiate_encoding(frappe.request.headers.get("Accept-Encoding") or "")
+        if encoding == "br":
+            data = brotli.compress(data, quality=4)
+        elif encoding == "gzip":
+            data = gzip.compress(data, compresslevel=5)
+
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.data = data
+
+    def _negotiate_encoding(self, accept_encoding: str) -> Optional[str]:
+        """Pick br (when brotli is installed) or gzip from an Accept-Encoding header."""
+        accepted = set()
+        for part in accept_encoding.split(","):
+            coding, _, q = part.strip().partition(";")
+            if q.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                continue
+            accepted.add(coding.strip().lower())
+
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted or "*" in accepted:
+            return "gzip"
+        return None
+
+    def _echo_protocol_version(self, response: Response):
+        """Echo MCP-Protocol-Version header if present (2025-06-18 spec)."""
+        import frappe
 
-        # Echo MCP-Protocol-Version header if present (2025-06-18 spec)
         incoming_version = frappe.request.headers.get("mcp-protocol-version")
         if incoming_version:
             response.headers["mcp-protocol-version"] = incoming_version
 
+    def _success_response(self, response: Response, request_id: Any, result: Dict) -> Response:
+        """Create JSON-RPC success response."""
+        response_data = {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+        # Use default=str here too for consistency
+        self._set_body(response, json.dumps(response_data, default=str))
+        response.mimetype = "application/json"
+        response.status_code = 200
+        self._echo_protocol_version(response)
+
         return response
 
     def _error_response(
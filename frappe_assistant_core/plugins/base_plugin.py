@@ -19,6 +19,7 @@ Base class for all plugins in Frappe Assistant Core.
 Provides interface for plugin discovery, validation, and lifecycle management.
 """
 
+import importlib.util
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -162,13 +163,7 @@ class BasePlugin(ABC):
         Returns:
             Tuple of (all_installed, missing_packages)
         """
-        missing = []
-
-        for dep in dependencies:
-            try:
-                __import__(dep)
-            except ImportError:
-                missing.append(dep)
+        missing = [dep for dep in dependencies if importlib.util.find_spec(dep) is None]
 
         if missing:
             return False, _("Missing dependencies: {0}").format(", ".join(missing))
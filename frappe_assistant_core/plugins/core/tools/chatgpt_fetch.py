@@ -28,12 +28,18 @@ ChatGPT Requirements:
 """
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import frappe
 from frappe import _
 
 from frappe_assistant_core.core.base_tool import BaseTool
+from frappe_assistant_core.plugins.core.tools.document_projection import (
+    PROJECTION_SCHEMA,
+    filter_projected_document,
+    get_projected_document,
+    projection_args,
+)
 
 
 class ChatGPTFetch(BaseTool):
@@ -57,7 +63,8 @@ class ChatGPTFetch(BaseTool):
                 "id": {
                     "type": "string",
                     "description": "Document ID from search results (format: 'doctype/name', e.g., 'Customer/CUST-00001')",
-                }
+                },
+                **PROJECTION_SCHEMA,
             },
             "required": ["id"],
         }
@@ -67,20 +74,19 @@ class ChatGPTFetch(BaseTool):
         Retrieve document and format for ChatGPT.
 
         Args:
-            arguments: Dict with "id" key (format: "doctype/name")
+            arguments: Dict with "id" key (format: "doctype/name") and optional
+                projection arguments (fields, child_tables, child_fields,
+                child_row_limit, child_cursors)
 
         Returns:
             Dict with:
             - id: Document identifier
             - title: Document title
-            - text: Full document content as JSON string
+            - text: Document content as JSON string
             - url: URL for citation
             - metadata: Additional document metadata
         """
-        from frappe_assistant_core.core.security_config import (
-            filter_sensitive_fields,
-            validate_document_access,
-        )
+        from frappe_assistant_core.core.security_config import validate_document_access
 
         try:
             doc_id = arguments.get("id", "").strip()
@@ -106,14 +112,17 @@ class ChatGPTFetch(BaseTool):
                 )
 
             user_role = validation_result["role"]
-            doc = frappe.get_doc(doctype, name)
-            doc_dict = filter_sensitive_fields(doc.as_dict(), doctype, user_role)
+            projected = get_projected_document(doctype, name, **projection_args(arguments))
+            if projected is None:
+                raise frappe.DoesNotExistError
+            doc_dict, child_pages = projected
+            doc_dict = filter_projected_document(doc_dict, child_pages, user_role)
 
             # Create title from name field or document name
             title = doc_dict.get("title") or doc_dict.get("name") or name
 
             # Convert document to formatted text
-            text_content = self._format_document_as_text(doc_dict, doctype, name)
+            text_content = self._format_document_as_text(doc_dict, doctype, name, child_pages)
 
             # Generate URL for citation
             site_url = frappe.utils.get_url()
@@ -125,6 +134,7 @@ class ChatGPTFetch(BaseTool):
                 "modified": str(doc_dict.get("modified", "")),
                 "owner": doc_dict.get("owner", ""),
                 "docstatus": doc_dict.get("docstatus", 0),
+                "child_tables": child_pages,
             }
 
             return {"id": doc_id, "title": title, "text": text_content, "url": url, "metadata": metadata}
@@ -139,12 +149,18 @@ class ChatGPTFetch(BaseTool):
             frappe.log_error(title=_("ChatGPT Fetch Permission Error"), message=error_msg)
             raise ValueError(error_msg) from e
 
+        except frappe.ValidationError as e:
+            # Unknown fields, child tables or cursors in the projection arguments
+            raise ValueError(str(e)) from None
+
         except ValueError:
             # Input validation errors raised above ("Document ID is required",
             # "Invalid document ID format", ...) — surface as-is.
             raise
 
-    def _format_document_as_text(self, doc_dict: Dict, doctype: str, name: str) -> str:
+    def _format_document_as_text(
+        self, doc_dict: Dict, doctype: str, name: str, child_pages: Optional[Dict] = None
+    ) -> str:
         """
         Format document data as readable text for ChatGPT.
 
@@ -152,6 +168,7 @@ class ChatGPTFetch(BaseTool):
             doc_dict: Document dictionary
             doctype: DocType name
             name: Document name
+            child_pages: Paging state per child table, from get_projected_document
 
         Returns:
             Formatted text representation
@@ -166,6 +183,13 @@ class ChatGPTFetch(BaseTool):
                 label = field.replace("_", " ").title()
                 lines.append(f"**{label}**: {doc_dict[field]}")
 
+        for table, page in (child_pages or {}).items():
+            if page["has_more"]:
+                lines.append(
+                    f"_{table}: {page['returned']} rows shown; "
+                    f'pass child_cursors={{"{table}": "{page["next_cursor"]}"}} for more_'
+                )
+
         lines.append("")
         lines.append("## All Fields")
         lines.append("")
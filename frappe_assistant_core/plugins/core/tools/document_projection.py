@@ -0,0 +1,189 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Field-projected document reads for get_document and fetch.
+
+Instead of ``frappe.get_doc(...).as_dict()``, which loads every row of every
+child table, the header is read with one ``frappe.db.get_value`` for the
+requested columns and each requested child table with one ``frappe.get_all``
+for the requested columns, limited to a page of rows.
+
+Child rows are paged by ``idx``: a table's ``next_cursor`` is the ``idx`` of
+its last returned row, and passing it back returns the rows after it.
+Callers must have checked read permission on the parent document; child rows
+are not permission-checked separately (as with ``as_dict``).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import frappe
+from frappe.model import child_table_fields
+
+DEFAULT_CHILD_ROW_LIMIT = 100
+MAX_CHILD_ROW_LIMIT = 1000
+
+PROJECTION_SCHEMA = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Header fields to return (default: all). 'name' is always included.",
+    },
+    "child_tables": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Child table fieldnames to include (default: all, [] for none), e.g. ['items'].",
+    },
+    "child_fields": {
+        "type": "object",
+        "description": "Columns to return per child table (default: all), e.g. {'items': ['item_code', 'qty']}.",
+    },
+    "child_row_limit": {
+        "type": "integer",
+        "description": f"Maximum rows returned per child table (default {DEFAULT_CHILD_ROW_LIMIT}, max {MAX_CHILD_ROW_LIMIT}).",
+    },
+    "child_cursors": {
+        "type": "object",
+        "description": "next_cursor values from a previous call, per child table, to fetch the following rows.",
+    },
+}
+
+
+def projection_args(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """The projection keyword arguments of ``get_projected_document`` from tool arguments."""
+    return {
+        "fields": arguments.get("fields"),
+        "child_tables": arguments.get("child_tables"),
+        "child_fields": arguments.get("child_fields"),
+        "child_row_limit": arguments.get("child_row_limit"),
+        "child_cursors": arguments.get("child_cursors"),
+    }
+
+
+def _check_columns(doctype: str, requested: List[str], valid: List[str]) -> List[str]:
+    unknown = [f for f in requested if f not in valid]
+    if unknown:
+        raise frappe.ValidationError(f"Unknown field(s) for {doctype}: {', '.join(unknown)}")
+    return list(dict.fromkeys(requested))
+
+
+def _child_row_limit(value) -> int:
+    if value is None:
+        return DEFAULT_CHILD_ROW_LIMIT
+    try:
+        return max(1, min(int(value), MAX_CHILD_ROW_LIMIT))
+    except (TypeError, ValueError):
+        return DEFAULT_CHILD_ROW_LIMIT
+
+
+def get_projected_document(
+    doctype: str,
+    name: str,
+    fields: Optional[List[str]] = None,
+    child_tables: Optional[List[str]] = None,
+    child_fields: Optional[Dict[str, List[str]]] = None,
+    child_row_limit: Optional[int] = None,
+    child_cursors: Optional[Dict[str, Any]] = None,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]]:
+    """
+    Read ``doctype``/``name`` with only the requested header fields and child rows.
+
+    Returns ``(doc, pages)`` where ``doc`` is shaped like ``as_dict()`` (child
+    tables as lists under their fieldname) and ``pages`` maps each included
+    child table to ``{"returned", "has_more", "next_cursor"}``. Returns None
+    when the document does not exist. Raises ``frappe.ValidationError`` for
+    unknown fields or child tables.
+    """
+    meta = frappe.get_meta(doctype)
+    header_columns = meta.get_valid_columns()
+    columns = _check_columns(doctype, fields, header_columns) if fields else list(header_columns)
+    if not meta.issingle and "name" not in columns:
+        columns.insert(0, "name")
+
+    doc = frappe.db.get_value(doctype, name, columns, as_dict=True)
+    if doc is None or (not doc and not meta.issingle):
+        return None
+    doc = dict(doc)
+    doc.setdefault("name", name)
+    doc["doctype"] = doctype
+
+    tables = {df.fieldname: df.options for df in meta.get_table_fields()}
+    if child_tables is None:
+        selected = list(tables)
+    else:
+        unknown = [t for t in child_tables if t not in tables]
+        if unknown:
+            raise frappe.ValidationError(f"Unknown child table(s) for {doctype}: {', '.join(unknown)}")
+        selected = list(dict.fromkeys(child_tables))
+
+    limit = _child_row_limit(child_row_limit)
+    child_fields = child_fields or {}
+    child_cursors = child_cursors or {}
+    pages = {}
+    for fieldname in selected:
+        doc[fieldname], pages[fieldname] = _read_child_rows(
+            doctype,
+            doc["name"],
+            fieldname,
+            tables[fieldname],
+            child_fields.get(fieldname),
+            limit,
+            child_cursors.get(fieldname),
+        )
+    return doc, pages
+
+
+def _read_child_rows(parenttype, parent, parentfield, child_doctype, fields, limit, cursor):
+    valid = frappe.get_meta(child_doctype).get_valid_columns()
+    if fields:
+        columns = _check_columns(child_doctype, fields, valid)
+        # idx drives the cursor; name identifies the row
+        columns += [c for c in ("name", "idx") if c not in columns]
+    else:
+        columns = [c for c in valid if c not in child_table_fields] + ["idx"]
+        columns = list(dict.fromkeys(columns))
+
+    filters = {"parent": parent, "parenttype": parenttype, "parentfield": parentfield}
+    if cursor not in (None, ""):
+        try:
+            filters["idx"] = [">", int(cursor)]
+        except (TypeError, ValueError):
+            raise frappe.ValidationError(f"Invalid cursor for {parentfield}: {cursor}") from None
+
+    # One extra row tells whether another page exists without a COUNT query
+    rows = frappe.get_all(
+        child_doctype, filters=filters, fields=columns, order_by="idx asc", limit_page_length=limit + 1
+    )
+    has_more = len(rows) > limit
+    rows = [dict(row, doctype=child_doctype) for row in rows[:limit]]
+    return rows, {
+        "returned": len(rows),
+        "has_more": has_more,
+        "next_cursor": str(rows[-1]["idx"]) if has_more else None,
+    }
+
+
+def filter_projected_document(doc: Dict[str, Any], pages: Dict[str, Any], user_role: str) -> Dict[str, Any]:
+    """``filter_sensitive_fields`` applied to the header and to each returned child row."""
+    from frappe_assistant_core.core.security_config import filter_sensitive_fields
+
+    filtered = filter_sensitive_fields(doc, doc["doctype"], user_role)
+    for fieldname in pages:
+        if isinstance(filtered.get(fieldname), list):
+            filtered[fieldname] = [
+                filter_sensitive_fields(row, row["doctype"], user_role) for row in filtered[fieldname]
+            ]
+    return filtered
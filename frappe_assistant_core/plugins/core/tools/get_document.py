@@ -25,6 +25,12 @@ import frappe
 from frappe import _
 
 from frappe_assistant_core.core.base_tool import BaseTool
+from frappe_assistant_core.plugins.core.tools.document_projection import (
+    PROJECTION_SCHEMA,
+    filter_projected_document,
+    get_projected_document,
+    projection_args,
+)
 
 
 class DocumentGet(BaseTool):
@@ -32,7 +38,8 @@ class DocumentGet(BaseTool):
     Tool for retrieving Frappe documents.
 
     Provides capabilities for:
-    - Fetching complete document data
+    - Fetching document data, optionally limited to selected fields
+    - Paging through large child tables
     - Checking permissions
     - Handling non-existent documents
     """
@@ -40,7 +47,7 @@ class DocumentGet(BaseTool):
     def __init__(self):
         super().__init__()
         self.name = "get_document"
-        self.description = "Retrieve detailed information about a specific Frappe document. Use when users ask for details about a particular record they know the name/ID of."
+        self.description = "Retrieve detailed information about a specific Frappe document. Use when users ask for details about a particular record they know the name/ID of. Pass 'fields' and 'child_tables' to fetch only what you need; child tables are paged, use the returned child_tables.<table>.next_cursor in 'child_cursors' for more rows."
         self.requires_permission = None  # Permission checked dynamically per DocType
 
         self.inputSchema = {
@@ -54,6 +61,7 @@ class DocumentGet(BaseTool):
                     "type": "string",
                     "description": "The document name/ID (e.g., 'CUST-00001', 'SINV-00001'). This is the unique identifier for the document.",
                 },
+                **PROJECTION_SCHEMA,
             },
             "required": ["doctype", "name"],
         }
@@ -73,10 +81,7 @@ class DocumentGet(BaseTool):
             }
 
         # Import security validation
-        from frappe_assistant_core.core.security_config import (
-            filter_sensitive_fields,
-            validate_document_access,
-        )
+        from frappe_assistant_core.core.security_config import validate_document_access
 
         # Validate document access with comprehensive permission checking
         validation_result = validate_document_access(
@@ -89,31 +94,31 @@ class DocumentGet(BaseTool):
         user_role = validation_result["role"]
 
         try:
-            # Check if document exists
-            if not frappe.db.exists(doctype, name):
+            projected = get_projected_document(doctype, name, **projection_args(arguments))
+            if projected is None:
                 result = {"success": False, "error": f"{doctype} '{name}' not found"}
                 return result
-
-            # Get document
-            doc = frappe.get_doc(doctype, name)
-
-            # Convert to dict
-            doc_dict = doc.as_dict()
+            doc_dict, child_pages = projected
 
             # Filter sensitive fields based on user role
-            filtered_doc = filter_sensitive_fields(doc_dict, doctype, user_role)
+            filtered_doc = filter_projected_document(doc_dict, child_pages, user_role)
 
             result = {
                 "success": True,
                 "doctype": doctype,
                 "name": name,
                 "data": filtered_doc,
+                "child_tables": child_pages,
                 "message": f"{doctype} '{name}' retrieved successfully",
             }
 
             # Log successful access
             return result
 
+        except frappe.ValidationError as e:
+            # Unknown fields, child tables or cursors in the projection arguments
+            return {"success": False, "error": str(e), "doctype": doctype, "name": name}
+
         except Exception as e:
             frappe.log_error(
                 title=_("Document Retrieval Error"), message=f"Error retrieving {doctype} '{name}': {str(e)}"
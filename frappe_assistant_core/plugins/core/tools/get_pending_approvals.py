@@ -27,7 +27,9 @@ from frappe.query_builder import DocType
 
 from frappe_assistant_core.core.base_tool import BaseTool
 
-MAX_TRANSITION_DOCS = 20
+# Transitions are resolved in one query per DocType (see workflow_transitions),
+# so this only bounds pathological inputs; it matches the maximum limit.
+MAX_TRANSITION_DOCS = 200
 
 
 class GetPendingApprovals(BaseTool):
@@ -149,27 +151,13 @@ class GetPendingApprovals(BaseTool):
         for r in all_roles:
             roles_map.setdefault(r.parent, []).append(r.role)
 
-        # Fetch available transitions per document (capped)
+        # Fetch available transitions, batched per DocType (capped)
         transitions_map: Dict[tuple, list] = {}
         if include_actions:
-            seen = set()
-            for action in pending_actions:
-                key = (action.reference_doctype, action.reference_name)
-                if key in seen:
-                    continue
-                seen.add(key)
-                if len(seen) > MAX_TRANSITION_DOCS:
-                    break
-                try:
-                    from frappe.model.workflow import get_transitions
-
-                    doc = frappe.get_doc(action.reference_doctype, action.reference_name)
-                    transitions = get_transitions(doc)
-                    transitions_map[key] = [
-                        {"action": t.get("action"), "next_state": t.get("next_state")} for t in transitions
-                    ]
-                except Exception:
-                    transitions_map[key] = []
+            from frappe_assistant_core.plugins.core.tools.workflow_transitions import resolve_transitions
+
+            keys = list(dict.fromkeys((a.reference_doctype, a.reference_name) for a in pending_actions))
+            transitions_map = resolve_transitions(keys[:MAX_TRANSITION_DOCS])
 
         # Group results by doctype
         grouped: Dict[str, list] = {}
@@ -0,0 +1,155 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Report requirements index used by the report_requirements tool.
+
+Each entry holds what the tool needs that does not depend on the caller:
+report type, prepared-report flags, Script Report filters discovered from
+the ``Report.filters`` table or the report JS, and Query Report columns.
+Entries are stamped with ``Report.modified`` and the mtime of the report's
+.js file; a lookup re-validates the stamp (one indexed row read plus a
+``stat``) and rebuilds the entry only when either has changed.
+
+Entries live in a per-worker dict backed by the ``fac_report_requirements``
+Redis hash, which ``build_report_index`` fills for every report after
+migrate. Query Report columns need a report run, so they are added on first
+use rather than at migrate.
+"""
+
+import copy
+import os
+from typing import Dict, Optional
+
+import frappe
+
+from frappe_assistant_core.utils.metrics import record_cache_lookup
+
+_INDEX_KEY = "fac_report_requirements"
+
+# site -> report name -> entry
+_local_index: Dict[str, Dict[str, dict]] = {}
+
+
+def _get_tool():
+    from frappe_assistant_core.plugins.core.tools.report_requirements import ReportRequirements
+
+    return ReportRequirements()
+
+
+def _js_mtime(tool, report_name: str, module: str) -> Optional[float]:
+    try:
+        js_path = tool._resolve_report_js_path(report_name, module)
+        return os.stat(js_path).st_mtime if js_path else None
+    except Exception:
+        return None
+
+
+def _build_entry(tool, report_name: str, stamp: tuple) -> dict:
+    report_doc = frappe.get_doc("Report", report_name)
+    entry = {
+        "stamp": stamp,
+        "report_type": report_doc.report_type,
+        "module": report_doc.module,
+        "prepared_report": getattr(report_doc, "prepared_report", False),
+        "disable_prepared_report": getattr(report_doc, "disable_prepared_report", False),
+        "timeout": getattr(report_doc, "timeout", None),
+        "parsed_filters": None,
+        "discovery_diagnostics": None,
+        "columns": None,
+    }
+    if report_doc.report_type == "Script Report":
+        parsed, diagnostics = tool._discover_script_report_filters(report_name, report_doc)
+        entry["parsed_filters"] = parsed
+        entry["discovery_diagnostics"] = diagnostics
+    return entry
+
+
+def _store(report_name: str, entry: dict):
+    _local_index.setdefault(frappe.local.site, {})[report_name] = entry
+    try:
+        frappe.cache.hset(_INDEX_KEY, report_name, entry)
+    except Exception as e:
+        frappe.logger().warning(f"Failed to store report index entry for {report_name}: {e}")
+
+
+def get_report_entry(report_name: str, tool=None) -> Optional[dict]:
+    """
+    Index entry for ``report_name``, or None if the report does not exist.
+
+    ``tool`` is the ReportRequirements instance whose JS discovery is used
+    to build a missing entry. The caller receives a copy and may modify it.
+    """
+    row = frappe.db.get_value("Report", report_name, ["module", "modified"], as_dict=True)
+    if not row:
+        return None
+
+    tool = tool or _get_tool()
+    stamp = (str(row.modified), _js_mtime(tool, report_name, row.module))
+
+    entry = _local_index.get(frappe.local.site, {}).get(report_name)
+    if entry and entry["stamp"] == stamp:
+        record_cache_lookup("report_requirements", True)
+        return copy.deepcopy(entry)
+
+    entry = frappe.cache.hget(_INDEX_KEY, report_name)
+    if entry and entry.get("stamp") == stamp:
+        record_cache_lookup("report_requirements", True)
+        _local_index.setdefault(frappe.local.site, {})[report_name] = entry
+    else:
+        record_cache_lookup("report_requirements", False)
+        entry = _build_entry(tool, report_name, stamp)
+        _store(report_name, entry)
+    return copy.deepcopy(entry)
+
+
+def get_query_report_columns(report_name: str, entry: dict) -> Optional[list]:
+    """
+    Columns for a Query Report, from the index when known. A successful
+    column run is stored on the entry; failures are not, so they are
+    retried on the next call.
+    """
+    if entry.get("columns"):
+        return entry["columns"]
+
+    from frappe_assistant_core.plugins.core.tools.report_tools import ReportTools
+
+    columns = ReportTools.get_query_report_columns(frappe.get_doc("Report", report_name))
+    if columns:
+        entry["columns"] = columns
+        _store(report_name, copy.deepcopy(entry))
+    return columns
+
+
+def build_report_index():
+    """Rebuild the index for every report (after_migrate)."""
+    frappe.cache.delete_value(_INDEX_KEY)
+    _local_index.pop(frappe.local.site, None)
+
+    tool = _get_tool()
+    built = 0
+    for row in frappe.get_all(
+        "Report",
+        filters={"report_type": ("!=", "Report Builder")},
+        fields=["name", "module", "modified"],
+    ):
+        try:
+            stamp = (str(row.modified), _js_mtime(tool, row.name, row.module))
+            _store(row.name, _build_entry(tool, row.name, stamp))
+            built += 1
+        except Exception as e:
+            frappe.logger().warning(f"Skipping report {row.name} in requirements index: {e}")
+    return built
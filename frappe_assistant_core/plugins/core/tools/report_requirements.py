@@ -79,32 +79,32 @@ class ReportRequirements(BaseTool):
         include_filters = arguments.get("include_filters", True)
 
         try:
-            # Import the report implementation for column analysis
+            from .report_index import get_query_report_columns, get_report_entry
             from .report_tools import ReportTools
 
-            # Get basic column and filter info from existing implementation
-            column_result = ReportTools.get_report_columns(report_name)
+            # Requirements that do not depend on the caller come from the
+            # report index (rebuilt when the Report or its .js file changes)
+            entry = get_report_entry(report_name, tool=self)
+            if entry is None:
+                return {"success": False, "error": f"Report '{report_name}' not found"}
 
-            if not column_result.get("success", False):
-                return column_result
+            if not frappe.has_permission("Report", "read", report_name):
+                return {"success": False, "error": f"No permission to access report '{report_name}'"}
 
-            # Get report document for prepared report info
-            report_doc = frappe.get_doc("Report", report_name)
+            report_type = entry["report_type"]
 
             # Start building comprehensive response
             result = {
                 "success": True,
                 "report_name": report_name,
-                "report_type": column_result.get("report_type"),
-                "prepared_report": getattr(report_doc, "prepared_report", False),
-                "disable_prepared_report": getattr(report_doc, "disable_prepared_report", False),
+                "report_type": report_type,
+                "prepared_report": entry["prepared_report"],
+                "disable_prepared_report": entry["disable_prepared_report"],
             }
 
             # Add prepared report guidance
-            if getattr(report_doc, "prepared_report", False) and not getattr(
-                report_doc, "disable_prepared_report", False
-            ):
-                report_timeout = frappe.get_value("Report", report_name, "timeout") or 120
+            if entry["prepared_report"] and not entry["disable_prepared_report"]:
+                report_timeout = entry["timeout"] or 120
                 result["prepared_report_info"] = {
                     "requires_background_processing": True,
                     "typical_execution_time": f"{report_timeout // 60} minutes for large datasets",
@@ -119,25 +119,33 @@ class ReportRequirements(BaseTool):
 
             # Add columns if requested
             if include_columns:
-                result["columns"] = column_result.get("columns", [])
+                columns = []
+                if report_type == "Query Report":
+                    columns = get_query_report_columns(report_name, entry)
+                    if columns is None:
+                        columns = [
+                            {
+                                "label": "Data not available - requires filters",
+                                "fieldname": "info",
+                                "fieldtype": "Data",
+                            }
+                        ]
+                result["columns"] = columns
 
             # Add filter guidance if requested
             if include_filters:
-                if "filter_guidance" in column_result:
-                    result["filter_guidance"] = column_result["filter_guidance"]
+                filter_guidance = ReportTools.get_filter_guidance(report_name, report_type)
+                if filter_guidance:
+                    result["filter_guidance"] = filter_guidance
 
                 # Add filter requirements analysis
-                result["filter_requirements"] = self._analyze_filter_requirements(
-                    report_name, column_result.get("report_type")
-                )
-
-                # For Script Reports, discover filters from multiple sources and
-                # add to main response.
-                if column_result.get("report_type") == "Script Report":
-                    parsed_filters, diagnostics = self._discover_script_report_filters(
-                        report_name, report_doc
-                    )
-                    result["discovery_diagnostics"] = diagnostics
+                result["filter_requirements"] = self._analyze_filter_requirements(report_name, report_type)
+
+                # For Script Reports, filters discovered from multiple sources
+                # (see _discover_script_report_filters) are added to the main response.
+                if report_type == "Script Report":
+                    parsed_filters = entry["parsed_filters"]
+                    result["discovery_diagnostics"] = entry["discovery_diagnostics"]
 
                     if parsed_filters and parsed_filters.get("filters"):
                         result["filters_definition"] = parsed_filters["filters"]
@@ -642,9 +650,11 @@ class ReportRequirements(BaseTool):
                         metadata["advanced_filters"] = report_config["filters"]
 
                 elif report_type == "Script Report":
-                    # NEW: Parse JavaScript file for filter definitions
+                    # Filter definitions from the report index (JS already parsed)
+                    from .report_index import get_report_entry
+
                     module_name = report.module
-                    parsed_filters = self._parse_script_report_filters(report_name, module_name)
+                    parsed_filters = (get_report_entry(report_name, tool=self) or {}).get("parsed_filters")
 
                     if parsed_filters:
                         metadata["advanced_filters"] = parsed_filters
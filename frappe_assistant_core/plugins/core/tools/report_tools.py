@@ -183,42 +183,18 @@ class ReportTools:
             columns = []
 
             if report_doc.report_type == "Query Report":
-                # Try to get columns from query execution with minimal filters
-                try:
-                    # Try with empty filters first
-                    result = ReportTools._execute_query_report(report_doc, {}, get_columns_only=True)
-                    columns = result.get("columns", [])
-                except Exception as e:
-                    # If that fails, try with default company
-                    try:
-                        default_company = frappe.db.get_single_value("Global Defaults", "default_company")
-                        if default_company:
-                            result = ReportTools._execute_query_report(
-                                report_doc, {"company": default_company}, get_columns_only=True
-                            )
-                            columns = result.get("columns", [])
-                    except Exception:
-                        frappe.log_error(f"Error getting columns from query report: {str(e)}")
-                        # Return basic info if column extraction fails
-                        columns = [
-                            {
-                                "label": "Data not available - requires filters",
-                                "fieldname": "info",
-                                "fieldtype": "Data",
-                            }
-                        ]
-
-            # Add helpful filter guidance based on report name patterns
-            filter_guidance = []
-            if "sales_analytics" in report_name.lower():
-                filter_guidance.append("Required: 'doc_type' (Sales Invoice, Sales Order, Quotation, etc.)")
-                filter_guidance.append("Required: 'tree_type' (Customer, Item, Territory, etc.)")
-                filter_guidance.append("Optional: 'from_date' and 'to_date' (defaults to last 12 months)")
-                filter_guidance.append("Optional: 'company' (uses default company if not specified)")
-            elif report_doc.report_type == "Script Report":
-                filter_guidance.append(
-                    "Script Reports often have mandatory filters - use report_requirements tool to discover exact filter definitions"
-                )
+                columns = ReportTools.get_query_report_columns(report_doc)
+                if columns is None:
+                    # Return basic info if column extraction fails
+                    columns = [
+                        {
+                            "label": "Data not available - requires filters",
+                            "fieldname": "info",
+                            "fieldtype": "Data",
+                        }
+                    ]
+
+            filter_guidance = ReportTools.get_filter_guidance(report_name, report_doc.report_type)
 
             result = {
                 "success": True,
@@ -236,6 +212,44 @@ class ReportTools:
             frappe.log_error(f"assistant Get Report Columns Error: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def get_query_report_columns(report_doc):
+        """
+        Columns of a Query Report, taken from a columns-only run with empty
+        filters, then with the default company. Returns None if the columns
+        could not be determined.
+        """
+        try:
+            result = ReportTools._execute_query_report(report_doc, {}, get_columns_only=True)
+            return result.get("columns", [])
+        except Exception as e:
+            try:
+                default_company = frappe.db.get_single_value("Global Defaults", "default_company")
+                if not default_company:
+                    return []
+                result = ReportTools._execute_query_report(
+                    report_doc, {"company": default_company}, get_columns_only=True
+                )
+                return result.get("columns", [])
+            except Exception:
+                frappe.log_error(f"Error getting columns from query report: {str(e)}")
+                return None
+
+    @staticmethod
+    def get_filter_guidance(report_name: str, report_type: str) -> List[str]:
+        """Filter hints based on report name patterns and type"""
+        filter_guidance = []
+        if "sales_analytics" in report_name.lower():
+            filter_guidance.append("Required: 'doc_type' (Sales Invoice, Sales Order, Quotation, etc.)")
+            filter_guidance.append("Required: 'tree_type' (Customer, Item, Territory, etc.)")
+            filter_guidance.append("Optional: 'from_date' and 'to_date' (defaults to last 12 months)")
+            filter_guidance.append("Optional: 'company' (uses default company if not specified)")
+        elif report_type == "Script Report":
+            filter_guidance.append(
+                "Script Reports often have mandatory filters - use report_requirements tool to discover exact filter definitions"
+            )
+        return filter_guidance
+
     @staticmethod
     def _handle_prepared_report_execution(report_doc, filters):
         """
@@ -0,0 +1,224 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Multi-DocType fan-out for global search.
+
+``searchable_doctypes`` resolves which candidate DocTypes exist and are
+readable once per role set (DocType-level read access depends only on the
+user's roles) and caches the answer in Redis until the TTL or a permission
+change. ``fan_out`` then runs one query per DocType on a few worker threads.
+Each worker runs in a copy of the request context with its own database
+connection, so the queries execute concurrently and the search takes about
+as long as the slowest DocType rather than the sum of all of them. Whatever
+has not finished by the deadline is reported as timed out and the caller
+returns partial results.
+
+Worker connections are returned to a small per-process pool instead of
+being closed, so a search normally reuses connections opened by earlier
+searches. The pool holds at most ``DEFAULT_WORKERS`` idle connections in
+total (across sites) and closes any left idle for ``_POOL_IDLE_SECONDS``.
+"""
+
+import contextvars
+import hashlib
+import json
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Tuple
+
+import frappe
+
+from frappe_assistant_core.utils.cache import get_cache_version
+from frappe_assistant_core.utils.metrics import record_cache_lookup
+
+DEFAULT_WORKERS = 4
+DEFAULT_DEADLINE_SECONDS = 5.0
+_SEARCHABLE_TTL = 300
+_POOL_IDLE_SECONDS = 60
+
+# (site, Database, returned at) for connections idle between searches, newest last
+_idle_connections: deque = deque()
+_pool_lock = threading.Lock()
+
+
+def searchable_doctypes(candidates: List[str]) -> List[str]:
+    """The candidates that exist and the current user's roles can read, in candidate order."""
+    roles = sorted(frappe.get_roles())
+    digest = hashlib.sha256(json.dumps([candidates, roles]).encode()).hexdigest()[:16]
+    # DocType (DocPerm) and Custom DocPerm doc events bump the generation.
+    # The Role Permission Manager edits rows with db.set_value (no doc
+    # events) but always resets metadata_version via frappe.clear_cache.
+    metadata_version = frappe.cache.get_value("metadata_version") or ""
+    cache_key = f"fac_search_doctypes_{digest}_v{get_cache_version('search_doctypes')}_{metadata_version}"
+
+    cached = frappe.cache.get_value(cache_key)
+    record_cache_lookup("search_doctypes", cached is not None)
+    if cached is not None:
+        return cached
+
+    readable = [
+        dt for dt in candidates if frappe.db.exists("DocType", dt) and frappe.has_permission(dt, "read")
+    ]
+    frappe.cache.set_value(cache_key, readable, expires_in_sec=_SEARCHABLE_TTL)
+    return readable
+
+
+def fan_out(
+    doctypes: List[str],
+    run: Callable[[str], Any],
+    workers: int = DEFAULT_WORKERS,
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Call ``run(doctype)`` for every DocType concurrently.
+
+    Returns ``(results, timed_out)``: the return value of ``run`` per DocType
+    that finished (DocTypes whose call raised are left out) and the DocTypes
+    still pending when ``deadline`` seconds had passed. Workers stop taking
+    new DocTypes at the deadline; a query already running finishes on its
+    own connection in the background.
+    """
+    tasks: queue.Queue = queue.Queue()
+    for doctype in doctypes:
+        tasks.put(doctype)
+    done: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    end = time.monotonic() + deadline
+
+    for _ in range(max(1, min(workers, len(doctypes)))):
+        # One context copy per worker: a Context cannot be entered by two threads at once
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run,
+            args=(_drain, run, tasks, done, stop, end),
+            name="fac-search",
+            daemon=True,
+        ).start()
+
+    results = {}
+    pending = set(doctypes)
+    while pending:
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            doctype, value, error = done.get(timeout=remaining)
+        except queue.Empty:
+            break
+        pending.discard(doctype)
+        if error is None:
+            results[doctype] = value
+        else:
+            frappe.logger().warning(f"Global search failed for {doctype}: {error}")
+    stop.set()
+
+    return results, [dt for dt in doctypes if dt in pending]
+
+
+def _drain(run, tasks: queue.Queue, done: queue.Queue, stop: threading.Event, end: float):
+    """Worker body: take a connection for this context and run DocTypes until none are left."""
+    connect_error = None
+    try:
+        _checkout_connection()
+        if frappe.db.db_type == "mariadb":
+            # Let the server abandon a query that would run past the deadline
+            frappe.db.sql("SET SESSION max_statement_time = %s", max(end - time.monotonic(), 0.1))
+    except Exception as e:
+        connect_error = e
+
+    try:
+        while not stop.is_set():
+            try:
+                doctype = tasks.get_nowait()
+            except queue.Empty:
+                return
+            if connect_error is not None:
+                done.put((doctype, None, connect_error))
+                continue
+            try:
+                done.put((doctype, run(doctype), None))
+            except Exception as e:
+                done.put((doctype, None, e))
+    finally:
+        if connect_error is None:
+            _checkin_connection()
+
+
+def _checkout_connection():
+    """Set ``frappe.local.db`` to an idle pooled connection for this site, or connect."""
+    site = frappe.local.site
+    now = time.monotonic()
+    pooled, expired = None, []
+    with _pool_lock:
+        for entry in list(_idle_connections):
+            entry_site, db, returned = entry
+            if now - returned >= _POOL_IDLE_SECONDS:
+                _idle_connections.remove(entry)
+                expired.append(db)
+            elif pooled is None and entry_site == site:
+                _idle_connections.remove(entry)
+                pooled = db
+    for db in expired:
+        _close_quietly(db)
+
+    if pooled is not None:
+        frappe.local.db = pooled
+    else:
+        frappe.connect(set_admin_as_user=False)
+
+
+def _checkin_connection():
+    """Return ``frappe.local.db`` to the pool, or close it when the pool is full."""
+    db = frappe.local.db
+    try:
+        # Nothing is written here; this just ends the read transaction
+        db.rollback()
+    except Exception:
+        _close_quietly(db)
+        return
+
+    evicted = None
+    with _pool_lock:
+        _idle_connections.append((frappe.local.site, db, time.monotonic()))
+        if len(_idle_connections) > DEFAULT_WORKERS:
+            evicted = _idle_connections.popleft()[1]
+    if evicted is not None:
+        _close_quietly(evicted)
+
+
+def _close_quietly(db):
+    try:
+        db.close()
+    except Exception:
+        pass
+
+
+def rank_matches(query: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort name matches: exact, then prefix, then substring (stable within a tier)."""
+    needle = (query or "").lower()
+
+    def tier(row):
+        name = str(row.get("name") or "").lower()
+        if name == needle:
+            return 0
+        if name.startswith(needle):
+            return 1
+        return 2
+
+    return sorted(rows, key=tier)
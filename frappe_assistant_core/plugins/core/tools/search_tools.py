@@ -83,9 +83,9 @@ class SearchTools:
     @staticmethod
     def global_search(query: str, limit: int = 20) -> Dict[str, Any]:
         """Global search across all accessible documents"""
-        try:
-            results = []
+        from .search_fanout import fan_out, rank_matches, searchable_doctypes
 
+        try:
             # Search across common DocTypes that users typically have access to
             common_doctypes = [
                 "User",
@@ -100,34 +100,37 @@ class SearchTools:
                 "Project",
             ]
 
-            for doctype in common_doctypes:
-                try:
-                    # Check if doctype exists and user has permission
-                    if not frappe.db.exists("DocType", doctype):
-                        continue
-                    if not frappe.has_permission(doctype, "read"):
-                        continue
-
-                    # Simple search using name field. Use frappe.get_list (not
-                    # get_all) so DocType-level AND user/row-level permissions are
-                    # applied — get_all bypasses permissions and would leak
-                    # records the user cannot read (issue #189).
-                    doctype_results = frappe.get_list(
-                        doctype,
-                        filters={"name": ["like", f"%{query}%"]},
-                        fields=["name"],
-                        limit=5,  # Limit per doctype
-                        ignore_permissions=False,
-                    )
-
-                    # Add doctype info to results
-                    for result in doctype_results:
-                        result["doctype"] = doctype
-                        results.append(result)
-
-                except Exception:
-                    # Skip doctype if there's an error
-                    continue
+            # Existence and read permission, resolved once per role set
+            searched_doctypes = searchable_doctypes(common_doctypes)
+
+            def search(doctype):
+                # Simple search using name field. Use frappe.get_list (not
+                # get_all) so DocType-level AND user/row-level permissions are
+                # applied — get_all bypasses permissions and would leak
+                # records the user cannot read (issue #189).
+                return frappe.get_list(
+                    doctype,
+                    filters={"name": ["like", f"%{query}%"]},
+                    fields=["name"],
+                    limit=5,  # Limit per doctype
+                    ignore_permissions=False,
+                )
+
+            # Per-DocType queries run concurrently; a DocType that errors is skipped
+            by_doctype, timed_out = fan_out(
+                searched_doctypes,
+                search,
+                workers=frappe.conf.get("fac_search_workers") or 4,
+                deadline=frappe.conf.get("fac_search_deadline_seconds") or 5.0,
+            )
+
+            # Add doctype info to results
+            results = []
+            for doctype in searched_doctypes:
+                for result in by_doctype.get(doctype, []):
+                    result["doctype"] = doctype
+                    results.append(result)
+            results = rank_matches(query, results)
 
             # Limit total results
             limited_results = results[:limit]
@@ -138,11 +141,9 @@ class SearchTools:
                 "results": limited_results,
                 "count": len(limited_results),
                 "total_found": len(results),
-                "searched_doctypes": [
-                    dt
-                    for dt in common_doctypes
-                    if frappe.db.exists("DocType", dt) and frappe.has_permission(dt, "read")
-                ],
+                "searched_doctypes": searched_doctypes,
+                "partial": bool(timed_out),
+                "timed_out_doctypes": timed_out,
             }
 
         except Exception as e:
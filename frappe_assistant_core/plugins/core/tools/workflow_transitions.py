@@ -0,0 +1,155 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Batch resolution of available workflow transitions.
+
+Equivalent to calling ``frappe.model.workflow.get_transitions`` per document,
+but each DocType's Workflow is loaded once and its documents are read in one
+permission-checked ``frappe.get_list`` query. The query selects only the
+workflow state field and the fields that transition conditions read through
+``doc.field``, ``doc.get("field")`` or ``doc["field"]``. Conditions are then
+evaluated against those slim rows.
+
+Documents of a DocType fall back to loading the full document when a
+condition uses ``doc`` in another way (a method call, passing ``doc`` itself)
+or reads a child table or a non-field attribute.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import frappe
+from frappe.model import default_fields, table_fields
+
+_DOC_REF = re.compile(r"\bdoc\b")
+_FIELD_ACCESSORS = (
+    re.compile(r"doc\.get\(\s*[\"'](\w+)[\"']"),
+    re.compile(r"doc\[\s*[\"'](\w+)[\"']\s*\]"),
+    re.compile(r"doc\.(\w+)\b(?!\s*\()"),
+)
+
+Key = Tuple[str, str]
+
+
+def condition_fields(condition: str) -> Optional[Set[str]]:
+    """Field names a transition condition reads from ``doc``, or None if it uses ``doc`` otherwise."""
+    fields = set()
+    for ref in _DOC_REF.finditer(condition):
+        for accessor in _FIELD_ACCESSORS:
+            match = accessor.match(condition, ref.start())
+            if match:
+                fields.add(match.group(1))
+                break
+        else:
+            return None
+    return fields
+
+
+def _slim_fields(doctype: str, workflow) -> Optional[List[str]]:
+    """Columns needed to evaluate ``workflow``'s transitions, or None if a full doc is needed."""
+    meta = frappe.get_meta(doctype)
+    fields = {"name", "docstatus", workflow.workflow_state_field}
+    for transition in workflow.transitions:
+        if not transition.condition:
+            continue
+        referenced = condition_fields(transition.condition)
+        if referenced is None:
+            return None
+        for fieldname in referenced:
+            df = meta.get_field(fieldname)
+            if df and df.fieldtype in table_fields:
+                return None
+            if not df and fieldname not in default_fields:
+                return None
+        fields |= referenced
+    # Not a column: resolve_transitions sets it on every row
+    fields.discard("doctype")
+    return sorted(fields)
+
+
+def _serialize(transitions) -> List[dict]:
+    return [{"action": t.get("action"), "next_state": t.get("next_state")} for t in transitions]
+
+
+def resolve_transitions(keys: Iterable[Key]) -> Dict[Key, List[dict]]:
+    """
+    Available ``{"action", "next_state"}`` pairs for each ``(doctype, name)``.
+
+    Documents the user cannot read, documents without a workflow state and
+    documents whose DocType has no active workflow map to an empty list.
+    """
+    from frappe.model.workflow import get_workflow, get_workflow_name, get_workflow_safe_globals
+
+    by_doctype: Dict[str, List[str]] = {}
+    for doctype, name in keys:
+        by_doctype.setdefault(doctype, []).append(name)
+
+    roles = set(frappe.get_roles())
+    safe_globals = get_workflow_safe_globals()
+    resolved: Dict[Key, List[dict]] = {}
+
+    for doctype, names in by_doctype.items():
+        for name in names:
+            resolved[(doctype, name)] = []
+        try:
+            if not get_workflow_name(doctype):
+                continue
+            workflow = get_workflow(doctype)
+            fields = _slim_fields(doctype, workflow)
+            if fields is None:
+                _resolve_full_docs(doctype, names, workflow, resolved)
+                continue
+
+            rows = frappe.get_list(
+                doctype, filters={"name": ["in", names]}, fields=fields, limit_page_length=0
+            )
+        except Exception as e:
+            frappe.logger().warning(f"Failed to resolve workflow transitions for {doctype}: {e}")
+            continue
+
+        for row in rows:
+            state = row.get(workflow.workflow_state_field)
+            if not state:
+                continue
+            row.doctype = doctype
+            available = []
+            for transition in workflow.transitions:
+                if transition.state != state or transition.allowed not in roles:
+                    continue
+                try:
+                    if transition.condition and not frappe.safe_eval(
+                        transition.condition, safe_globals, {"doc": row}
+                    ):
+                        continue
+                except Exception:
+                    continue
+                available.append(transition)
+            resolved[(doctype, row.name)] = _serialize(available)
+
+    return resolved
+
+
+def _resolve_full_docs(doctype: str, names: List[str], workflow, resolved: Dict[Key, List[dict]]):
+    """Per-document ``get_transitions`` with the already loaded workflow."""
+    from frappe.model.workflow import get_transitions
+
+    for name in names:
+        try:
+            doc = frappe.get_doc(doctype, name)
+            resolved[(doctype, name)] = _serialize(get_transitions(doc, workflow))
+        except Exception:
+            resolved[(doctype, name)] = []
@@ -21,19 +21,19 @@ Extracts content from various file formats (PDF, images, CSV, Excel, documents)
 
 import base64
 import importlib.util
-import io
 import json
 import mimetypes
 import os
 import subprocess
 import sys
-import tempfile
 from typing import Any, Dict, Optional
 
 import frappe
 from frappe import _
 
 from frappe_assistant_core.core.base_tool import BaseTool
+from frappe_assistant_core.plugins.data_science.tools.file_source import FileSource, s3_source
+from frappe_assistant_core.utils import metrics
 
 
 class ExtractFileContent(BaseTool):
@@ -106,6 +106,13 @@ class ExtractFileContent(BaseTool):
                     "default": 50,
                     "description": "Maximum pages to process for PDFs",
                 },
+                "sample_rows": {
+                    "type": "integer",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 1000,
+                    "description": "Rows of sample data returned per CSV file or Excel sheet",
+                },
             },
             "required": ["operation"],
         }
@@ -129,11 +136,14 @@ class ExtractFileContent(BaseTool):
 
             # Check file size limits
             if not self._check_file_size(file_doc):
-                return {"success": False, "error": "File size exceeds limit of 50MB"}
+                return {
+                    "success": False,
+                    "error": f"File size exceeds limit of {self._max_file_size() // (1024 * 1024)}MB",
+                }
 
-            # Get file content
-            file_content = self._get_file_content(file_doc)
-            if not file_content:
+            # Open the file content (streamed, not read into memory)
+            source = self._get_file_source(file_doc)
+            if not source or not source.size:
                 return {"success": False, "error": "Failed to read file content"}
 
             # Detect file type
@@ -142,32 +152,33 @@ class ExtractFileContent(BaseTool):
             # Process based on operation
             operation = arguments.get("operation", "extract")
 
-            if operation == "extract":
-                result = self._extract_content(file_content, file_type, arguments)
-            elif operation == "ocr":
-                result = self._perform_ocr(file_content, arguments, file_type=file_type)
-            elif operation == "parse_data":
-                if file_type in ["csv", "excel"]:
-                    result = self._extract_content(file_content, file_type, arguments)
-                else:
-                    return {
-                        "success": False,
-                        "error": "parse_data operation only supports CSV and Excel files",
-                    }
-            elif operation == "extract_tables":
-                if file_type == "pdf":
-                    result = self._extract_pdf_tables(file_content, arguments)
+            with source:
+                if operation == "extract":
+                    result = self._extract_content(source, file_type, arguments)
+                elif operation == "ocr":
+                    result = self._perform_ocr(source, arguments, file_type=file_type)
+                elif operation == "parse_data":
+                    if file_type in ["csv", "excel"]:
+                        result = self._extract_content(source, file_type, arguments)
+                    else:
+                        return {
+                            "success": False,
+                            "error": "parse_data operation only supports CSV and Excel files",
+                        }
+                elif operation == "extract_tables":
+                    if file_type == "pdf":
+                        result = self._extract_pdf_tables(source, arguments)
+                    else:
+                        return {"success": False, "error": "extract_tables operation only supports PDF files"}
                 else:
-                    return {"success": False, "error": "extract_tables operation only supports PDF files"}
-            else:
-                return {"success": False, "error": f"Unknown operation: {operation}"}
+                    return {"success": False, "error": f"Unknown operation: {operation}"}
 
             # Add file metadata to result
             if result.get("success"):
                 result["file_info"] = {
                     "name": file_doc.file_name,
                     "type": file_type,
-                    "size": file_doc.file_size if hasattr(file_doc, "file_size") else len(file_content),
+                    "size": getattr(file_doc, "file_size", None) or source.size,
                     "url": file_doc.file_url,
                 }
 
@@ -260,9 +271,13 @@ class ExtractFileContent(BaseTool):
         if file_doc.file_url and "/private/" in file_doc.file_url:
             frappe.only_for("System Manager")
 
+    def _max_file_size(self) -> int:
+        """Size limit in bytes; ``fac_extract_max_file_mb`` in site config overrides the 50MB default."""
+        return (frappe.conf.get("fac_extract_max_file_mb") or 50) * 1024 * 1024
+
     def _check_file_size(self, file_doc) -> bool:
         """Check if file size is within limits"""
-        max_size = 50 * 1024 * 1024  # 50MB
+        max_size = self._max_file_size()
 
         try:
             if hasattr(file_doc, "file_size") and file_doc.file_size:
@@ -289,26 +304,27 @@ class ExtractFileContent(BaseTool):
                 return frappe.get_site_path("public", file_doc.file_url.lstrip("/"))
         return None
 
-    def _get_file_content(self, file_doc) -> Optional[bytes]:
-        """Get file content as bytes — supports local files and S3 (frappe_s3_attachment)."""
+    def _get_file_source(self, file_doc) -> Optional[FileSource]:
+        """Open file content as a FileSource — supports local files and S3 (frappe_s3_attachment)."""
         try:
             # 1. Try local filesystem
             file_path = self._get_file_path(file_doc)
             if file_path and os.path.exists(file_path):
-                # nosemgrep: frappe-security-file-traversal — _get_file_path scopes to /private or /files under the site directory via frappe.get_site_path
-                with open(file_path, "rb") as f:
-                    return f.read()
+                return FileSource.from_path(file_path)
+
+            suffix = os.path.splitext(file_doc.file_name or "")[1]
 
             # 2. Try S3 via frappe_s3_attachment
-            s3_content = self._get_s3_content(file_doc)
-            if s3_content:
-                return s3_content
+            source = self._get_s3_source(file_doc, suffix)
+            if source:
+                return source
 
             # 3. Fallback: inline content on the File doc
-            if hasattr(file_doc, "content"):
-                if isinstance(file_doc.content, str):
-                    return base64.b64decode(file_doc.content)
-                return file_doc.content
+            if getattr(file_doc, "content", None):
+                content = file_doc.content
+                if isinstance(content, str):
+                    content = base64.b64decode(content)
+                return FileSource.from_bytes(content, suffix)
 
             return None
 
@@ -316,8 +332,8 @@ class ExtractFileContent(BaseTool):
             frappe.log_error(f"Error reading file content: {str(e)}")
             return None
 
-    def _get_s3_content(self, file_doc) -> Optional[bytes]:
-        """Fetch file bytes from S3 if frappe_s3_attachment is installed."""
+    def _get_s3_source(self, file_doc, suffix: str) -> Optional[FileSource]:
+        """Open an S3 object for ranged reads if frappe_s3_attachment is installed."""
         try:
             file_url = file_doc.file_url or ""
             if "frappe_s3_attachment" not in file_url:
@@ -337,8 +353,7 @@ class ExtractFileContent(BaseTool):
                 return None
 
             s3_ops = S3Operations()
-            response = s3_ops.read_file_from_s3(s3_key)
-            return response["Body"].read()
+            return s3_source(s3_ops.S3_CLIENT, s3_ops.BUCKET, s3_key, suffix)
 
         except ImportError:
             return None
@@ -383,36 +398,35 @@ class ExtractFileContent(BaseTool):
             return "unknown"
 
     def _extract_content(
-        self, file_content: bytes, file_type: str, arguments: Dict[str, Any]
+        self, source: FileSource, file_type: str, arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Extract content based on file type"""
         try:
             if file_type == "pdf":
-                return self._extract_pdf_content(file_content, arguments)
+                return self._extract_pdf_content(source, arguments)
             elif file_type == "image":
-                return self._extract_image_content(file_content, arguments)
+                return self._extract_image_content(source, arguments)
             elif file_type == "csv":
-                return self._extract_csv_content(file_content)
+                return self._extract_csv_content(source, arguments)
             elif file_type == "excel":
-                return self._extract_excel_content(file_content)
+                return self._extract_excel_content(source, arguments)
             elif file_type == "docx":
-                return self._extract_docx_content(file_content)
+                return self._extract_docx_content(source)
             elif file_type == "text":
-                return self._extract_text_content(file_content)
+                return self._extract_text_content(source)
             else:
                 return {"success": False, "error": f"Unsupported file type: {file_type}"}
 
         except Exception as e:
             return {"success": False, "error": f"Content extraction failed: {str(e)}"}
 
-    def _extract_pdf_content(self, file_content: bytes, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_pdf_content(self, source: FileSource, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Extract content from PDF"""
         try:
             from pypdf import PdfReader
 
             # Create PDF reader
-            pdf_file = io.BytesIO(file_content)
-            reader = PdfReader(pdf_file)
+            reader = PdfReader(source.open())
 
             max_pages = arguments.get("max_pages", 50)
             num_pages = min(len(reader.pages), max_pages)
@@ -429,7 +443,7 @@ class ExtractFileContent(BaseTool):
 
             # If no text extracted, this is likely a scanned PDF - auto-fallback to OCR
             if not combined_text.strip():
-                return self._perform_ocr(file_content, arguments, file_type="pdf")
+                return self._perform_ocr(source, arguments, file_type="pdf")
 
             return {
                 "success": True,
@@ -441,24 +455,25 @@ class ExtractFileContent(BaseTool):
         except Exception as e:
             return {"success": False, "error": f"PDF extraction error: {str(e)}"}
 
-    def _extract_image_content(self, file_content: bytes, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_image_content(self, source: FileSource, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Extract content from image using OCR"""
-        return self._perform_ocr(file_content, arguments, file_type="image")
+        return self._perform_ocr(source, arguments, file_type="image")
 
     def _get_ocr_settings(self) -> Dict[str, Any]:
         """Get OCR backend configuration from Assistant Core Settings."""
         try:
-            settings = frappe.get_single("Assistant Core Settings")
+            from frappe_assistant_core.utils.settings import get_assistant_settings
+
+            settings = get_assistant_settings()
             return {
-                "backend": getattr(settings, "ocr_backend", "paddleocr") or "paddleocr",
-                "ocr_language": getattr(settings, "ocr_language", "en") or "en",
-                "paddleocr_timeout": int(getattr(settings, "paddleocr_timeout", 120) or 120),
-                "paddleocr_max_memory_mb": int(getattr(settings, "paddleocr_max_memory_mb", 2048) or 2048),
-                "ollama_url": getattr(settings, "ollama_api_url", "http://localhost:11434")
-                or "http://localhost:11434",
-                "ollama_model": getattr(settings, "ollama_vision_model", "deepseek-ocr:latest")
-                or "deepseek-ocr:latest",
-                "ollama_timeout": int(getattr(settings, "ollama_request_timeout", 120) or 120),
+                "backend": settings.ocr_backend,
+                "ocr_language": settings.ocr_language,
+                "paddleocr_timeout": settings.paddleocr_timeout or 120,
+                "paddleocr_max_memory_mb": settings.paddleocr_max_memory_mb or 2048,
+                "ollama_url": settings.ollama_api_url,
+                "ollama_model": settings.ollama_vision_model,
+                "ollama_timeout": settings.ollama_request_timeout or 120,
+                "ollama_concurrency": settings.ollama_max_concurrency or 2,
             }
         except Exception:
             return {"backend": "paddleocr", "ocr_language": "en"}
@@ -484,7 +499,7 @@ class ExtractFileContent(BaseTool):
         }
 
     def _perform_ocr(
-        self, file_content: bytes, arguments: Dict[str, Any], file_type: str = "image"
+        self, source: FileSource, arguments: Dict[str, Any], file_type: str = "image"
     ) -> Dict[str, Any]:
         """Perform OCR on image or PDF content.
 
@@ -492,7 +507,7 @@ class ExtractFileContent(BaseTool):
         Falls back to PaddleOCR if Ollama fails or returns empty.
 
         Args:
-            file_content: Raw file bytes
+            source: File content
             arguments: Tool arguments (language, max_pages, etc.)
             file_type: File type string ("image" or "pdf")
         """
@@ -500,33 +515,34 @@ class ExtractFileContent(BaseTool):
 
         # Try Ollama vision backend if configured
         if ocr_settings.get("backend") == "ollama":
-            result = self._try_ollama_ocr(file_content, arguments, file_type, ocr_settings)
+            result = self._try_ollama_ocr(source, arguments, file_type, ocr_settings)
             if result and result.get("success") and result.get("content", "").strip():
                 return result
             if self._is_paddle_ocr_available():
                 # Ollama failed or returned empty — fall through to PaddleOCR
-                return self._perform_paddle_ocr(file_content, arguments, file_type, ocr_settings)
+                return self._perform_paddle_ocr(source, arguments, file_type, ocr_settings)
             if result:
                 return result
             return self._missing_paddle_ocr_response()
 
         # Tesseract path — explicit choice. Body lifted from pre-#99 (commit 736b3fc).
         if ocr_settings.get("backend") == "tesseract":
-            return self._perform_tesseract_ocr(file_content, arguments)
+            return self._perform_tesseract_ocr(source, arguments)
 
         # PaddleOCR path (default)
         if not self._is_paddle_ocr_available():
             return self._missing_paddle_ocr_response()
-        return self._perform_paddle_ocr(file_content, arguments, file_type, ocr_settings)
+        return self._perform_paddle_ocr(source, arguments, file_type, ocr_settings)
 
     def _perform_paddle_ocr(
-        self, file_content: bytes, arguments: Dict[str, Any], file_type: str, ocr_settings: Dict[str, Any]
+        self, source: FileSource, arguments: Dict[str, Any], file_type: str, ocr_settings: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Perform OCR using PaddleOCR in an isolated subprocess.
 
         Spawns a child process to run PaddleOCR so that hangs or out-of-memory
         crashes kill only the subprocess, not the Frappe worker. Communicates
-        via JSON over stdin/stdout.
+        via JSON over stdin/stdout. The child reads the file itself: a local
+        file's path is passed as-is, other sources are copied to a temp file.
         """
         language = self._get_ocr_language(arguments, ocr_settings)
         timeout = ocr_settings.get("paddleocr_timeout", 120)
@@ -536,27 +552,11 @@ class ExtractFileContent(BaseTool):
         # Advisory memory check — logs a warning but does not block
         self._check_available_memory(max_memory_mb)
 
-        # Write file content to a temp file for the subprocess
-        suffix = ".pdf" if file_type == "pdf" else ".png"
-        tmp_file = tempfile.NamedTemporaryFile(suffix=suffix, prefix="fac_ocr_", delete=False)
-        try:
-            if file_type != "pdf":
-                # Save image as PNG for consistent handling
-                from PIL import Image
-
-                image = Image.open(io.BytesIO(file_content))
-                if image.mode in ("RGBA", "P"):
-                    image = image.convert("RGB")
-                image.save(tmp_file, format="PNG")
-            else:
-                tmp_file.write(file_content)
-            tmp_file.flush()
-            tmp_file.close()
-
+        with source.local_path() as file_path:
             # Build the JSON request for the subprocess
             request_data = json.dumps(
                 {
-                    "file_path": tmp_file.name,
+                    "file_path": file_path,
                     "file_type": file_type,
                     "language": language,
                     "max_pages": max_pages,
@@ -565,19 +565,21 @@ class ExtractFileContent(BaseTool):
             )
 
             # Spawn isolated subprocess
-            # nosemgrep: frappe-subprocess-exec — static argv ([sys.executable, "-m", <fixed module>]), shell=False; request is passed as JSON over stdin, never as an argument
-            proc = subprocess.Popen(
-                [sys.executable, "-m", "frappe_assistant_core.utils.ocr_subprocess"],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
+            with metrics.timer("fac_subprocess_spawn_seconds", {"kind": "ocr"}):
+                # nosemgrep: frappe-subprocess-exec — static argv ([sys.executable, "-m", <fixed module>]), shell=False; request is passed as JSON over stdin, never as an argument
+                proc = subprocess.Popen(
+                    [sys.executable, "-m", "frappe_assistant_core.utils.ocr_subprocess"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
 
             try:
-                stdout, stderr = proc.communicate(
-                    input=request_data.encode("utf-8"),
-                    timeout=timeout,
-                )
+                with metrics.timer("fac_subprocess_duration_seconds", {"kind": "ocr"}):
+                    stdout, stderr = proc.communicate(
+                        input=request_data.encode("utf-8"),
+                        timeout=timeout,
+                    )
             except subprocess.TimeoutExpired:
                 proc.kill()
                 proc.wait()
@@ -632,13 +634,7 @@ class ExtractFileContent(BaseTool):
             result["ocr_language"] = language
             return result
 
-        finally:
-            try:
-                os.unlink(tmp_file.name)
-            except OSError:
-                pass
-
-    def _perform_tesseract_ocr(self, file_content: bytes, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def _perform_tesseract_ocr(self, source: FileSource, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Perform OCR on image content"""
         try:
             # Check if pytesseract is available
@@ -663,7 +659,7 @@ class ExtractFileContent(BaseTool):
                 }
 
             # Open image
-            image = Image.open(io.BytesIO(file_content))
+            image = Image.open(source.open())
 
             # Perform OCR
             language = arguments.get("language", "eng")
@@ -708,16 +704,16 @@ class ExtractFileContent(BaseTool):
             pass  # Non-critical; skip on non-Linux or permission errors
 
     def _try_ollama_ocr(
-        self, file_content: bytes, arguments: Dict[str, Any], file_type: str, ocr_settings: Dict[str, Any]
+        self, source: FileSource, arguments: Dict[str, Any], file_type: str, ocr_settings: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Try OCR via Ollama vision model. Returns None on failure to allow PaddleOCR fallback."""
         try:
             from PIL import Image
 
             if file_type == "pdf":
-                return self._perform_ollama_pdf_ocr(file_content, arguments, ocr_settings)
+                return self._perform_ollama_pdf_ocr(source, arguments, ocr_settings)
             else:
-                image = Image.open(io.BytesIO(file_content))
+                image = Image.open(source.open())
                 return self._ollama_extract_from_image(image, ocr_settings)
         except Exception as e:
             frappe.log_error(
@@ -728,27 +724,11 @@ class ExtractFileContent(BaseTool):
 
     def _ollama_extract_from_image(self, pil_image, ocr_settings: Dict[str, Any]) -> Dict[str, Any]:
         """Send a single PIL image to Ollama vision model for text extraction."""
-        import requests
-
-        buf = io.BytesIO()
-        if pil_image.mode in ("RGBA", "P"):
-            pil_image = pil_image.convert("RGB")
-        pil_image.save(buf, format="JPEG", quality=85)
-        img_b64 = base64.b64encode(buf.getvalue()).decode()
-
-        url = f"{ocr_settings['ollama_url']}/api/generate"
-        payload = {
-            "model": ocr_settings["ollama_model"],
-            "prompt": "Extract all text from this document image exactly as it appears.",
-            "images": [img_b64],
-            "stream": False,
-        }
+        from frappe_assistant_core.plugins.data_science.tools.ollama_ocr import OllamaOCRClient, encode_jpeg
 
-        response = requests.post(url, json=payload, timeout=ocr_settings["ollama_timeout"])
-        response.raise_for_status()
-        result = response.json()
+        with OllamaOCRClient.from_settings(ocr_settings) as client:
+            content = client.extract_text(encode_jpeg(pil_image))
 
-        content = result.get("response", "").strip()
         if not content:
             return {"success": True, "content": "", "message": "Ollama returned no text"}
         return {
@@ -759,9 +739,12 @@ class ExtractFileContent(BaseTool):
         }
 
     def _perform_ollama_pdf_ocr(
-        self, file_content: bytes, arguments: Dict[str, Any], ocr_settings: Dict[str, Any]
+        self, source: FileSource, arguments: Dict[str, Any], ocr_settings: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Extract text from PDF via Ollama. Renders pages with PyMuPDF, then sends to Ollama."""
+        """
+        Extract text from PDF via Ollama. Pages are rendered with PyMuPDF on a
+        background thread and sent to Ollama concurrently (see ollama_ocr).
+        """
         try:
             import fitz  # PyMuPDF
         except ImportError:
@@ -770,25 +753,45 @@ class ExtractFileContent(BaseTool):
                 "error": "PyMuPDF (fitz) is required for Ollama PDF OCR. Install with: pip install pymupdf",
             }
 
+        from frappe_assistant_core.plugins.data_science.tools.ollama_ocr import (
+            OCRCancelled,
+            OllamaOCRClient,
+            render_pdf_pages,
+        )
+        from frappe_assistant_core.utils.progress_streaming import is_operation_cancelled, update_progress
+
         try:
-            pdf_doc = fitz.open(stream=file_content, filetype="pdf")
+            if source.path:
+                pdf_doc = fitz.open(source.path, filetype="pdf")
+            else:
+                pdf_doc = fitz.open(stream=source.buffer(), filetype="pdf")
         except Exception as e:
             return {"success": False, "error": f"Failed to open PDF for OCR: {str(e)}"}
 
         max_pages = arguments.get("max_pages", 50)
         num_pages = min(len(pdf_doc), max_pages)
 
-        text_content = []
-        for page_num in range(num_pages):
-            page = pdf_doc[page_num]
-            pix = page.get_pixmap(dpi=150)
-            pil_image = pix.pil_image()
+        def on_page(done):
+            update_progress(
+                progress_percent=int(done * 100 / num_pages), message=f"OCR {done} of {num_pages} pages"
+            )
 
-            page_result = self._ollama_extract_from_image(pil_image, ocr_settings)
-            if page_result.get("success") and page_result.get("content", "").strip():
-                text_content.append(f"--- Page {page_num + 1} ---\n{page_result['content']}")
+        try:
+            with OllamaOCRClient.from_settings(ocr_settings) as client:
+                page_texts = client.extract_pages(
+                    render_pdf_pages(pdf_doc, num_pages), on_page=on_page, cancelled=is_operation_cancelled
+                )
+        except OCRCancelled as e:
+            return {"success": False, "error": f"OCR cancelled after {e.pages_done} of {num_pages} pages"}
+        finally:
+            # extract_pages returns only once its render thread has exited
+            pdf_doc.close()
 
-        pdf_doc.close()
+        text_content = [
+            f"--- Page {page_num + 1} ---\n{page_texts[page_num]}"
+            for page_num in sorted(page_texts)
+            if page_texts[page_num]
+        ]
 
         combined_text = "\n\n".join(text_content)
 
@@ -810,27 +813,26 @@ class ExtractFileContent(BaseTool):
             "ocr_model": ocr_settings["ollama_model"],
         }
 
-    def _extract_csv_content(self, file_content: bytes) -> Dict[str, Any]:
-        """Extract content from CSV"""
+    def _get_sample_rows(self, arguments: Dict[str, Any]) -> int:
+        return min(max(int(arguments.get("sample_rows") or 10), 1), 1000)
+
+    def _extract_csv_content(self, source: FileSource, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract content from CSV, profiled in chunks (see spreadsheet_profile)"""
         try:
-            import pandas as pd
+            from frappe_assistant_core.plugins.data_science.tools.spreadsheet_profile import profile_csv
 
-            # Try different encodings
-            for encoding in ["utf-8", "latin-1", "cp1252"]:
-                try:
-                    df = pd.read_csv(io.BytesIO(file_content), encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
+            try:
+                profile = profile_csv(source.open, sample_rows=self._get_sample_rows(arguments))
+            except UnicodeDecodeError:
                 return {"success": False, "error": "Failed to decode CSV file with common encodings"}
 
             # Convert to dict for serialization
             data_dict = {
-                "columns": df.columns.tolist(),
-                "row_count": len(df),
-                "sample_data": df.head(10).to_dict("records"),
-                "data_types": {col: str(dtype) for col, dtype in df.dtypes.items()},
+                "columns": profile.columns,
+                "row_count": profile.row_count,
+                "sample_data": profile.sample.to_dict("records"),
+                "data_types": profile.data_types,
+                "null_counts": profile.null_counts,
             }
 
             # Create text representation
@@ -838,39 +840,47 @@ class ExtractFileContent(BaseTool):
             text_content += f"Columns: {', '.join(data_dict['columns'])}\n"
             text_content += f"Total Rows: {data_dict['row_count']}\n\n"
             text_content += "Sample Data:\n"
-            text_content += df.head(10).to_string()
+            text_content += profile.sample.to_string()
 
             return {"success": True, "content": text_content, "structured_data": data_dict}
 
         except Exception as e:
             return {"success": False, "error": f"CSV extraction error: {str(e)}"}
 
-    def _extract_excel_content(self, file_content: bytes) -> Dict[str, Any]:
-        """Extract content from Excel"""
+    def _extract_excel_content(self, source: FileSource, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract content from Excel; XLSX sheets are profiled row by row in read-only mode"""
         try:
-            import pandas as pd
+            from frappe_assistant_core.plugins.data_science.tools.spreadsheet_profile import (
+                is_xlsx,
+                profile_xlsx,
+            )
 
-            # Read Excel file
-            excel_file = pd.ExcelFile(io.BytesIO(file_content))
+            sample_rows = self._get_sample_rows(arguments)
+            with source.open() as stream:
+                xlsx = is_xlsx(stream.read(4))
+
+            if xlsx:
+                profiles = profile_xlsx(source.open(), sample_rows=sample_rows)
+            else:
+                profiles = self._profile_legacy_excel(source, sample_rows)
 
             all_sheets_content = []
             structured_data = {}
 
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
-
+            for sheet_name, profile in profiles.items():
                 # Store structured data
                 structured_data[sheet_name] = {
-                    "columns": df.columns.tolist(),
-                    "row_count": len(df),
-                    "sample_data": df.head(10).to_dict("records"),
+                    "columns": profile.columns,
+                    "row_count": profile.row_count,
+                    "sample_data": profile.sample.to_dict("records"),
+                    "data_types": profile.data_types,
                 }
 
                 # Create text representation
                 sheet_content = f"=== Sheet: {sheet_name} ===\n"
-                sheet_content += f"Columns: {', '.join(df.columns.tolist())}\n"
-                sheet_content += f"Rows: {len(df)}\n\n"
-                sheet_content += df.head(10).to_string()
+                sheet_content += f"Columns: {', '.join(profile.columns)}\n"
+                sheet_content += f"Rows: {profile.row_count}\n\n"
+                sheet_content += profile.sample.to_string()
 
                 all_sheets_content.append(sheet_content)
 
@@ -880,13 +890,31 @@ class ExtractFileContent(BaseTool):
                 "success": True,
                 "content": combined_content,
                 "structured_data": structured_data,
-                "sheet_count": len(excel_file.sheet_names),
+                "sheet_count": len(profiles),
             }
 
         except Exception as e:
             return {"success": False, "error": f"Excel extraction error: {str(e)}"}
 
-    def _extract_docx_content(self, file_content: bytes) -> Dict[str, Any]:
+    def _profile_legacy_excel(self, source: FileSource, sample_rows: int) -> Dict[str, Any]:
+        """Legacy .xls has no streaming reader, so each sheet is loaded with pandas."""
+        import pandas as pd
+
+        from frappe_assistant_core.plugins.data_science.tools.spreadsheet_profile import SheetProfile
+
+        profiles = {}
+        excel_file = pd.ExcelFile(source.open())
+        for sheet_name in excel_file.sheet_names:
+            df = pd.read_excel(excel_file, sheet_name=sheet_name)
+            profiles[sheet_name] = SheetProfile(
+                columns=[str(c) for c in df.columns],
+                sample=df.head(sample_rows),
+                row_count=len(df),
+                data_types={str(c): str(dtype) for c, dtype in df.dtypes.items()},
+            )
+        return profiles
+
+    def _extract_docx_content(self, source: FileSource) -> Dict[str, Any]:
         """Extract content from DOCX"""
         try:
             # Check if python-docx is available
@@ -899,7 +927,7 @@ class ExtractFileContent(BaseTool):
                 }
 
             # Read document
-            doc = Document(io.BytesIO(file_content))
+            doc = Document(source.open())
 
             # Extract paragraphs
             paragraphs = []
@@ -932,13 +960,14 @@ class ExtractFileContent(BaseTool):
         except Exception as e:
             return {"success": False, "error": f"DOCX extraction error: {str(e)}"}
 
-    def _extract_text_content(self, file_content: bytes) -> Dict[str, Any]:
+    def _extract_text_content(self, source: FileSource) -> Dict[str, Any]:
         """Extract content from text file"""
         try:
+            buffer = source.buffer()
             # Try different encodings
             for encoding in ["utf-8", "latin-1", "cp1252", "ascii"]:
                 try:
-                    text = file_content.decode(encoding)
+                    text = str(buffer, encoding)
                     return {"success": True, "content": text, "encoding": encoding}
                 except UnicodeDecodeError:
                     continue
@@ -948,7 +977,7 @@ class ExtractFileContent(BaseTool):
         except Exception as e:
             return {"success": False, "error": f"Text extraction error: {str(e)}"}
 
-    def _extract_pdf_tables(self, file_content: bytes, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_pdf_tables(self, source: FileSource, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Extract tables from PDF"""
         try:
             # Try using pdfplumber for better table extraction
@@ -956,7 +985,7 @@ class ExtractFileContent(BaseTool):
                 import pandas as pd
                 import pdfplumber
 
-                with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+                with pdfplumber.open(source.path or source.open()) as pdf:
                     all_tables = []
                     max_pages = min(arguments.get("max_pages", 50), len(pdf.pages))
 
@@ -0,0 +1,185 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+File sources for extract_file_content.
+
+A ``FileSource`` gives extractors the content of a File without reading it
+into memory up front:
+
+* ``open()`` returns a new seekable binary stream. Local files are opened
+  directly, S3 objects are read with ranged GETs through a buffered reader,
+  and inline content is wrapped in ``BytesIO``.
+* ``buffer()`` returns a bytes-like view for code that needs one. For local
+  files this is a read-only mmap, so pages are loaded by the kernel on
+  access.
+* ``local_path()`` yields a filesystem path: the file itself when it is
+  local, otherwise a temporary copy streamed in chunks.
+"""
+
+import io
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterator, Optional, Union
+
+# Size of each S3 ranged GET (and of the read buffer in front of it)
+S3_RANGE_BYTES = 1024 * 1024
+
+
+class FileSource:
+    """Read-only access to one file's content; close() releases mmaps and streams."""
+
+    def __init__(
+        self,
+        size: int,
+        suffix: str = "",
+        path: Optional[str] = None,
+        opener: Optional[Callable[[], BinaryIO]] = None,
+        data: Optional[bytes] = None,
+    ):
+        self.size = size
+        self.suffix = suffix
+        self.path = path
+        self._opener = opener
+        self._data = data
+        self._mmap: Optional[mmap.mmap] = None
+        self._streams = []
+
+    @classmethod
+    def from_path(cls, path: str) -> "FileSource":
+        return cls(os.path.getsize(path), os.path.splitext(path)[1], path=path)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, suffix: str = "") -> "FileSource":
+        return cls(len(data), suffix, data=data)
+
+    def open(self) -> BinaryIO:
+        """A new stream positioned at the start of the content."""
+        if self.path:
+            # nosemgrep: frappe-security-file-traversal — path comes from ExtractFileContent._get_file_path, scoped to the site's file directories
+            stream = open(self.path, "rb")
+        elif self._opener:
+            stream = self._opener()
+        else:
+            return io.BytesIO(self._data or b"")
+        self._streams.append(stream)
+        return stream
+
+    def buffer(self) -> Union[bytes, mmap.mmap]:
+        """The whole content as a bytes-like object (an mmap for local files)."""
+        if self._data is not None:
+            return self._data
+        if self.path:
+            if self._mmap is None:
+                if not self.size:
+                    return b""
+                with open(self.path, "rb") as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._mmap
+        with self.open() as stream:
+            self._data = stream.read()
+        return self._data
+
+    @contextmanager
+    def local_path(self) -> Iterator[str]:
+        """A path to the content, copying to a temporary file only when not local."""
+        if self.path:
+            yield self.path
+            return
+
+        tmp_file = tempfile.NamedTemporaryFile(suffix=self.suffix, prefix="fac_file_", delete=False)
+        try:
+            with tmp_file, self.open() as stream:
+                shutil.copyfileobj(stream, tmp_file, S3_RANGE_BYTES)
+            yield tmp_file.name
+        finally:
+            try:
+                os.unlink(tmp_file.name)
+            except OSError:
+                pass
+
+    def close(self):
+        for stream in self._streams:
+            stream.close()
+        self._streams = []
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "FileSource":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class S3RangeReader(io.RawIOBase):
+    """Seekable raw stream over an S3 object that fetches only the ranges read."""
+
+    def __init__(self, client, bucket: str, key: str, size: int):
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self._size or not len(buffer):
+            return 0
+        end = min(self._position + len(buffer), self._size) - 1
+        response = self._client.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={self._position}-{end}"
+        )
+        data = response["Body"].read()
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+def s3_source(client, bucket: str, key: str, suffix: str = "") -> FileSource:
+    """A FileSource over an S3 object, read in ``S3_RANGE_BYTES`` ranges."""
+    size = client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+
+    def opener() -> BinaryIO:
+        return io.BufferedReader(S3RangeReader(client, bucket, key, size), buffer_size=S3_RANGE_BYTES)
+
+    return FileSource(size, suffix, opener=opener)
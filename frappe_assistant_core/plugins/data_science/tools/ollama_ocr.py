@@ -0,0 +1,226 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Ollama vision OCR client used by extract_file_content.
+
+Pages are sent to ``/api/generate`` over one pooled ``requests.Session``,
+up to ``concurrency`` at a time, with a retry for connection errors, 429
+and 5xx responses. For PDFs, a background thread renders pages to JPEG
+while earlier pages are being recognized; at most ``2 * concurrency``
+rendered pages wait in memory. Text is returned in page order.
+
+This module does not import frappe, so it can be benchmarked on its own
+(see scripts/benchmark_ollama_ocr.py).
+"""
+
+import base64
+import io
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+OCR_PROMPT = "Extract all text from this document image exactly as it appears."
+
+DEFAULT_CONCURRENCY = 2
+_PAGE_RETRIES = 2
+_RETRY_BACKOFF_SECONDS = 0.5
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_CANCEL_POLL_SECONDS = 0.5
+
+_DONE = object()
+
+
+class OCRCancelled(Exception):
+    """Raised by ``extract_pages`` when ``cancelled()`` returns True."""
+
+    def __init__(self, pages_done: int):
+        super().__init__(f"OCR cancelled after {pages_done} pages")
+        self.pages_done = pages_done
+
+
+def encode_jpeg(pil_image, quality: int = 85) -> bytes:
+    buf = io.BytesIO()
+    if pil_image.mode in ("RGBA", "P"):
+        pil_image = pil_image.convert("RGB")
+    pil_image.save(buf, format="JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def render_pdf_pages(pdf_doc, num_pages: int, dpi: int = 150) -> Iterator[Tuple[int, bytes]]:
+    """(page index, JPEG bytes) for the first ``num_pages`` pages of a PyMuPDF document."""
+    for page_num in range(num_pages):
+        pix = pdf_doc[page_num].get_pixmap(dpi=dpi)
+        yield page_num, encode_jpeg(pix.pil_image())
+
+
+def _render_into(pages: Iterable[Tuple[int, bytes]], buffers: queue.Queue, stop: threading.Event):
+    """Producer thread: move rendered pages into ``buffers`` until done or stopped."""
+    try:
+        for item in pages:
+            if not _put(buffers, item, stop):
+                return
+    except Exception as e:
+        _put(buffers, e, stop)
+        return
+    _put(buffers, _DONE, stop)
+
+
+def _put(buffers: queue.Queue, item, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            buffers.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+class OllamaOCRClient:
+    """Pooled, retrying client for one Ollama server and vision model."""
+
+    def __init__(
+        self,
+        url: str,
+        model: str,
+        timeout: int = 120,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = _PAGE_RETRIES,
+    ):
+        self.endpoint = f"{url.rstrip('/')}/api/generate"
+        self.model = model
+        self.timeout = timeout
+        self.concurrency = max(1, concurrency)
+        self.retries = retries
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def from_settings(cls, ocr_settings: Dict) -> "OllamaOCRClient":
+        return cls(
+            ocr_settings["ollama_url"],
+            ocr_settings["ollama_model"],
+            timeout=ocr_settings["ollama_timeout"],
+            concurrency=ocr_settings.get("ollama_concurrency") or DEFAULT_CONCURRENCY,
+        )
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self) -> "OllamaOCRClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def extract_text(self, jpeg: bytes) -> str:
+        """Text of one JPEG image; retries transient failures, then raises."""
+        payload = {
+            "model": self.model,
+            "prompt": OCR_PROMPT,
+            "images": [base64.b64encode(jpeg).decode()],
+            "stream": False,
+        }
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.post(self.endpoint, json=payload, timeout=self.timeout)
+                response.raise_for_status()
+                return response.json().get("response", "").strip()
+            except requests.RequestException as e:
+                if attempt == self.retries or not _is_retryable(e):
+                    raise
+                time.sleep(_RETRY_BACKOFF_SECONDS * 2**attempt)
+        return ""
+
+    def extract_pages(
+        self,
+        pages: Iterable[Tuple[int, bytes]],
+        on_page: Optional[Callable[[int], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Dict[int, str]:
+        """
+        Recognize ``(page index, JPEG)`` pairs and return text by page index.
+
+        ``pages`` is consumed on a background thread, so a lazy renderer
+        (``render_pdf_pages``) overlaps with recognition; it must not be
+        touched by the caller until this returns. That thread has exited by
+        the time this returns or raises (it stops after the page it is
+        rendering), so the caller may then close the document it reads.
+        ``on_page`` is called on the calling thread with the number of pages
+        done, and ``cancelled`` is checked there at least every
+        ``_CANCEL_POLL_SECONDS``; a cancel does not wait for requests in flight.
+        """
+        buffers: queue.Queue = queue.Queue(maxsize=self.concurrency * 2)
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=_render_into, args=(pages, buffers, stop), name="fac-ocr-render", daemon=True
+        )
+        producer.start()
+
+        texts: Dict[int, str] = {}
+        in_flight = set()
+        rendering = True
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="fac-ocr")
+        try:
+            while rendering or in_flight:
+                if cancelled and cancelled():
+                    raise OCRCancelled(len(texts))
+
+                while rendering and len(in_flight) < self.concurrency:
+                    item = buffers.get()
+                    if item is _DONE:
+                        rendering = False
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        in_flight.add(pool.submit(self._extract_page, *item))
+
+                if not in_flight:
+                    continue
+                finished, in_flight = wait(
+                    in_flight, timeout=_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED
+                )
+                for future in finished:
+                    page_num, text = future.result()
+                    texts[page_num] = text
+                    if on_page:
+                        on_page(len(texts))
+        finally:
+            # Requests still running are abandoned; their results are never read
+            pool.shutdown(wait=False, cancel_futures=True)
+            stop.set()
+            # No timeout: PyMuPDF is not thread-safe, and the caller closes the
+            # document as soon as this returns
+            producer.join()
+        return texts
+
+    def _extract_page(self, page_num: int, jpeg: bytes) -> Tuple[int, str]:
+        return page_num, self.extract_text(jpeg)
+
+
+def _is_retryable(error: requests.RequestException) -> bool:
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(error, "response", None)
+    return response is not None and response.status_code in _RETRY_STATUSES
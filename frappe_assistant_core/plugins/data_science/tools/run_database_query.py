@@ -23,7 +23,6 @@ import re
 from typing import Any, Dict, List
 
 import frappe
-import pandas as pd
 from frappe import _
 
 from frappe_assistant_core.core.base_tool import BaseTool
@@ -220,6 +219,8 @@ class QueryAndAnalyse(BaseTool):
             return {"message": "No data returned from query"}
 
         try:
+            import pandas as pd
+
             df = pd.DataFrame(data)
 
             analysis = {
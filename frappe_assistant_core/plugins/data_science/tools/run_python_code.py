@@ -19,6 +19,7 @@ Python Code Execution Tool for Data Science Plugin.
 Executes Python code safely in a restricted environment.
 """
 
+import importlib.util
 import sys
 from typing import Any, Dict
 
@@ -26,6 +27,7 @@ import frappe
 from frappe import _
 
 from frappe_assistant_core.core.base_tool import BaseTool
+from frappe_assistant_core.utils import metrics
 
 
 class ExecutePythonCode(BaseTool):
@@ -41,6 +43,7 @@ class ExecutePythonCode(BaseTool):
     def __init__(self):
         super().__init__()
         self.name = "run_python_code"
+        self.optional_dependencies = ["pandas", "numpy"]
 
         # Check library availability at initialization time
         self.library_status = self._check_library_availability()
@@ -87,24 +90,10 @@ class ExecutePythonCode(BaseTool):
         }
 
     def _check_library_availability(self) -> Dict[str, bool]:
-        """Check which data science libraries are available at initialization"""
-        libraries = {}
-
-        try:
-            import pandas
-
-            libraries["pandas"] = True
-        except ImportError:
-            libraries["pandas"] = False
-
-        try:
-            import numpy
-
-            libraries["numpy"] = True
-        except ImportError:
-            libraries["numpy"] = False
-
-        return libraries
+        """Check which data science libraries are installed, without importing them"""
+        return {
+            library: importlib.util.find_spec(library) is not None for library in self.optional_dependencies
+        }
 
     def _get_dynamic_description(self) -> str:
         """Generate description based on library availability"""
@@ -266,22 +255,24 @@ PRE-LOADED: pd (pandas), np (numpy), frappe, math, datetime, json, re, statistic
         )
 
         # Spawn isolated subprocess
-        # nosemgrep: frappe-subprocess-exec — static argv ([sys.executable, "-m", <fixed module>]), shell=False; user code is passed as JSON over stdin, never as an argument
-        proc = subprocess.Popen(
-            [sys.executable, "-m", "frappe_assistant_core.utils.code_execution_subprocess"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with metrics.timer("fac_subprocess_spawn_seconds", {"kind": "code"}):
+            # nosemgrep: frappe-subprocess-exec — static argv ([sys.executable, "-m", <fixed module>]), shell=False; user code is passed as JSON over stdin, never as an argument
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "frappe_assistant_core.utils.code_execution_subprocess"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
         # Give the child extra grace time beyond its own SIGALRM to report errors
         parent_timeout = effective_timeout + 10
 
         try:
-            stdout, stderr = proc.communicate(
-                input=request_data.encode("utf-8"),
-                timeout=parent_timeout,
-            )
+            with metrics.timer("fac_subprocess_duration_seconds", {"kind": "code"}):
+                stdout, stderr = proc.communicate(
+                    input=request_data.encode("utf-8"),
+                    timeout=parent_timeout,
+                )
         except subprocess.TimeoutExpired:
             proc.kill()
             proc.wait()
@@ -0,0 +1,217 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Streaming spreadsheet profiles for extract_file_content.
+
+A profile is what the tool returns for CSV and Excel files: columns, row
+count, per-column types and null counts, and the first ``sample_rows``
+rows. It is computed in one pass with bounded memory:
+
+* CSV: the encoding is sniffed from the start of the file, then the file is
+  read in ``chunk_rows`` chunks and each chunk's stats are merged.
+* XLSX: sheets are iterated row by row with openpyxl in read-only mode.
+
+Column types use pandas dtype names. When chunks or rows disagree, integer
+and float merge to float64 and anything else merges to object.
+"""
+
+import codecs
+import datetime
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+DEFAULT_SAMPLE_ROWS = 10
+_CHUNK_ROWS = 50_000
+_SNIFF_BYTES = 64 * 1024
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
+@dataclass
+class SheetProfile:
+    columns: List[str]
+    sample: Any  # pandas.DataFrame of the first sample_rows rows
+    row_count: int = 0
+    data_types: Dict[str, str] = field(default_factory=dict)
+    null_counts: Dict[str, int] = field(default_factory=dict)
+    encoding: Optional[str] = None
+
+    def add_types(self, types: Dict[str, str]):
+        for column, dtype in types.items():
+            self.data_types[column] = merge_dtype(self.data_types.get(column), dtype)
+
+    def add_nulls(self, nulls: Dict[str, int]):
+        for column, count in nulls.items():
+            self.null_counts[column] = self.null_counts.get(column, 0) + count
+
+
+def merge_dtype(current: Optional[str], new: Optional[str]) -> Optional[str]:
+    if current is None or current == new:
+        return new
+    if new is None:
+        return current
+    numeric = ("int64", "float64")
+    if current in numeric and new in numeric:
+        return "float64"
+    return "object"
+
+
+def sniff_encoding(head: bytes) -> str:
+    """utf-8 (with or without BOM) when the sample decodes as UTF-8, otherwise latin-1."""
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # Incremental decode: a character cut off at the end of the sample is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def is_xlsx(head: bytes) -> bool:
+    """XLSX files are zip archives; legacy .xls files are not."""
+    return head.startswith(_ZIP_MAGIC)
+
+
+def profile_csv(
+    open_stream: Callable[[], BinaryIO],
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    chunk_rows: int = _CHUNK_ROWS,
+) -> SheetProfile:
+    """
+    Profile a CSV file in chunks. ``open_stream`` returns a new stream
+    positioned at the start; it is called again if the sniffed UTF-8 turns
+    out to be wrong further into the file, to re-read it as latin-1.
+    """
+    with open_stream() as stream:
+        encoding = sniff_encoding(stream.read(_SNIFF_BYTES))
+    try:
+        return _profile_csv_chunks(open_stream, encoding, sample_rows, chunk_rows)
+    except UnicodeDecodeError:
+        if encoding == "latin-1":
+            raise
+        return _profile_csv_chunks(open_stream, "latin-1", sample_rows, chunk_rows)
+
+
+def _profile_csv_chunks(open_stream, encoding, sample_rows, chunk_rows) -> SheetProfile:
+    import pandas as pd
+
+    profile = None
+    with open_stream() as stream:
+        for chunk in pd.read_csv(stream, encoding=encoding, chunksize=chunk_rows):
+            if profile is None:
+                profile = SheetProfile(
+                    columns=[str(c) for c in chunk.columns], sample=chunk.head(sample_rows)
+                )
+            profile.row_count += len(chunk)
+            profile.add_types({str(c): str(dtype) for c, dtype in chunk.dtypes.items()})
+            profile.add_nulls({str(c): int(n) for c, n in chunk.isna().sum().items()})
+
+    if profile is None:
+        # Header only: read_csv yields no chunks
+        with open_stream() as stream:
+            empty = pd.read_csv(stream, encoding=encoding, nrows=0)
+        profile = SheetProfile(columns=[str(c) for c in empty.columns], sample=empty)
+    profile.encoding = encoding
+    return profile
+
+
+def _value_dtype(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int64"
+    if isinstance(value, float):
+        return "float64"
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return "datetime64[ns]"
+    return "object"
+
+
+def _dedup_columns(names: List[str]) -> List[str]:
+    """Rename repeated headers the way pandas does: ``a``, ``a.1``, ``a.2``."""
+    counts: Dict[str, int] = {}
+    deduped = []
+    for name in names:
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        deduped.append(name)
+        counts[name] = count + 1
+    return deduped
+
+
+def profile_xlsx(stream: BinaryIO, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> Dict[str, SheetProfile]:
+    """Profile every sheet of an XLSX workbook, keyed by sheet name."""
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        profiles = {}
+        for sheet in workbook.worksheets:
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            columns = _dedup_columns(
+                [str(h) if h is not None else f"Unnamed: {i}" for i, h in enumerate(header)]
+            )
+
+            sample = []
+            profile = SheetProfile(columns=columns, sample=None)
+            nulls = dict.fromkeys(columns, 0)
+            # Empty rows count only when a non-empty row follows (pandas trims trailing ones)
+            pending_empty = 0
+            for row in rows:
+                if all(value is None for value in row):
+                    pending_empty += 1
+                    continue
+                profile.row_count += pending_empty + 1
+                for column in columns:
+                    nulls[column] += pending_empty
+                while pending_empty and len(sample) < sample_rows:
+                    sample.append((None,) * len(columns))
+                    pending_empty -= 1
+                pending_empty = 0
+
+                if len(sample) < sample_rows:
+                    sample.append(tuple(row[: len(columns)]) + (None,) * (len(columns) - len(row)))
+                for column, value in zip(columns, row):
+                    if value is None:
+                        nulls[column] += 1
+                    else:
+                        profile.data_types[column] = merge_dtype(
+                            profile.data_types.get(column), _value_dtype(value)
+                        )
+                for column in columns[len(row) :]:
+                    nulls[column] += 1
+
+            profile.null_counts = nulls
+            for column in columns:
+                # As in pandas: no values is all-NaN float64, and NaN widens int to float, bool to object
+                dtype = profile.data_types.get(column)
+                if dtype is None or (dtype == "int64" and nulls[column]):
+                    profile.data_types[column] = "float64"
+                elif dtype == "bool" and nulls[column]:
+                    profile.data_types[column] = "object"
+            profile.sample = pd.DataFrame(sample, columns=columns)
+            profiles[sheet.title] = profile
+        return profiles
+    finally:
+        workbook.close()
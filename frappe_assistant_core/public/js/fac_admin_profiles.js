@@ -0,0 +1,147 @@
+// fac_admin_profiles.js
+// Tool profile browser for FAC Admin page.
+
+(function() {
+    const ns = frappe.fac_admin;
+
+    // Load recent tool profiles
+    ns.loadProfilesView = function() {
+        $('#profiles-list').html(ns.skeletonCards(3));
+        frappe.call({
+            method: "frappe_assistant_core.api.admin_api.get_tool_profiles",
+            callback: function(response) {
+                if (response.message && response.message.success) {
+                    ns.state.profilesData = response.message.profiles;
+                    ns.renderProfilesList();
+                } else {
+                    $('#profiles-list').html(
+                        '<div style="padding:20px;text-align:center;color:var(--red-500);">Failed to load profiles</div>'
+                    );
+                }
+            },
+            error: function() {
+                $('#profiles-list').html(
+                    '<div style="padding:20px;text-align:center;color:var(--red-500);">Error loading profiles</div>'
+                );
+            }
+        });
+    };
+
+    // Render profiles list
+    ns.renderProfilesList = function() {
+        const searchTerm = $('#profile-search').val().toLowerCase();
+        const filtered = ns.state.profilesData.filter(p =>
+            !searchTerm || (p.tool_name || '').toLowerCase().includes(searchTerm) ||
+            (p.user || '').toLowerCase().includes(searchTerm)
+        );
+
+        if (filtered.length === 0) {
+            $('#profiles-list').html(`
+                <div class="fac-empty-state">
+                    <i class="fa fa-tachometer" aria-hidden="true"></i>
+                    <div class="fac-empty-title">No tool profiles</div>
+                    <div class="fac-empty-subtitle">Enable Tool Profiling in Assistant Core Settings &gt; Security to capture profiles.</div>
+                </div>
+            `);
+            return;
+        }
+
+        const html = filtered.map(p => {
+            const dbShare = p.wall_time ? Math.round(100 * (p.db_time || 0) / p.wall_time) : 0;
+            return `
+            <div class="fac-item-card" data-name="${p.name}">
+                <div class="fac-item-header">
+                    <div class="fac-item-title">${frappe.utils.escape_html(p.tool_name || '')}</div>
+                    <div class="fac-item-actions">
+                        <button class="fac-tool-settings-btn fac-profile-view-btn"
+                                data-name="${p.name}"
+                                aria-label="Show hot spots for ${frappe.utils.escape_html(p.tool_name || '')}"
+                                title="Show hot spots">
+                            <i class="fa fa-fire" aria-hidden="true"></i>
+                        </button>
+                        ${p.audit_log ? `<a href="/app/assistant-audit-log/${encodeURIComponent(p.audit_log)}" target="_blank"
+                           class="fac-tool-settings-btn" aria-label="Open audit log entry" title="Open audit log entry">
+                            <i class="fa fa-history" aria-hidden="true"></i>
+                        </a>` : ''}
+                    </div>
+                </div>
+                <div class="fac-item-meta">
+                    <span class="fac-meta-chip"><i class="fa fa-user"></i> ${frappe.utils.escape_html(p.user || '')}</span>
+                    <span class="fac-meta-chip"><i class="fa fa-clock-o"></i> ${(p.wall_time || 0).toFixed(3)}s</span>
+                    <span class="fac-meta-chip"><i class="fa fa-database"></i> ${p.query_count || 0} queries, ${(p.db_time || 0).toFixed(3)}s (${dbShare}%)</span>
+                    <span class="fac-meta-chip">${p.sample_count || 0} samples</span>
+                    <span class="fac-meta-chip">${p.started_at ? frappe.datetime.str_to_user(p.started_at) : ''}</span>
+                </div>
+                <div class="fac-expand-panel" id="profile-detail-${p.name}"></div>
+            </div>`;
+        }).join('');
+
+        $('#profiles-list').html(html);
+
+        $('.fac-profile-view-btn').off('click').on('click', function() {
+            ns.showProfileDetail($(this).data('name'));
+        });
+    };
+
+    function framesTable(rows) {
+        if (!rows || rows.length === 0) {
+            return '<em style="color:var(--text-muted);">No samples</em>';
+        }
+        return `<table><thead><tr><th>Frame</th><th>Samples</th><th>%</th></tr></thead><tbody>${
+            rows.map(r => `<tr><td><code>${frappe.utils.escape_html(r.frame)}</code></td><td>${r.samples}</td><td>${r.percent}</td></tr>`).join('')
+        }</tbody></table>`;
+    }
+
+    // Show hot spots and collapsed stacks for a profile
+    ns.showProfileDetail = function(name) {
+        const panel = $(`#profile-detail-${name}`);
+        const btn = $(`.fac-profile-view-btn[data-name="${name}"]`);
+
+        if (panel.hasClass('open')) {
+            panel.removeClass('open');
+            btn.removeClass('active');
+            return;
+        }
+
+        panel.addClass('open').html(
+            '<div style="color:var(--text-muted);font-size:12px;"><i class="fa fa-spinner fa-spin"></i> Loading profile...</div>'
+        );
+        btn.addClass('active');
+
+        frappe.call({
+            method: "frappe_assistant_core.api.admin_api.get_tool_profile",
+            args: { name: name },
+            callback: function(response) {
+                if (!(response.message && response.message.success)) {
+                    panel.html(`<div style="color:var(--red-500);">${frappe.utils.escape_html(response.message?.error || 'Failed to load profile')}</div>`);
+                    return;
+                }
+                const d = response.message;
+                panel.html(`
+                    <div style="margin-bottom:10px;display:flex;align-items:center;gap:16px;flex-wrap:wrap;">
+                        <span><strong style="font-size:11px;color:var(--text-muted);text-transform:uppercase;">Interval:</strong> ${d.profile.sample_interval_ms} ms</span>
+                        <button type="button" class="btn btn-xs btn-default fac-profile-download">
+                            <i class="fa fa-download" aria-hidden="true"></i> Collapsed stacks
+                        </button>
+                        <a href="/app/assistant-tool-profile/${encodeURIComponent(name)}" target="_blank">Open profile</a>
+                    </div>
+                    <div style="font-size:11px;color:var(--text-muted);text-transform:uppercase;margin-bottom:4px;">Self time</div>
+                    ${framesTable(d.summary.self)}
+                    <div style="font-size:11px;color:var(--text-muted);text-transform:uppercase;margin:10px 0 4px;">Total time</div>
+                    ${framesTable(d.summary.total)}
+                `);
+                panel.find('.fac-profile-download').on('click', function() {
+                    const blob = new Blob([d.profile.collapsed_stacks || ''], { type: 'text/plain' });
+                    const link = document.createElement('a');
+                    link.href = URL.createObjectURL(blob);
+                    link.download = `${d.profile.tool_name}-${name}.folded`;
+                    link.click();
+                    URL.revokeObjectURL(link.href);
+                });
+            },
+            error: function() {
+                panel.html('<div style="color:var(--red-500);">Error loading profile</div>');
+            }
+        });
+    };
+})();
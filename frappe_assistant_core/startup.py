@@ -31,8 +31,9 @@ def startup():
         initialize_plugin_system()
 
         # Initialize assistant server if enabled
-        settings = frappe.get_single("Assistant Core Settings")
-        if settings and settings.server_enabled:
+        from frappe_assistant_core.utils.settings import get_assistant_settings
+
+        if get_assistant_settings().server_enabled:
             from frappe_assistant_core.assistant_core.server import start_server
 
             start_server()
@@ -0,0 +1,69 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the worker-local Assistant Core Settings snapshot.
+"""
+
+from unittest.mock import patch
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils import settings as settings_module
+from frappe_assistant_core.utils.settings import AssistantSettings, get_assistant_settings
+
+
+class TestAssistantSettingsSnapshot(BaseAssistantTest):
+    """get_assistant_settings() caching and invalidation."""
+
+    def test_warm_read_does_not_query_database(self):
+        get_assistant_settings()
+
+        with patch.object(
+            settings_module, "_load_settings", side_effect=AssertionError("warm read must not reload")
+        ):
+            self.assertIsInstance(get_assistant_settings(), AssistantSettings)
+
+    def test_save_refreshes_snapshot(self):
+        doc = frappe.get_single("Assistant Core Settings")
+        original = doc.skill_mode
+        new_mode = "replace" if original != "replace" else "supplementary"
+
+        get_assistant_settings()
+        doc.skill_mode = new_mode
+        doc.save(ignore_permissions=True)
+
+        try:
+            self.assertEqual(get_assistant_settings().skill_mode, new_mode)
+        finally:
+            doc.skill_mode = original
+            doc.save(ignore_permissions=True)
+
+    def test_values_are_typed_and_blank_uses_default(self):
+        snapshot = AssistantSettings.from_values(
+            {
+                "server_enabled": "0",
+                "code_execution_timeout": "45",
+                "ollama_api_url": "",
+                "audit_log_retention_days": "0",
+            }
+        )
+
+        self.assertIs(snapshot.server_enabled, False)
+        self.assertEqual(snapshot.code_execution_timeout, 45)
+        self.assertEqual(snapshot.ollama_api_url, "http://localhost:11434")
+        self.assertEqual(snapshot.audit_log_retention_days, 0)
@@ -15,15 +15,19 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 """
-Tests for Assistant Audit Log status classification and field capture.
+Tests for Assistant Audit Log status classification, field capture and
+hourly rollups.
 
 These tests exercise BaseTool._safe_execute directly via a minimal in-memory
 tool subclass, so they do not depend on any specific plugin being loaded.
 """
 
+from datetime import timedelta
 from typing import Any, Dict
+from unittest.mock import patch
 
 import frappe
+from frappe.utils import now_datetime
 
 from frappe_assistant_core.core.base_tool import BaseTool
 from frappe_assistant_core.tests.base_test import BaseAssistantTest
@@ -285,3 +289,154 @@ class TestSensitiveKeyMatcher(BaseAssistantTest):
         # Defensive: integer/None keys must not crash the matcher.
         self.assertFalse(_is_sensitive_key(None))
         self.assertFalse(_is_sensitive_key(42))
+
+
+class TestAuditRollup(BaseAssistantTest):
+    """Rollup-backed stats must match a direct count of the audit rows."""
+
+    _TOOL = "test_audit_rollup_tool"
+
+    def setUp(self):
+        super().setUp()
+        _delete_test_rows(self._TOOL)
+        frappe.db.delete("Assistant Audit Rollup", {"tool_name": self._TOOL})
+        self.hour = now_datetime().replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+
+    def _insert(self, status, execution_time, creation):
+        doc = frappe.get_doc(
+            {
+                "doctype": "Assistant Audit Log",
+                "action": "tool_call",
+                "tool_name": self._TOOL,
+                "status": status,
+                "execution_time": execution_time,
+            }
+        ).insert(ignore_permissions=True)
+        frappe.db.set_value("Assistant Audit Log", doc.name, "creation", creation, update_modified=False)
+
+    def test_rollup_and_live_tail_are_combined(self):
+        from frappe_assistant_core.utils import audit_rollup
+
+        self._insert("Success", 1.0, self.hour + timedelta(minutes=5))
+        self._insert("Success", 3.0, self.hour + timedelta(minutes=10))
+        self._insert("Error", None, self.hour + timedelta(minutes=15))
+        self._insert("Success", 2.0, now_datetime())
+
+        watermark = self.hour + timedelta(hours=1)
+        audit_rollup._rollup_hour(self.hour, watermark)
+        with patch.object(audit_rollup, "get_rollup_watermark", return_value=watermark):
+            stats = audit_rollup.get_tool_stats(self.hour)[self._TOOL]
+
+        self.assertEqual(stats["count"], 4)
+        self.assertEqual(stats["timed_count"], 3)
+        self.assertAlmostEqual(stats["total_execution_time"], 6.0)
+        self.assertAlmostEqual(stats["max_execution_time"], 3.0)
+
+    def test_rollup_hour_is_idempotent(self):
+        from frappe_assistant_core.utils import audit_rollup
+
+        self._insert("Success", 1.0, self.hour + timedelta(minutes=5))
+        self._insert("Error", 0.5, self.hour + timedelta(minutes=6))
+
+        audit_rollup._rollup_hour(self.hour, self.hour + timedelta(hours=1))
+        audit_rollup._rollup_hour(self.hour, self.hour + timedelta(hours=1))
+
+        rows = frappe.get_all(
+            "Assistant Audit Rollup", filters={"tool_name": self._TOOL}, fields=["status", "call_count"]
+        )
+        self.assertEqual(sorted((r.status, r.call_count) for r in rows), [("Error", 1), ("Success", 1)])
+
+    def test_rollups_follow_audit_retention(self):
+        from frappe_assistant_core.utils import audit_rollup
+
+        old_hour = self.hour - timedelta(days=10)
+        self._insert("Success", 1.0, old_hour + timedelta(minutes=5))
+        self._insert("Success", 1.0, self.hour + timedelta(minutes=5))
+        audit_rollup._rollup_hour(old_hour, old_hour + timedelta(hours=1))
+        audit_rollup._rollup_hour(self.hour, self.hour + timedelta(hours=1))
+
+        result = audit_rollup.purge_audit_rollups(days_to_keep=5)
+
+        self.assertTrue(result["complete"])
+        self.assertGreaterEqual(result["deleted"], 1)
+        periods = frappe.get_all(
+            "Assistant Audit Rollup", filters={"tool_name": self._TOOL}, pluck="period_start"
+        )
+        self.assertEqual(periods, [self.hour])
+
+
+class TestAuditRetention(BaseAssistantTest):
+    """Chunked retention must delete only expired rows, across batches."""
+
+    _TOOL = "test_audit_retention_tool"
+
+    def setUp(self):
+        super().setUp()
+        _delete_test_rows(self._TOOL)
+        # Rows here are backdated, so a watermark left by an earlier run could skip them
+        self._clear_payload_watermark()
+
+    def _clear_payload_watermark(self):
+        from frappe_assistant_core.utils import audit_retention
+
+        frappe.defaults.clear_default(audit_retention._PAYLOAD_WATERMARK_KEY, parent="__global")
+
+    def _insert(self, days_old, **payload):
+        doc = frappe.get_doc(
+            {
+                "doctype": "Assistant Audit Log",
+                "action": "tool_call",
+                "tool_name": self._TOOL,
+                "status": "Success",
+                **payload,
+            }
+        ).insert(ignore_permissions=True)
+        frappe.db.set_value(
+            "Assistant Audit Log",
+            doc.name,
+            "creation",
+            now_datetime() - timedelta(days=days_old),
+            update_modified=False,
+        )
+        return doc.name
+
+    def test_expired_rows_are_deleted_in_batches(self):
+        from frappe_assistant_core.utils import audit_retention
+
+        expired = [self._insert(40) for _ in range(5)]
+        kept = self._insert(5)
+
+        with patch.object(audit_retention, "BATCH_SIZE", 2), patch.object(
+            audit_retention, "BATCH_PAUSE_SECONDS", 0
+        ):
+            result = audit_retention.purge_audit_logs(30)
+
+        self.assertTrue(result["complete"])
+        self.assertGreaterEqual(result["deleted"], len(expired))
+        self.assertFalse(frappe.db.exists("Assistant Audit Log", {"name": ("in", expired)}))
+        self.assertTrue(frappe.db.exists("Assistant Audit Log", kept))
+
+    def test_payloads_cleared_before_rows_expire(self):
+        from frappe_assistant_core.utils import audit_retention
+
+        old = self._insert(10, input_data='{"a": 1}', output_data='{"b": 2}')
+        recent = self._insert(1, input_data='{"a": 1}')
+
+        audit_retention.purge_audit_logs(30, payload_days_to_keep=7)
+
+        self.assertIsNone(frappe.db.get_value("Assistant Audit Log", old, "input_data"))
+        self.assertIsNone(frappe.db.get_value("Assistant Audit Log", old, "output_data"))
+        self.assertEqual(frappe.db.get_value("Assistant Audit Log", recent, "input_data"), '{"a": 1}')
+
+    def test_payload_pass_starts_without_watermark(self):
+        from frappe_assistant_core.utils import audit_retention
+
+        self._clear_payload_watermark()
+        self.assertIsNone(frappe.db.get_global(audit_retention._PAYLOAD_WATERMARK_KEY))
+        old = self._insert(10, input_data='{"a": 1}')
+
+        result = audit_retention.purge_audit_logs(30, payload_days_to_keep=7)
+
+        self.assertGreaterEqual(result["payloads_cleared"], 1)
+        self.assertIsNone(frappe.db.get_value("Assistant Audit Log", old, "input_data"))
+        self.assertTrue(frappe.db.get_global(audit_retention._PAYLOAD_WATERMARK_KEY))
@@ -0,0 +1,79 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for generation-counter cache families in utils/cache.py.
+"""
+
+from unittest.mock import patch
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils import cache as cache_module
+from frappe_assistant_core.utils.cache import invalidate_cache_family, versioned_cache
+
+_FAMILY = "test_family"
+_calls = []
+
+
+@versioned_cache(_FAMILY, ttl=60)
+def _cached_counter():
+    _calls.append(1)
+    return len(_calls)
+
+
+class TestVersionedCache(BaseAssistantTest):
+    """Family invalidation, including coalesced invalidation."""
+
+    def setUp(self):
+        super().setUp()
+        _calls.clear()
+        frappe.cache.delete(cache_module._gate_key(_FAMILY))
+        frappe.cache.delete(cache_module._pending_key(_FAMILY))
+
+    def test_invalidation_bumps_generation(self):
+        first = _cached_counter()
+        self.assertEqual(_cached_counter(), first)
+
+        invalidate_cache_family(_FAMILY)
+
+        self.assertEqual(_cached_counter(), first + 1)
+
+    def test_coalesced_invalidation_is_applied_after_window(self):
+        invalidate_cache_family(_FAMILY, coalesce_seconds=30)
+        first = _cached_counter()
+
+        # Suppressed: inside the window the cached value is still served
+        invalidate_cache_family(_FAMILY, coalesce_seconds=30)
+        self.assertEqual(_cached_counter(), first)
+
+        # Window ends: the next reader applies the pending invalidation
+        frappe.cache.delete(cache_module._gate_key(_FAMILY))
+        self.assertEqual(_cached_counter(), first + 1)
+
+    def test_audit_insert_does_not_pattern_delete(self):
+        with patch.object(frappe.cache, "delete_keys", side_effect=AssertionError("pattern delete")):
+            cache_module.invalidate_dashboard_cache()
+
+    def test_generation_survives_settings_cache_clear(self):
+        invalidate_cache_family(_FAMILY)
+        version = cache_module.get_cache_version(_FAMILY)
+
+        # What saving Assistant Core Settings from the admin API deletes
+        frappe.cache.delete_keys("assistant_*")
+
+        self.assertEqual(cache_module.get_cache_version(_FAMILY), version)
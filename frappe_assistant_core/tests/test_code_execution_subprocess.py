@@ -0,0 +1,81 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the run_python_code subprocess entry point, run in-process.
+"""
+
+import io
+import json
+import os
+from contextlib import ExitStack, redirect_stdout
+from unittest.mock import patch
+
+import frappe
+
+from frappe_assistant_core.plugins.core.tools.report_tools import ReportTools
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils import code_execution_subprocess
+
+_MARKER = "run_python_code prepared report test"
+
+
+def _queue_prepared_report(report_name, filters, format="json"):
+    # What the prepared-report path writes before polling: a new row, then a commit
+    frappe.get_doc({"doctype": "ToDo", "description": _MARKER}).insert(ignore_permissions=True)
+    frappe.db.commit()
+    return {"success": True, "report_name": report_name, "data": [], "status": "completed"}
+
+
+class TestCodeExecutionSubprocess(BaseAssistantTest):
+    """The sandbox keeps the tools API able to write (prepared reports)."""
+
+    def tearDown(self):
+        frappe.db.delete("ToDo", {"description": _MARKER})
+        frappe.db.commit()
+        super().tearDown()
+
+    def _run(self, code, return_variables=()):
+        request = {
+            "code": code,
+            "user": "Administrator",
+            "site": frappe.local.site,
+            "sites_path": os.getcwd(),
+            "return_variables": list(return_variables),
+        }
+        stdout = io.StringIO()
+        with ExitStack() as stack:
+            # Already initialised and connected; limits would apply to the test runner
+            for name in ("init", "connect", "destroy"):
+                stack.enter_context(patch.object(frappe, name))
+            stack.enter_context(patch.object(code_execution_subprocess, "_apply_limits"))
+            stack.enter_context(patch("sys.stdin", io.StringIO(json.dumps(request))))
+            stack.enter_context(redirect_stdout(stdout))
+            code_execution_subprocess.main()
+        return json.loads(stdout.getvalue())
+
+    def test_prepared_report_can_be_queued(self):
+        with patch.object(ReportTools, "execute_report", side_effect=_queue_prepared_report):
+            result = self._run('report = tools.generate_report("Stock Balance")', ["report"])
+
+        self.assertTrue(result["success"], result)
+        self.assertTrue(result["variables"]["report"]["success"], result)
+        self.assertTrue(frappe.db.exists("ToDo", {"description": _MARKER}))
+
+    def test_db_global_stays_read_only(self):
+        result = self._run("db.sql(\"DELETE FROM `tabToDo` WHERE description = 'x'\")")
+
+        self.assertFalse(result["success"])
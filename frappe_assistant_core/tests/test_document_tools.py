@@ -368,6 +368,43 @@ class TestDocumentTools(BaseAssistantTest):
             # DoesNotExistError is acceptable
             pass
 
+    def test_get_document_field_projection_pages_child_rows(self):
+        """fields/child_tables return only the requested columns and page child rows by cursor"""
+        from frappe_assistant_core.plugins.core.tools.get_document import DocumentGet
+
+        arguments = {
+            "doctype": "User",
+            "name": "Administrator",
+            "fields": ["email"],
+            "child_tables": ["roles"],
+            "child_fields": {"roles": ["role"]},
+            "child_row_limit": 1,
+        }
+        result = DocumentGet().execute(arguments)
+
+        self.assertTrue(result.get("success"), result)
+        self.assertEqual(set(result["data"]), {"name", "email", "doctype", "roles"})
+        self.assertEqual(len(result["data"]["roles"]), 1)
+        self.assertEqual(set(result["data"]["roles"][0]), {"role", "name", "idx", "doctype"})
+
+        page = result["child_tables"]["roles"]
+        if not page["has_more"]:
+            self.skipTest("Administrator has a single role")
+        next_result = DocumentGet().execute(dict(arguments, child_cursors={"roles": page["next_cursor"]}))
+        self.assertTrue(next_result.get("success"), next_result)
+        self.assertGreater(next_result["data"]["roles"][0]["idx"], result["data"]["roles"][0]["idx"])
+
+    def test_get_document_unknown_projection_field(self):
+        """Unknown fields are reported instead of being silently dropped"""
+        from frappe_assistant_core.plugins.core.tools.get_document import DocumentGet
+
+        result = DocumentGet().execute(
+            {"doctype": "User", "name": "Administrator", "fields": ["no_such_field"]}
+        )
+
+        self.assertFalse(result.get("success"))
+        self.assertIn("no_such_field", result["error"])
+
     def test_update_document_no_permission(self):
         """Test document update without permission"""
         if not self.registry.has_tool("update_document"):
@@ -0,0 +1,87 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for streamed file access in extract_file_content.
+"""
+
+import io
+import os
+import tempfile
+
+from frappe_assistant_core.plugins.data_science.tools.extract_file_content import ExtractFileContent
+from frappe_assistant_core.plugins.data_science.tools.file_source import S3_RANGE_BYTES, FileSource, s3_source
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+
+
+class _FakeS3Client:
+    """Records ranged GETs against an in-memory object."""
+
+    def __init__(self, data):
+        self.data = data
+        self.ranges = []
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.data)}
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = (int(part) for part in Range[len("bytes=") :].split("-"))
+        self.ranges.append((start, end))
+        return {"Body": io.BytesIO(self.data[start : end + 1])}
+
+
+class TestFileSource(BaseAssistantTest):
+    """Local files are used in place; S3 objects are read by range."""
+
+    def setUp(self):
+        super().setUp()
+        handle, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "wb") as f:
+            f.write("naïve café\n".encode() * 1000)
+
+    def tearDown(self):
+        os.unlink(self.path)
+        super().tearDown()
+
+    def test_local_file_is_not_copied(self):
+        with FileSource.from_path(self.path) as source:
+            with source.local_path() as path:
+                self.assertEqual(path, self.path)
+            result = ExtractFileContent()._extract_text_content(source)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["encoding"], "utf-8")
+        self.assertTrue(result["content"].startswith("naïve café"))
+
+    def test_s3_reads_only_requested_ranges(self):
+        data = os.urandom(3 * S3_RANGE_BYTES + 10)
+        client = _FakeS3Client(data)
+
+        with s3_source(client, "bucket", "key", ".bin") as source:
+            stream = source.open()
+            stream.seek(-10, io.SEEK_END)
+            tail = stream.read()
+            stream.seek(S3_RANGE_BYTES + 5)
+            middle = stream.read(4)
+
+            self.assertEqual(tail, data[-10:])
+            self.assertEqual(middle, data[S3_RANGE_BYTES + 5 : S3_RANGE_BYTES + 9])
+            self.assertEqual(len(client.ranges), 2)
+
+            with source.local_path() as path:
+                with open(path, "rb") as f:
+                    self.assertEqual(f.read(), data)
+            self.assertFalse(os.path.exists(path))
@@ -0,0 +1,106 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the short-TTL MCP authentication cache.
+
+A validated credential must be served from cache on the next request (no
+token lookup), must never be stored in clear text, and must be dropped when
+the owning User is saved or the bearer token stops being Active.
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import frappe
+from frappe.utils import now_datetime
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils.auth import (
+    _auth_cache_key,
+    get_cached_auth,
+    invalidate_auth_cache,
+    set_cached_auth,
+)
+
+_TOKEN = "Bearer test-auth-cache-token"
+
+
+class TestMCPAuthCache(BaseAssistantTest):
+    """Cached bearer/API-key authentication for the MCP endpoint."""
+
+    def tearDown(self):
+        invalidate_auth_cache(frappe._dict(doctype="User", name="Administrator"))
+        super().tearDown()
+
+    def _make_request(self, auth_header):
+        request = MagicMock()
+        request.method = "POST"
+        request.headers = {"Authorization": auth_header}
+        return request
+
+    def test_cache_key_does_not_contain_credential(self):
+        self.assertNotIn("test-auth-cache-token", _auth_cache_key(_TOKEN))
+
+    def test_cached_credential_skips_token_lookup(self):
+        from frappe_assistant_core.api import fac_endpoint
+
+        set_cached_auth(_TOKEN, "Administrator", True, now_datetime() + timedelta(hours=1))
+        frappe.local.request = self._make_request(_TOKEN)
+
+        with patch.object(
+            fac_endpoint.frappe, "get_doc", side_effect=AssertionError("cache hit must not load the token")
+        ):
+            result = fac_endpoint._authenticate_mcp_request()
+
+        self.assertEqual(result, "Administrator")
+        self.assertTrue(frappe.local.fac_assistant_enabled)
+
+    def test_expired_credential_is_not_served(self):
+        set_cached_auth(_TOKEN, "Administrator", True, now_datetime() - timedelta(seconds=1))
+        self.assertIsNone(get_cached_auth(_TOKEN))
+
+    def test_user_save_invalidates_entries(self):
+        set_cached_auth(_TOKEN, "Administrator", True)
+        self.assertIsNotNone(get_cached_auth(_TOKEN))
+
+        invalidate_auth_cache(frappe.get_doc("User", "Administrator"))
+
+        self.assertIsNone(get_cached_auth(_TOKEN))
+
+    def test_revoked_token_is_not_served(self):
+        set_cached_auth(_TOKEN, "Administrator", True, now_datetime() + timedelta(hours=1), token_name="tok")
+
+        # The OAuth revoke endpoint flips the status with db.set_value (no doc events)
+        with patch.object(frappe.db, "get_value", return_value="Revoked") as get_value:
+            self.assertIsNone(get_cached_auth(_TOKEN))
+        get_value.assert_called_once_with("OAuth Bearer Token", "tok", "status")
+
+        with patch.object(frappe.db, "get_value", return_value="Active"):
+            self.assertIsNone(get_cached_auth(_TOKEN))
+
+    def test_revoked_token_is_not_served_when_cache_delete_fails(self):
+        set_cached_auth(_TOKEN, "Administrator", True, now_datetime() + timedelta(hours=1), token_name="tok")
+
+        with patch.object(frappe.db, "get_value", return_value="Revoked"):
+            with patch.object(frappe.cache, "delete_value", side_effect=ConnectionError("redis down")):
+                self.assertIsNone(get_cached_auth(_TOKEN))
+
+    def test_active_token_is_served(self):
+        set_cached_auth(_TOKEN, "Administrator", True, now_datetime() + timedelta(hours=1), token_name="tok")
+
+        with patch.object(frappe.db, "get_value", return_value="Active"):
+            self.assertEqual(get_cached_auth(_TOKEN)["user"], "Administrator")
@@ -0,0 +1,101 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for cached, compressed MCP list responses.
+
+tools/list is served from a per-worker serialized blob whose content hash is
+exposed as ``_meta["fac/listHash"]`` and an ETag, and bodies are gzip-encoded
+only when the client advertises support.
+"""
+
+import gzip
+import json
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+import frappe
+from werkzeug.wrappers import Response
+
+from frappe_assistant_core.mcp.server import MCPServer
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+
+
+def _make_request(request_id, headers=None):
+    payload = {"jsonrpc": "2.0", "id": request_id, "method": "tools/list", "params": {}}
+    request = MagicMock()
+    request.method = "POST"
+    request.headers = headers or {}
+    request.get_json.return_value = payload
+    request.get_data.return_value = json.dumps(payload)
+    return request
+
+
+def _registry():
+    return OrderedDict(
+        (
+            f"list_cache_tool_{i}",
+            {
+                "name": f"list_cache_tool_{i}",
+                "description": "List cache test tool " * 20,
+                "inputSchema": {"type": "object", "properties": {}},
+            },
+        )
+        for i in range(5)
+    )
+
+
+class TestMCPListCache(BaseAssistantTest):
+    """tools/list caching, conditional requests and compression."""
+
+    def _handle(self, server, request, registry):
+        frappe.local.request = request
+        return server.handle(request, Response(), tool_registry=registry)
+
+    def test_repeat_list_is_served_from_cache(self):
+        server = MCPServer("test")
+        registry = _registry()
+
+        first = json.loads(self._handle(server, _make_request(1), registry).get_data(as_text=True))
+        with patch.object(server, "_handle_tools_list", side_effect=AssertionError("must hit cache")):
+            second = json.loads(self._handle(server, _make_request(2), registry).get_data(as_text=True))
+
+        self.assertEqual(second["id"], 2)
+        self.assertEqual(first["result"], second["result"])
+        self.assertIn("fac/listHash", second["result"]["_meta"])
+
+    def test_matching_etag_returns_not_modified(self):
+        server = MCPServer("test")
+        registry = _registry()
+
+        response = self._handle(server, _make_request(1), registry)
+        etag = response.headers["ETag"]
+
+        cached = self._handle(server, _make_request(2, {"If-None-Match": etag}), registry)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.get_data(), b"")
+
+    def test_gzip_only_when_accepted(self):
+        server = MCPServer("test")
+        registry = _registry()
+
+        plain = self._handle(server, _make_request(1), registry)
+        self.assertNotIn("Content-Encoding", plain.headers)
+
+        compressed = self._handle(server, _make_request(2, {"Accept-Encoding": "gzip"}), registry)
+        self.assertEqual(compressed.headers["Content-Encoding"], "gzip")
+        body = json.loads(gzip.decompress(compressed.get_data()))
+        self.assertEqual(len(body["result"]["tools"]), 5)
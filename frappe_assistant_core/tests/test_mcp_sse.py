@@ -0,0 +1,114 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for tools/call answered as a Server-Sent-Events stream.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import frappe
+from werkzeug.wrappers import Response
+
+from frappe_assistant_core.mcp.server import MCPServer
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils.progress_streaming import get_progress_service, update_progress
+
+
+def _slow_tool():
+    for step in range(1, 4):
+        update_progress(progress_percent=step * 25, message=f"step {step}")
+    return "done"
+
+
+def _failing_tool():
+    update_progress(progress_percent=10, message="starting")
+    raise RuntimeError("boom")
+
+
+def _make_request(accept, meta=None, tool="sse_test_tool"):
+    params = {"name": tool, "arguments": {}}
+    if meta:
+        params["_meta"] = meta
+    payload = {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": params}
+    request = MagicMock()
+    request.method = "POST"
+    request.headers = {"Accept": accept}
+    request.get_json.return_value = payload
+    request.get_data.return_value = json.dumps(payload)
+    return request
+
+
+class TestMCPEventStream(BaseAssistantTest):
+    """Progress notifications precede the result on a streamed tools/call."""
+
+    def _handle(self, request):
+        frappe.local.request = request
+        registry = {
+            "sse_test_tool": {"name": "sse_test_tool", "fn": _slow_tool},
+            "sse_failing_tool": {"name": "sse_failing_tool", "fn": _failing_tool},
+        }
+        return MCPServer("test").handle(request, Response(), tool_registry=registry)
+
+    def _stream_messages(self, request):
+        response = self._handle(request)
+        self.assertEqual(response.mimetype, "text/event-stream")
+        return [
+            json.loads(line[len("data: ") :])
+            for event in response.response
+            for line in event.splitlines()
+            if line.startswith("data: ")
+        ]
+
+    def _latest_operation(self, tool):
+        operations = get_progress_service().get_user_operations(frappe.session.user)
+        return next(op for op in operations if op["operation_type"] == f"tools/call {tool}")
+
+    def test_progress_events_then_result(self):
+        request = _make_request("application/json, text/event-stream", {"progressToken": "tok-1"})
+
+        messages = self._stream_messages(request)
+        progress = [m["params"] for m in messages[:-1]]
+        self.assertEqual([p["progress"] for p in progress], [25, 50, 75, 100])
+        self.assertTrue(all(p["progressToken"] == "tok-1" for p in progress))
+        self.assertEqual(messages[-1]["id"], 7)
+        self.assertIn("done", messages[-1]["result"]["content"][0]["text"])
+
+    def test_finished_call_is_recorded_as_completed(self):
+        self._stream_messages(
+            _make_request("application/json, text/event-stream", {"progressToken": "tok-2"})
+        )
+
+        operation = self._latest_operation("sse_test_tool")
+        self.assertEqual(operation["status"], "completed")
+        self.assertFalse(get_progress_service().cancel_operation(operation["operation_id"]))
+
+    def test_failed_call_is_recorded_as_failed(self):
+        messages = self._stream_messages(
+            _make_request(
+                "application/json, text/event-stream", {"progressToken": "tok-3"}, tool="sse_failing_tool"
+            )
+        )
+
+        self.assertTrue(messages[-1]["result"]["isError"])
+        self.assertEqual(self._latest_operation("sse_failing_tool")["status"], "failed")
+
+    def test_plain_json_without_progress_token(self):
+        response = self._handle(_make_request("application/json, text/event-stream"))
+
+        self.assertNotEqual(response.mimetype, "text/event-stream")
+        self.assertEqual(json.loads(response.get_data(as_text=True))["id"], 7)
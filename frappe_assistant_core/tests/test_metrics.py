@@ -0,0 +1,85 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the Redis-aggregated metrics registry and the /metrics endpoint.
+"""
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils import metrics
+
+
+class TestMetricsRegistry(BaseAssistantTest):
+    """Counters and histograms rendered in Prometheus text format."""
+
+    def setUp(self):
+        super().setUp()
+        frappe.cache.delete(metrics._redis_key())
+
+    def test_histogram_renders_cumulative_buckets(self):
+        metrics.observe(
+            "fac_tool_call_duration_seconds", 0.3, {"tool": "t", "status": "Success", "plugin": "p"}
+        )
+        metrics.observe(
+            "fac_tool_call_duration_seconds", 3.0, {"tool": "t", "status": "Success", "plugin": "p"}
+        )
+
+        text = metrics.render_metrics()
+
+        self.assertIn("# TYPE fac_tool_call_duration_seconds histogram", text)
+        labels = 'plugin="p",status="Success",tool="t"'
+        self.assertIn(f'fac_tool_call_duration_seconds_bucket{{le="0.5",{labels}}} 1', text)
+        self.assertIn(f'fac_tool_call_duration_seconds_bucket{{le="5.0",{labels}}} 2', text)
+        self.assertIn(f"fac_tool_call_duration_seconds_count{{{labels}}} 2", text)
+
+    def test_counters_accumulate_across_flushes(self):
+        metrics.inc("fac_mcp_requests_total", {"method": "ping"})
+        metrics.flush()
+        metrics.inc("fac_mcp_requests_total", {"method": "ping"}, 2)
+
+        self.assertIn('fac_mcp_requests_total{method="ping"} 3', metrics.render_metrics())
+
+    def test_flushed_counter_is_rendered_from_redis(self):
+        metrics.inc("fac_cache_requests_total", {"family": "test", "result": "hit"})
+        metrics.flush()
+        self.assertFalse(metrics._pending.get(frappe.local.site))
+
+        self.assertIn('fac_cache_requests_total{family="test",result="hit"} 1', metrics.render_metrics())
+
+    def test_large_values_keep_full_precision(self):
+        metrics.inc("fac_mcp_requests_total", {"method": "big"}, 1234567)
+        metrics.observe(
+            "fac_tool_call_duration_seconds", 1234567.25, {"tool": "t", "status": "Success", "plugin": "p"}
+        )
+
+        text = metrics.render_metrics()
+
+        self.assertIn('fac_mcp_requests_total{method="big"} 1234567\n', text)
+        self.assertIn(
+            'fac_tool_call_duration_seconds_sum{plugin="p",status="Success",tool="t"} 1234567.25', text
+        )
+
+    def test_endpoint_requires_admin(self):
+        from frappe_assistant_core.api.metrics import metrics as metrics_endpoint
+
+        frappe.set_user("Guest")
+        try:
+            with self.enforce_only_for_checks(), self.assertRaises(frappe.PermissionError):
+                metrics_endpoint()
+        finally:
+            frappe.set_user("Administrator")
@@ -0,0 +1,135 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the concurrent Ollama OCR client against a local stand-in server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from frappe_assistant_core.plugins.data_science.tools.ollama_ocr import OCRCancelled, OllamaOCRClient
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+
+
+class _StandInOllama:
+    """Answers /api/generate with the request's image bytes as text."""
+
+    def __init__(self, delay=0.05, fail_first=()):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.failures = set(fail_first)
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                image = request["images"][0]
+                with stand_in.lock:
+                    stand_in.active += 1
+                    stand_in.max_active = max(stand_in.max_active, stand_in.active)
+                    fail = image in stand_in.failures
+                    stand_in.failures.discard(image)
+                time.sleep(delay)
+                with stand_in.lock:
+                    stand_in.active -= 1
+
+                status, body = (503, {}) if fail else (200, {"response": f"text {image}"})
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _pages(count):
+    # extract_text base64-encodes the JPEG; these bytes encode to "cGFnZS0w"...
+    return ((i, f"page-{i}".encode()) for i in range(count))
+
+
+class TestOllamaOCRClient(BaseAssistantTest):
+    """Concurrency, ordering, retries and cancellation."""
+
+    def setUp(self):
+        super().setUp()
+        self.stand_in = _StandInOllama(fail_first={"cGFnZS0z"})  # page-3 fails once
+
+    def tearDown(self):
+        self.stand_in.close()
+        super().tearDown()
+
+    def test_pages_are_recognized_concurrently_in_order(self):
+        done = []
+        with OllamaOCRClient(self.stand_in.url, "stand-in", timeout=5, concurrency=4) as client:
+            texts = client.extract_pages(_pages(12), on_page=done.append)
+
+        self.assertEqual(sorted(texts), list(range(12)))
+        self.assertEqual(texts[3], "text cGFnZS0z")  # retried after the 503
+        self.assertEqual(done, list(range(1, 13)))
+        self.assertGreater(self.stand_in.max_active, 1)
+        self.assertLessEqual(self.stand_in.max_active, 4)
+
+    def test_cancel_stops_dispatch(self):
+        with OllamaOCRClient(self.stand_in.url, "stand-in", timeout=5, concurrency=2) as client:
+            with self.assertRaises(OCRCancelled) as raised:
+                client.extract_pages(_pages(40), cancelled=lambda: self.stand_in.max_active > 0)
+
+        self.assertLess(raised.exception.pages_done, 40)
+
+    def test_cancel_does_not_wait_for_requests_in_flight(self):
+        slow = _StandInOllama(delay=3)
+        try:
+            with OllamaOCRClient(slow.url, "stand-in", timeout=5, concurrency=2) as client:
+                started = time.monotonic()
+                with self.assertRaises(OCRCancelled):
+                    client.extract_pages(_pages(4), cancelled=lambda: slow.max_active > 0)
+                self.assertLess(time.monotonic() - started, 2)
+        finally:
+            slow.close()
+
+    def test_returns_after_renderer_stops(self):
+        rendering = threading.Event()
+        rendered = []
+
+        def slow_render():
+            yield 0, b"page-0"
+            rendering.set()
+            time.sleep(0.3)  # a page render the consumer must not close the document under
+            rendered.append(1)
+            yield 1, b"page-1"
+
+        with OllamaOCRClient(self.stand_in.url, "stand-in", timeout=5, concurrency=1) as client:
+            with self.assertRaises(OCRCancelled):
+                client.extract_pages(slow_render(), cancelled=rendering.is_set)
+
+        self.assertEqual(rendered, [1])
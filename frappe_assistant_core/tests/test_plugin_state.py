@@ -0,0 +1,81 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for worker-local plugin state keyed by the plugin_state generation.
+"""
+
+from unittest.mock import patch
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils.cache import bump_cache_version, get_cache_version
+from frappe_assistant_core.utils.plugin_manager import (
+    PluginPersistence,
+    clear_request_plugin_state,
+    get_plugin_manager,
+)
+
+
+class TestPluginState(BaseAssistantTest):
+    """Enabled plugins are re-read only when the generation changes."""
+
+    def setUp(self):
+        super().setUp()
+        self.manager = get_plugin_manager()
+        clear_request_plugin_state()
+        self.manager.get_all_tools()
+        clear_request_plugin_state()
+
+    def test_steady_state_reads_no_plugin_rows(self):
+        with patch.object(
+            PluginPersistence, "load_enabled_plugins", autospec=True, side_effect=AssertionError
+        ) as mocked:
+            tools = self.manager.get_all_tools()
+            self.manager.get_enabled_plugins()
+            self.assertIs(self.manager.get_all_tools(), tools)
+
+        mocked.assert_not_called()
+        self.assertIn("core", self.manager.get_enabled_plugins())
+
+    def test_generation_bump_reloads_once_per_request(self):
+        original = PluginPersistence.load_enabled_plugins
+        with patch.object(
+            PluginPersistence, "load_enabled_plugins", autospec=True, side_effect=original
+        ) as mocked:
+            bump_cache_version("plugin_state")
+            self.manager.get_all_tools()
+            bump_cache_version("plugin_state")
+            self.manager.get_all_tools()  # same request: not re-checked
+
+        self.assertEqual(mocked.call_count, 1)
+
+    def test_configuration_change_bumps_after_commit(self):
+        config = frappe.new_doc("FAC Plugin Configuration")
+        config.plugin_name = "core"
+        before = get_cache_version("plugin_state")
+
+        config._clear_caches()
+        self.assertEqual(get_cache_version("plugin_state"), before)
+
+        frappe.db.commit()
+        self.assertGreater(get_cache_version("plugin_state"), before)
+
+    def test_tools_mapping_is_read_only(self):
+        tools = self.manager.get_all_tools()
+        with self.assertRaises(TypeError):
+            tools["extra_tool"] = None
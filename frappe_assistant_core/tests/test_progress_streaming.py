@@ -0,0 +1,73 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the Redis Streams progress bus and cross-worker cancellation.
+"""
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils.progress_streaming import (
+    ProgressStatus,
+    ProgressTracker,
+    get_progress_service,
+    is_cancel_requested,
+    read_latest_update,
+    read_operation_updates,
+)
+
+
+class TestProgressStreams(BaseAssistantTest):
+    """Updates are appended per operation and readable from any worker."""
+
+    def setUp(self):
+        super().setUp()
+        self.operation_id = frappe.generate_hash(length=10)
+        self.tracker = get_progress_service().create_tracker(
+            self.operation_id, frappe.session.user, "stream test"
+        )
+
+    def tearDown(self):
+        get_progress_service().remove_tracker(self.operation_id)
+        super().tearDown()
+
+    def test_updates_are_appended_and_followed(self):
+        first = read_operation_updates(self.operation_id)
+        self.tracker.update_progress(ProgressStatus.RUNNING, progress_percent=40, message="halfway")
+
+        newer = read_operation_updates(self.operation_id, after=first[-1]["stream_id"])
+
+        self.assertEqual(first[0]["status"], "started")
+        self.assertEqual([u["progress_percent"] for u in newer], [40])
+        self.assertEqual(read_latest_update(self.operation_id)["message"], "halfway")
+        self.assertIn(
+            self.operation_id,
+            [op["operation_id"] for op in get_progress_service().get_user_operations(frappe.session.user)],
+        )
+
+    def test_cancel_reaches_tracker_in_another_worker(self):
+        # A tracker this service does not hold, as if running on another worker
+        remote = ProgressTracker(self.operation_id, frappe.session.user, "stream test")
+        get_progress_service().remove_tracker(self.operation_id)
+
+        self.assertFalse(is_cancel_requested(self.operation_id))
+        self.assertTrue(get_progress_service().cancel_operation(self.operation_id, frappe.session.user))
+
+        self.assertTrue(is_cancel_requested(self.operation_id))
+        self.assertTrue(remote.is_cancelled())
+        self.assertEqual(read_latest_update(self.operation_id)["status"], "cancelled")
+        self.assertFalse(get_progress_service().cancel_operation(self.operation_id, frappe.session.user))
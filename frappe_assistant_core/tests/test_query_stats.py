@@ -0,0 +1,79 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for per-call SQL accounting (utils.query_stats) and its audit fields.
+"""
+
+from unittest.mock import patch
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.tests.test_audit_log import _TEST_TOOL_NAME, _ToolBase
+from frappe_assistant_core.utils.query_stats import QueryStats, fingerprint
+
+
+class TestQueryStats(BaseAssistantTest):
+    """Counting, fingerprinting and N+1 detection."""
+
+    def tearDown(self):
+        frappe.db.delete("Assistant Audit Log", {"tool_name": _TEST_TOOL_NAME})
+        super().tearDown()
+
+    def test_fingerprint_normalizes_values(self):
+        self.assertEqual(
+            fingerprint("select name from `tabUser`  where name = 'a@x.com' and idx > 3"),
+            fingerprint("select name from `tabUser` where name = %(name)s and idx > %s"),
+        )
+        self.assertEqual(
+            fingerprint("select * from `tabToDo` where name in ('a', 'b', 'c')"),
+            "select * from `tabToDo` where name in (...)",
+        )
+
+    def test_counts_rows_duplicates_and_n_plus_one(self):
+        with QueryStats() as stats:
+            for user in ("Administrator", "Guest", "Administrator"):
+                frappe.db.sql("select name from `tabUser` where name = %s", user)
+            frappe.db.sql("select 1")
+
+        self.assertNotIn("sql", vars(frappe.db))
+        result = stats.as_dict(n_plus_one_threshold=2)
+        self.assertEqual(result["query_count"], 4)
+        self.assertEqual(result["rows_returned"], 4)
+        self.assertEqual(result["duplicate_queries"], 2)
+        self.assertEqual(len(result["n_plus_one"]), 1)
+        self.assertEqual(result["n_plus_one"][0]["count"], 3)
+
+    def test_audit_row_and_debug_payload(self):
+        def executor(arguments):
+            for _ in range(3):
+                frappe.db.get_value("User", "Administrator", "name")
+            return {"ok": True}
+
+        with patch.dict(frappe.conf, {"fac_debug_query_stats": 1, "fac_n_plus_one_threshold": 2}):
+            response = _ToolBase(executor=executor)._safe_execute({})
+
+        self.assertGreaterEqual(response["query_stats"]["query_count"], 3)
+        row = frappe.get_all(
+            "Assistant Audit Log",
+            filters={"tool_name": _TEST_TOOL_NAME},
+            fields=["query_count", "duplicate_queries", "n_plus_one_queries"],
+            limit=1,
+        )[0]
+        self.assertGreaterEqual(row.query_count, 3)
+        self.assertGreaterEqual(row.duplicate_queries, 2)
+        self.assertIn("tabUser", row.n_plus_one_queries)
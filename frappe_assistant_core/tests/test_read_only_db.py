@@ -0,0 +1,77 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Tests for the read-only database wrapper used by the code execution sandbox
+"""
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils.read_only_db import ReadOnlyDatabase, classify_query
+
+
+class TestReadOnlyQueryClassifier(BaseAssistantTest):
+    """Statement classification for ReadOnlyDatabase.sql"""
+
+    def test_read_statements_allowed(self):
+        for query in (
+            "SELECT name FROM tabUser LIMIT 1",
+            "  select name from `tabBulk Update` where action = 'Delete';  -- trailing comment",
+            "SELECT REPLACE(name, 'a', 'b') FROM tabUser",
+            "/* note */ SHOW TABLES",
+            "DESC tabUser",
+        ):
+            for db_type in ("mariadb", "postgres"):
+                self.assertIsNone(classify_query(query, db_type), (db_type, query))
+        self.assertIsNone(classify_query("SELECT $$;DELETE$$ AS note", "postgres"))
+        self.assertIsNone(classify_query("SELECT 1 # harmless ; delete\nFROM tabUser", "mariadb"))
+
+    def test_write_statements_blocked(self):
+        for query in (
+            "DELETE FROM tabUser",
+            "update tabUser set enabled = 0",
+            "SELECT * FROM tabUser FOR UPDATE",
+            "SELECT 1; DROP TABLE tabUser",
+            "SELECT 1 /*!50000 ; DELETE FROM tabUser */",
+            "SELECT 1 /*M!100000 ; DELETE FROM tabUser */",
+            "SELECT 'a\\' ; DELETE FROM tabUser; --'",
+            "WITH t AS (SELECT 1) SELECT * FROM t",
+            "   ",
+        ):
+            for db_type in ("mariadb", "postgres"):
+                self.assertIsNotNone(classify_query(query, db_type), (db_type, query))
+
+        # Comment and string syntax that only one of the databases has
+        self.assertIsNotNone(classify_query("SELECT 1 # '\n; DELETE FROM tabToDo; -- '", "mariadb"))
+        self.assertIsNotNone(classify_query("SELECT 1 --1; DELETE FROM tabToDo", "mariadb"))
+        self.assertIsNotNone(
+            classify_query("""SELECT $$'$$; DELETE FROM "tabToDo"; SELECT $$'$$""", "postgres")
+        )
+        self.assertIsNotNone(classify_query('SELECT $q$ x $q$; DELETE FROM "tabToDo"', "postgres"))
+
+        # A backslash disables string-aware scanning; a second statement is still refused
+        self.assertIsNotNone(classify_query("SELECT '\\'; GRANT ALL ON t TO x", "postgres"))
+        self.assertIsNotNone(classify_query("SELECT 'a\\b'; SET GLOBAL read_only=0", "mariadb"))
+        self.assertIsNone(classify_query("SELECT 'a\\b'; -- done", "mariadb"))
+
+    def test_sql_validates_before_executing(self):
+        db = ReadOnlyDatabase(frappe.db)
+
+        self.assertTrue(db.sql("SELECT name FROM tabUser LIMIT 1"))
+        with self.assertRaises(frappe.ValidationError):
+            db.sql("DELETE FROM tabUser WHERE name = 'nobody'")
@@ -31,8 +31,11 @@ Also adds the Report.filters child table as a discovery source, and a
 discovery_diagnostics payload so empty results are debuggable.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import frappe
+
+from frappe_assistant_core.plugins.core.tools import report_index
 from frappe_assistant_core.plugins.core.tools.report_requirements import ReportRequirements
 from frappe_assistant_core.tests.base_test import BaseAssistantTest
 
@@ -159,3 +162,38 @@ class TestDiscoveryOrchestration(BaseAssistantTest):
         self.assertEqual(diagnostics["filters_child_table"]["status"], "empty")
         # JS discovery was attempted and recorded (even though it found nothing).
         self.assertIn("javascript", diagnostics)
+
+
+class TestReportRequirementsIndex(BaseAssistantTest):
+    """Filter discovery is served from the index until the Report or its JS changes."""
+
+    def setUp(self):
+        super().setUp()
+        self.report_name = frappe.db.get_value("Report", {"report_type": "Script Report"}, "name")
+        if not self.report_name:
+            self.skipTest("No Script Report installed")
+        report_index._local_index.clear()
+
+    def test_repeat_lookup_does_not_rebuild(self):
+        first = report_index.get_report_entry(self.report_name)
+
+        with patch.object(
+            report_index, "_build_entry", side_effect=AssertionError("warm lookup must not rebuild")
+        ):
+            second = report_index.get_report_entry(self.report_name)
+
+        self.assertEqual(first, second)
+
+    def test_js_change_rebuilds_entry(self):
+        report_index.get_report_entry(self.report_name)
+
+        with patch.object(report_index, "_js_mtime", return_value=-1.0), patch.object(
+            report_index, "_build_entry", wraps=report_index._build_entry
+        ) as build:
+            entry = report_index.get_report_entry(self.report_name)
+
+        build.assert_called_once()
+        self.assertEqual(entry["stamp"][1], -1.0)
+
+    def test_missing_report_returns_none(self):
+        self.assertIsNone(report_index.get_report_entry("No Such Report XYZ"))
@@ -85,6 +85,9 @@ class TestSearchTools(BaseAssistantTest):
         tool) must use frappe.get_list, not the permission-bypassing get_all."""
         from frappe_assistant_core.plugins.core.tools import search_tools
 
+        # Searchable DocTypes are cached per role set; resolve them under the patches below
+        frappe.cache.delete_keys("fac_search_doctypes_")
+
         with ExitStack() as stack:
             # Make exactly one doctype exist and be readable so a single query
             # runs. global_search calls frappe.db.exists("DocType", <doctype>),
@@ -157,6 +160,66 @@ class TestSearchTools(BaseAssistantTest):
         self.assertEqual(call.args[0], "Employee")
         self.assertFalse(call.kwargs.get("ignore_permissions", True))
 
+    def test_fan_out_returns_partial_results_at_deadline(self):
+        """DocTypes run concurrently; ones still running at the deadline are reported, not awaited"""
+        import time
+
+        from frappe_assistant_core.plugins.core.tools.search_fanout import fan_out
+
+        def run(doctype):
+            if doctype == "Slow":
+                time.sleep(2)
+            return [{"name": doctype}]
+
+        start = time.monotonic()
+        results, timed_out = fan_out(["User", "Slow", "ToDo"], run, workers=3, deadline=0.5)
+
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(set(results), {"User", "ToDo"})
+        self.assertEqual(timed_out, ["Slow"])
+
+    def test_fan_out_reuses_pooled_connections(self):
+        """Worker connections go back to the pool; the next search opens none"""
+        import time
+
+        from frappe_assistant_core.plugins.core.tools import search_fanout
+
+        def run(doctype):
+            return frappe.db.sql("select 1")
+
+        search_fanout.fan_out(["User", "ToDo"], run, workers=2)
+        # Workers return their connection just after reporting the last result
+        deadline = time.monotonic() + 2
+        while len(search_fanout._idle_connections) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        with patch.object(search_fanout.frappe, "connect", wraps=frappe.connect) as connect:
+            results, _timed_out = search_fanout.fan_out(["User", "ToDo"], run, workers=2)
+
+        self.assertEqual(set(results), {"User", "ToDo"})
+        connect.assert_not_called()
+        self.assertLessEqual(len(search_fanout._idle_connections), search_fanout.DEFAULT_WORKERS)
+
+    def test_searchable_doctypes_follow_permission_changes(self):
+        from frappe_assistant_core.plugins.core.tools import search_fanout
+        from frappe_assistant_core.utils.cache import invalidate_search_doctypes_cache
+
+        self.assertEqual(search_fanout.searchable_doctypes(["ToDo"]), ["ToDo"])
+
+        with patch.object(search_fanout.frappe, "has_permission", return_value=False):
+            # Cached until a DocType or Custom DocPerm change
+            self.assertEqual(search_fanout.searchable_doctypes(["ToDo"]), ["ToDo"])
+            invalidate_search_doctypes_cache()
+            self.assertEqual(search_fanout.searchable_doctypes(["ToDo"]), [])
+
+        invalidate_search_doctypes_cache()
+
+    def test_rank_matches_prefers_exact_then_prefix(self):
+        from frappe_assistant_core.plugins.core.tools.search_fanout import rank_matches
+
+        rows = [{"name": "my-emp"}, {"name": "EMP-1"}, {"name": "emp"}]
+        self.assertEqual([r["name"] for r in rank_matches("emp", rows)], ["emp", "EMP-1", "my-emp"])
+
     def test_search_empty_query(self):
         self.skipTest("Empty query test placeholder")
 
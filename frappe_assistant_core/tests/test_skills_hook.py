@@ -26,6 +26,8 @@ import frappe
 
 from frappe_assistant_core.api.handlers.resources import (
     SkillManager,
+    flush_skill_usage,
+    get_skill_catalog,
     handle_resources_list,
     handle_resources_read,
 )
@@ -357,6 +359,30 @@ class TestResourcesHandlers(BaseAssistantTest):
             result = handle_resources_read({"uri": "fac://skills/draft_own"})
             self.assertIn("contents", result)
 
+    def test_catalog_refreshes_after_skill_update(self):
+        """Saving a skill invalidates the cached catalog."""
+        doc = self._make("catalog_refresh", content="# v1")
+        self.assertEqual(get_skill_catalog()["catalog_refresh"].content, "# v1")
+
+        doc.content = "# v2"
+        doc.save(ignore_permissions=True)
+
+        result = handle_resources_read({"uri": "fac://skills/catalog_refresh"})
+        self.assertEqual(result["contents"][0]["text"], "# v2")
+
+    def test_usage_counter_is_buffered_until_flush(self):
+        """Reads bump use_count only when the buffered counters are flushed."""
+        doc = self._make("usage_buffered")
+        flush_skill_usage()
+
+        handle_resources_read({"uri": "fac://skills/usage_buffered"})
+        handle_resources_read({"uri": "fac://skills/usage_buffered"})
+        self.assertEqual(frappe.db.get_value("FAC Skill", doc.name, "use_count"), 0)
+
+        flush_skill_usage()
+        self.assertEqual(frappe.db.get_value("FAC Skill", doc.name, "use_count"), 2)
+        self.assertIsNotNone(frappe.db.get_value("FAC Skill", doc.name, "last_used"))
+
 
 class TestBeforeAppUninstall(BaseAssistantTest):
     """Tests for before_app_uninstall cleanup."""
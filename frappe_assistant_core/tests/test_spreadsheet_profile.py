@@ -0,0 +1,84 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for streaming CSV/XLSX profiles used by extract_file_content.
+"""
+
+import io
+
+import pandas as pd
+
+from frappe_assistant_core.plugins.data_science.tools.spreadsheet_profile import profile_csv, profile_xlsx
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+
+
+class TestSpreadsheetProfile(BaseAssistantTest):
+    """Chunked and row-wise profiles agree with a full pandas read."""
+
+    def test_csv_chunks_match_full_read(self):
+        rows = "".join(f"{i},{i / 2 if i % 7 else ''},item {i}\n" for i in range(1000))
+        data = ("qty,rate,name\n" + rows + "1000,1.5,café\n").encode("latin-1")
+
+        profile = profile_csv(lambda: io.BytesIO(data), sample_rows=3, chunk_rows=100)
+        full = pd.read_csv(io.BytesIO(data), encoding="latin-1")
+
+        self.assertEqual(profile.encoding, "latin-1")
+        self.assertEqual(profile.row_count, len(full))
+        self.assertEqual(len(profile.sample), 3)
+        self.assertEqual(profile.data_types["qty"], "int64")
+        self.assertEqual(profile.data_types["rate"], "float64")
+        self.assertEqual(profile.null_counts, {k: int(v) for k, v in full.isna().sum().items()})
+
+    def test_xlsx_rows_are_profiled_per_sheet(self):
+        workbook = io.BytesIO()
+        with pd.ExcelWriter(workbook, engine="openpyxl") as writer:
+            pd.DataFrame({"qty": [1, 2, None, 4], "name": ["a", "b", None, "d"]}).to_excel(
+                writer, index=False, sheet_name="Items"
+            )
+            pd.DataFrame({"total": [10]}).to_excel(writer, index=False, sheet_name="Summary")
+
+        profiles = profile_xlsx(io.BytesIO(workbook.getvalue()), sample_rows=2)
+
+        self.assertEqual(list(profiles), ["Items", "Summary"])
+        items = profiles["Items"]
+        self.assertEqual(items.row_count, 4)
+        self.assertEqual(len(items.sample), 2)
+        self.assertEqual(items.data_types, {"qty": "float64", "name": "object"})
+        self.assertEqual(items.null_counts, {"qty": 1, "name": 1})
+        self.assertEqual(profiles["Summary"].row_count, 1)
+
+    def test_xlsx_duplicate_headers_are_renamed_like_pandas(self):
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["a", "a", None, "a"])
+        sheet.append([1, "x", None, None])
+        sheet.append([2, None, 7, "y"])
+        data = io.BytesIO()
+        workbook.save(data)
+
+        profile = next(iter(profile_xlsx(io.BytesIO(data.getvalue())).values()))
+        full = pd.read_excel(io.BytesIO(data.getvalue()))
+
+        self.assertEqual(profile.columns, ["a", "a.1", "Unnamed: 2", "a.2"])
+        self.assertEqual(profile.columns, list(full.columns))
+        self.assertEqual(list(profile.sample.columns), list(full.columns))
+        self.assertEqual(profile.null_counts, {k: int(v) for k, v in full.isna().sum().items()})
+        self.assertEqual(
+            profile.data_types, {"a": "int64", "a.1": "object", "Unnamed: 2": "float64", "a.2": "object"}
+        )
@@ -0,0 +1,63 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for request-scoped and shared caching of the Jinja template helpers.
+"""
+
+from unittest.mock import patch
+
+import frappe
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils import template_helpers
+from frappe_assistant_core.utils.cache import bump_cache_version
+
+
+class TestTemplateHelpers(BaseAssistantTest):
+    """Repeated calls in a render do no work; generation bumps refresh."""
+
+    def setUp(self):
+        super().setUp()
+        frappe.local.fac_template_helpers = None
+
+    def tearDown(self):
+        frappe.local.fac_template_helpers = None
+        super().tearDown()
+
+    def test_repeated_calls_compute_once(self):
+        with patch.object(template_helpers, "_compute_tool_count", return_value=7) as compute:
+            bump_cache_version("plugin_state")
+            counts = [template_helpers.get_tool_count() for _ in range(20)]
+
+            # Next request: served from the shared cache
+            frappe.local.fac_template_helpers = None
+            with patch.object(frappe.cache, "get_value", wraps=frappe.cache.get_value) as get_value:
+                self.assertEqual(template_helpers.get_tool_count(), 7)
+                template_helpers.get_tool_count()
+
+        self.assertEqual(counts, [7] * 20)
+        compute.assert_called_once()
+        get_value.assert_called_once()
+
+    def test_settings_change_refreshes_status(self):
+        with patch.object(template_helpers, "_compute_assistant_status", return_value={"enabled": True}):
+            template_helpers.get_assistant_status()
+
+        bump_cache_version("assistant_settings")
+        frappe.local.fac_template_helpers = None
+        with patch.object(template_helpers, "_compute_assistant_status", return_value={"enabled": False}):
+            self.assertEqual(template_helpers.get_assistant_status(), {"enabled": False})
@@ -74,14 +74,8 @@ class TestResolveToolCategories(BaseAssistantTest):
         registry = MagicMock()
         # Auto-detect would say read_only, but the stored config says privileged
         # (e.g. an admin override). The stored value must win.
+        registry._get_tool_configurations.return_value = {"get_document": {"tool_category": "privileged"}}
         with ExitStack() as stack:
-            stack.enter_context(
-                patch.object(
-                    fac_endpoint.frappe,
-                    "get_all",
-                    return_value=[{"tool_name": "get_document", "tool_category": "privileged"}],
-                )
-            )
             detect = stack.enter_context(
                 patch(
                     "frappe_assistant_core.utils.tool_category_detector.detect_tool_category",
@@ -98,33 +92,58 @@ class TestResolveToolCategories(BaseAssistantTest):
         from frappe_assistant_core.api import fac_endpoint
 
         registry = MagicMock()
+        registry._get_tool_configurations.return_value = {}
         registry.get_tool.return_value = MagicMock(name="tool_instance")
         with ExitStack() as stack:
-            stack.enter_context(patch.object(fac_endpoint.frappe, "get_all", return_value=[]))
             stack.enter_context(
                 patch(
                     "frappe_assistant_core.utils.tool_category_detector.detect_tool_category",
                     return_value="write",
                 )
             )
+            new_doc = stack.enter_context(patch.object(fac_endpoint.frappe, "new_doc"))
 
             result = fac_endpoint._resolve_tool_categories(["create_document"], registry)
 
         self.assertEqual(result["create_document"], "write")
+        new_doc.assert_not_called()  # tools/list never writes config rows
 
     def test_defaults_to_read_write_when_instance_missing(self):
         from frappe_assistant_core.api import fac_endpoint
 
         registry = MagicMock()
+        registry._get_tool_configurations.return_value = {}
         registry.get_tool.return_value = None  # tool instance unavailable
-        with ExitStack() as stack:
-            stack.enter_context(patch.object(fac_endpoint.frappe, "get_all", return_value=[]))
 
-            result = fac_endpoint._resolve_tool_categories(["mystery_tool"], registry)
+        result = fac_endpoint._resolve_tool_categories(["mystery_tool"], registry)
 
         self.assertEqual(result["mystery_tool"], "read_write")
 
 
+class TestDetectedCategoryMemo(BaseAssistantTest):
+    """detect_tool_category parses a tool class once per source file hash."""
+
+    def test_source_is_parsed_once(self):
+        from frappe_assistant_core.plugins.core.tools.report_requirements import ReportRequirements
+        from frappe_assistant_core.utils import tool_category_detector
+
+        tool = ReportRequirements()
+        tool.name = "memo_probe_tool"  # not in the hardcoded category lists
+        tool_category_detector._detected_categories.clear()
+        with patch.object(
+            tool_category_detector.ToolCategoryDetector,
+            "_extract_perm_types",
+            return_value={"read"},
+        ) as extract:
+            first = tool_category_detector.detect_tool_category(tool)
+            second = tool_category_detector.detect_tool_category(tool)
+
+        self.assertEqual(first, "read_only")
+        self.assertEqual(second, "read_only")
+        extract.assert_called_once()
+        self.assertEqual(len(tool_category_detector.get_source_hash(ReportRequirements)), 40)
+
+
 class TestToolsListEmitsAnnotations(BaseAssistantTest):
     """The MCP tools/list response must carry the annotation hints so the
     client can categorize tools."""
@@ -0,0 +1,80 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the tool manifest and lazily imported plugin tools.
+"""
+
+from frappe_assistant_core.mcp.tool_adapter import build_tool_dict
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.utils import tool_manifest
+from frappe_assistant_core.utils.plugin_manager import PluginConfig
+
+_MODULE = "frappe_assistant_core.plugins.core.tools.get_document"
+
+
+class TestToolManifest(BaseAssistantTest):
+    """LazyTool listing from the manifest and importing on first use."""
+
+    def setUp(self):
+        super().setUp()
+        self.path = PluginConfig.get_tool_module_path("core", "get_document")
+        self.entry, _instance = tool_manifest.build_entry(_MODULE, tool_manifest.module_stamp(self.path))
+
+    def test_listing_does_not_create_the_tool(self):
+        tool = tool_manifest.LazyTool(_MODULE, self.entry, {"category": "Core Operations"})
+
+        tool_dict = build_tool_dict(tool)
+        tool.check_permission()
+        metadata = tool.get_metadata()
+
+        self.assertFalse(tool.is_loaded)
+        self.assertEqual(tool_dict["name"], "get_document")
+        self.assertEqual(tool_dict["inputSchema"], self.entry["inputSchema"])
+        self.assertEqual(metadata["class"], "DocumentGet")
+        self.assertEqual(metadata["category"], "Core Operations")
+
+    def test_execution_loads_the_tool_once(self):
+        tool = tool_manifest.LazyTool(_MODULE, self.entry, {"category": "Core Operations"})
+
+        execute = tool._safe_execute
+
+        self.assertTrue(tool.is_loaded)
+        self.assertIs(execute.__self__, tool.load())
+        self.assertEqual(tool.load().category, "Core Operations")
+
+    def test_stale_entry_is_rebuilt(self):
+        stale = dict(self.entry, stamp=(0, 0), description="outdated")
+
+        tool = tool_manifest.get_lazy_tool(_MODULE, self.path, {_MODULE: stale}, {})
+
+        self.assertNotEqual(tool.description, "outdated")
+        self.assertEqual(tool_manifest.load_manifest()[_MODULE]["stamp"], self.entry["stamp"])
+
+    def test_entry_records_optional_dependencies(self):
+        entry, _instance = tool_manifest.build_entry(
+            "frappe_assistant_core.plugins.data_science.tools.run_python_code", (0, 0)
+        )
+
+        self.assertEqual(entry["modules"], tool_manifest.installed_modules(["pandas", "numpy"]))
+
+    def test_entry_is_rebuilt_when_a_dependency_is_installed_or_removed(self):
+        changed = dict(self.entry, modules={"fac_module_that_is_not_installed": True}, description="outdated")
+
+        tool = tool_manifest.get_lazy_tool(_MODULE, self.path, {_MODULE: changed}, {})
+
+        self.assertNotEqual(tool.description, "outdated")
+        self.assertEqual(tool_manifest.load_manifest()[_MODULE]["modules"], self.entry["modules"])
@@ -0,0 +1,117 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the opt-in tool profiler: call selection, captured stacks and
+query accounting, and the link from the audit row.
+"""
+
+import time
+from unittest.mock import patch
+
+import frappe
+from frappe.utils import add_days, now_datetime
+
+from frappe_assistant_core.tests.base_test import BaseAssistantTest
+from frappe_assistant_core.tests.test_audit_log import _TEST_TOOL_NAME, _ToolBase
+from frappe_assistant_core.utils import audit_retention, profiler
+from frappe_assistant_core.utils.settings import AssistantSettings
+
+
+def _busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+def _settings(**values):
+    return patch(
+        "frappe_assistant_core.utils.settings.get_assistant_settings",
+        return_value=AssistantSettings(**values),
+    )
+
+
+class TestToolProfiler(BaseAssistantTest):
+    """Sampling profiler around BaseTool._safe_execute."""
+
+    def tearDown(self):
+        frappe.db.delete(profiler.PROFILE_DOCTYPE, {"tool_name": _TEST_TOOL_NAME})
+        frappe.db.delete("Assistant Audit Log", {"tool_name": _TEST_TOOL_NAME})
+        super().tearDown()
+
+    def test_selection_by_tool_user_and_rate(self):
+        with _settings(enable_tool_profiling=False, profiling_tools=_TEST_TOOL_NAME):
+            self.assertFalse(profiler.should_profile(_TEST_TOOL_NAME))
+
+        with _settings(enable_tool_profiling=True, profiling_tools=f"other\n{_TEST_TOOL_NAME}\n"):
+            self.assertTrue(profiler.should_profile(_TEST_TOOL_NAME))
+            self.assertFalse(profiler.should_profile("unlisted_tool"))
+
+        with _settings(enable_tool_profiling=True, profiling_users="Administrator"):
+            self.assertTrue(profiler.should_profile("unlisted_tool", "Administrator"))
+
+        with _settings(enable_tool_profiling=True, profiling_sample_rate=100.0):
+            self.assertTrue(profiler.should_profile("unlisted_tool"))
+
+    def test_profile_captures_stacks_and_queries(self):
+        with profiler.ToolProfiler(_TEST_TOOL_NAME, interval_ms=1) as active:
+            _busy_loop(0.1)
+            frappe.db.sql("select 1")
+            frappe.db.get_value("User", "Administrator", "name")
+
+        self.assertNotIn("sql", vars(frappe.db))
+        doc = frappe.get_doc(profiler.PROFILE_DOCTYPE, active.profile_name)
+        self.assertEqual(doc.query_count, 2)
+        self.assertGreater(doc.sample_count, 0)
+        self.assertIn("_busy_loop", doc.collapsed_stacks)
+        self.assertTrue(doc.collapsed_stacks.startswith("test_tool_profiler:test_profile_captures"))
+
+        summary = profiler.summarize_collapsed(doc.collapsed_stacks)
+        self.assertEqual(summary["self"][0]["frame"], "test_tool_profiler:_busy_loop")
+
+    def test_audit_row_links_profile(self):
+        tool = _ToolBase(executor=lambda arguments: _busy_loop(0.02))
+        with _settings(enable_tool_profiling=True, profiling_tools=_TEST_TOOL_NAME):
+            tool._safe_execute({})
+
+        profile = frappe.db.get_value("Assistant Audit Log", {"tool_name": _TEST_TOOL_NAME}, "profile")
+        self.assertTrue(profile)
+        self.assertEqual(frappe.db.get_value(profiler.PROFILE_DOCTYPE, profile, "tool_name"), _TEST_TOOL_NAME)
+
+    def test_purge_deletes_old_profiles_in_batches(self):
+        names = []
+        for _ in range(3):
+            with profiler.ToolProfiler(_TEST_TOOL_NAME, interval_ms=1) as active:
+                _busy_loop(0.01)
+            names.append(active.profile_name)
+        for name in names[:2]:
+            frappe.db.set_value(
+                profiler.PROFILE_DOCTYPE,
+                name,
+                "creation",
+                add_days(now_datetime(), -10),
+                update_modified=False,
+            )
+
+        with patch.object(audit_retention, "BATCH_SIZE", 1), patch.object(
+            audit_retention, "BATCH_PAUSE_SECONDS", 0
+        ):
+            self.assertGreaterEqual(profiler.purge_tool_profiles(5), 2)
+
+        remaining = frappe.get_all(profiler.PROFILE_DOCTYPE, filters={"name": ("in", names)}, pluck="name")
+        self.assertEqual(remaining, [names[2]])
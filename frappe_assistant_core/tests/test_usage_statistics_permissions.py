@@ -81,12 +81,12 @@ class TestUsageStatisticsPermissions(BaseAssistantTest):
 
         mock_plugin_manager = MagicMock()
         mock_plugin_manager.get_all_tools.return_value = {"sample_tool": object()}
-        audit_stat_counts = [3, 1, 2]  # audit log total, today, this week
+        audit_summaries = [{"total": n} for n in (3, 1, 2)]  # audit log total, today, this week
 
         frappe.set_user("Administrator")
         with self.enforce_only_for_checks(), patch(
-            "frappe_assistant_core.api.admin.stats.frappe.db.count",
-            side_effect=audit_stat_counts,
+            "frappe_assistant_core.utils.audit_rollup.get_audit_summary",
+            side_effect=audit_summaries,
         ), patch(
             "frappe_assistant_core.api.admin.stats.frappe.db.get_list",
             return_value=[],
@@ -120,15 +120,15 @@ class TestUsageStatisticsPermissions(BaseAssistantTest):
 
         mock_plugin_manager = MagicMock()
         mock_plugin_manager.get_all_tools.return_value = {"sample_tool": object()}
-        usage_stat_counts = [3, 1, 2, 3, 1, 2]  # connections total/today/week, audit total/today/week
+        audit_summaries = [{"total": n} for n in (3, 1, 2)]  # audit log total, today, this week
 
         frappe.set_user("Administrator")
         with self.enforce_only_for_checks(), patch(
             "frappe_assistant_core.api.assistant_api._authenticate_request",
             return_value="Administrator",
         ), patch(
-            "frappe_assistant_core.api.assistant_api.frappe.db.count",
-            side_effect=usage_stat_counts,
+            "frappe_assistant_core.utils.audit_rollup.get_audit_summary",
+            side_effect=audit_summaries,
         ), patch(
             "frappe_assistant_core.api.assistant_api.frappe.db.get_list",
             return_value=[],
@@ -96,3 +96,44 @@ class TestWorkflowToolsIntegration(BaseAssistantTest):
 
     def test_workflow_error_scenarios(self):
         self.skipTest("Workflow error test placeholder")
+
+
+class TestWorkflowTransitionFields(BaseAssistantTest):
+    """Test field extraction for batched transition resolution"""
+
+    def test_field_accessors(self):
+        from frappe_assistant_core.plugins.core.tools.workflow_transitions import condition_fields
+
+        self.assertEqual(
+            condition_fields("doc.grand_total > 1000 and doc.get('status') != doc[\"owner\"]"),
+            {"grand_total", "status", "owner"},
+        )
+        self.assertEqual(condition_fields("frappe.session.user == 'Administrator'"), set())
+
+    def test_other_doc_usage_needs_full_doc(self):
+        from frappe_assistant_core.plugins.core.tools.workflow_transitions import condition_fields
+
+        self.assertIsNone(condition_fields("is_approved(doc)"))
+        self.assertIsNone(condition_fields("doc.get_formatted('grand_total')"))
+        self.assertIsNone(condition_fields("doc.get(fieldname)"))
+
+    def test_slim_fields_for_default_field_conditions(self):
+        from frappe_assistant_core.plugins.core.tools.workflow_transitions import _slim_fields
+
+        workflow = frappe._dict(
+            workflow_state_field="status",
+            transitions=[
+                frappe._dict(condition="doc.doctype == 'ToDo' and doc.owner == frappe.session.user")
+            ],
+        )
+
+        fields = _slim_fields("ToDo", workflow)
+
+        self.assertEqual(fields, ["docstatus", "name", "owner", "status"])
+        # Every selected field is a real column
+        frappe.get_list("ToDo", fields=fields, limit_page_length=1)
+
+    def test_doctype_without_workflow(self):
+        from frappe_assistant_core.plugins.core.tools.workflow_transitions import resolve_transitions
+
+        self.assertEqual(resolve_transitions([("ToDo", "missing")]), {("ToDo", "missing"): []})
@@ -0,0 +1,161 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Chunked retention for Assistant Audit Log.
+
+A single ``DELETE ... WHERE creation < ...`` over millions of rows holds row
+locks for minutes, bloats the undo log and stalls concurrent audit inserts.
+Instead, rows are removed in small batches walked along the creation index,
+each batch committed on its own with a short pause in between, and every run
+stops after a time budget. Runs are scheduled hourly, so a large backlog is
+worked off over several runs without ever holding a long transaction.
+
+Payload columns (input_data, output_data, traceback) can optionally be
+cleared earlier than the rows themselves via ``audit_payload_retention_days``.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import frappe
+from frappe.utils import add_days, get_datetime, now_datetime
+
+AUDIT_DOCTYPE = "Assistant Audit Log"
+
+# Creation timestamp up to which payloads have been cleared
+_PAYLOAD_WATERMARK_KEY = "fac_audit_payload_watermark"
+
+BATCH_SIZE = 2000
+BATCH_PAUSE_SECONDS = 0.2
+RUN_TIME_BUDGET_SECONDS = 240
+
+
+def _next_batch(
+    cutoff: datetime,
+    extra_condition: str = "",
+    after: Optional[datetime] = None,
+    doctype: str = AUDIT_DOCTYPE,
+    date_field: str = "creation",
+) -> list:
+    """
+    Oldest ``BATCH_SIZE`` (name, date_field) rows of ``doctype`` dated before
+    ``cutoff``, optionally starting at ``after``. ``date_field`` must be indexed.
+    """
+    conditions = [f"`{date_field}` < %(cutoff)s"]
+    if after:
+        conditions.append(f"`{date_field}` >= %(after)s")
+    if extra_condition:
+        conditions.append(extra_condition)
+
+    return frappe.db.sql(
+        f"""
+        SELECT name, `{date_field}` FROM `tab{doctype}`
+        WHERE {" AND ".join(conditions)}
+        ORDER BY `{date_field}`
+        LIMIT {BATCH_SIZE}
+        """,
+        {"cutoff": cutoff, "after": after},
+    )
+
+
+def _run_in_batches(
+    cutoff: datetime,
+    apply_batch,
+    deadline: float,
+    extra_condition: str = "",
+    watermark_key: Optional[str] = None,
+    doctype: str = AUDIT_DOCTYPE,
+    date_field: str = "creation",
+) -> Dict:
+    """
+    Apply ``apply_batch`` to successive batches, committing after each.
+
+    Deleted rows drop out of the scan on their own. Passes that only update
+    rows (``extra_condition`` must then exclude already-processed rows) keep
+    their position in ``watermark_key`` so neither the next batch nor the next
+    run re-reads the rows already handled.
+    """
+    # get_datetime(None) is "now", so an unset watermark must stay None
+    watermark = frappe.db.get_global(watermark_key) if watermark_key else None
+    after = get_datetime(watermark) if watermark else None
+    processed = 0
+    while True:
+        rows = _next_batch(cutoff, extra_condition, after, doctype, date_field)
+        if not rows:
+            return {"processed": processed, "complete": True}
+
+        apply_batch([name for name, _date in rows])
+        if watermark_key:
+            after = rows[-1][1]
+            frappe.db.set_global(watermark_key, str(after))
+        frappe.db.commit()
+        processed += len(rows)
+
+        if len(rows) < BATCH_SIZE:
+            return {"processed": processed, "complete": True}
+        if time.monotonic() >= deadline:
+            return {"processed": processed, "complete": False}
+        time.sleep(BATCH_PAUSE_SECONDS)
+
+
+def _delete_rows(names: list):
+    frappe.db.delete(AUDIT_DOCTYPE, {"name": ("in", names)})
+
+
+def _clear_payloads(names: list):
+    frappe.db.sql(
+        f"""
+        UPDATE `tab{AUDIT_DOCTYPE}`
+        SET input_data = NULL, output_data = NULL, traceback = NULL
+        WHERE name IN %s
+        """,
+        (tuple(names),),
+    )
+
+
+def purge_audit_logs(
+    days_to_keep: int, payload_days_to_keep: int = 0, time_budget: float = RUN_TIME_BUDGET_SECONDS
+) -> Dict:
+    """
+    Delete audit rows older than ``days_to_keep`` and clear payloads of rows
+    older than ``payload_days_to_keep`` (0 disables the payload pass).
+
+    Stops once ``time_budget`` seconds have elapsed; the next run resumes from
+    the oldest remaining row.
+
+    Returns:
+        Dict with ``deleted``, ``payloads_cleared`` and ``complete``.
+    """
+    deadline = time.monotonic() + time_budget
+    now = now_datetime()
+
+    deleted = _run_in_batches(add_days(now, -days_to_keep), _delete_rows, deadline)
+    result = {"deleted": deleted["processed"], "payloads_cleared": 0, "complete": deleted["complete"]}
+
+    if deleted["complete"] and 0 < payload_days_to_keep < days_to_keep:
+        cleared = _run_in_batches(
+            add_days(now, -payload_days_to_keep),
+            _clear_payloads,
+            deadline,
+            extra_condition="(input_data IS NOT NULL OR output_data IS NOT NULL OR traceback IS NOT NULL)",
+            watermark_key=_PAYLOAD_WATERMARK_KEY,
+        )
+        result["payloads_cleared"] = cleared["processed"]
+        result["complete"] = cleared["complete"]
+
+    return result
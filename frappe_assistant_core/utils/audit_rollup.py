@@ -0,0 +1,352 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Hourly rollups of Assistant Audit Log.
+
+Dashboard stats, usage statistics and health checks used to scan the audit
+table with ``DATE(creation) = ...`` predicates that cannot use an index.
+``rollup_audit_logs`` (hourly scheduler job) aggregates each completed hour
+into Assistant Audit Rollup, one row per (hour, tool_name, user, status).
+
+Readers combine the rollup rows before the watermark with a live, indexed
+range scan of the audit rows after it (normally under an hour of data), so
+results stay exact without waiting for the next rollup run.
+"""
+
+import hashlib
+import math
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import frappe
+from frappe.utils import add_days, cint, flt, get_datetime, now_datetime
+
+from frappe_assistant_core.utils import audit_retention
+
+AUDIT_DOCTYPE = "Assistant Audit Log"
+ROLLUP_DOCTYPE = "Assistant Audit Rollup"
+
+# First hour not yet rolled up, stored with frappe.db.set_global
+_WATERMARK_KEY = "fac_audit_rollup_watermark"
+
+# Cap per run so a first backfill over a large history is spread across runs
+_MAX_HOURS_PER_RUN = 24 * 7
+
+_ROLLUP_FIELDS = [
+    "name",
+    "creation",
+    "modified",
+    "owner",
+    "modified_by",
+    "period_start",
+    "tool_name",
+    "user",
+    "status",
+    "call_count",
+    "timed_count",
+    "total_execution_time",
+    "min_execution_time",
+    "max_execution_time",
+    "p95_execution_time",
+]
+
+
+def _hour_floor(value) -> datetime:
+    return get_datetime(value).replace(minute=0, second=0, microsecond=0)
+
+
+def get_rollup_watermark() -> Optional[datetime]:
+    """Return the first hour not yet covered by rollups (None before the first run)."""
+    value = frappe.db.get_global(_WATERMARK_KEY)
+    return get_datetime(value) if value else None
+
+
+def _set_watermark(value: datetime):
+    frappe.db.set_global(_WATERMARK_KEY, str(value))
+
+
+def _next_audit_hour(after: Optional[datetime] = None) -> Optional[datetime]:
+    """Hour of the oldest audit row created at or after ``after`` (uses the creation index)."""
+    if after is None:
+        oldest = frappe.db.sql(f"SELECT MIN(creation) FROM `tab{AUDIT_DOCTYPE}`")[0][0]
+    else:
+        oldest = frappe.db.sql(
+            f"SELECT MIN(creation) FROM `tab{AUDIT_DOCTYPE}` WHERE creation >= %s",
+            (after,),
+        )[0][0]
+    return _hour_floor(oldest) if oldest else None
+
+
+def _p95(values: List[float]) -> float:
+    """Nearest-rank 95th percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+def _rollup_hour(start: datetime, end: datetime):
+    """(Re)build rollup rows for one hour. Idempotent: the hour is replaced."""
+    rows = frappe.db.sql(
+        f"""
+        SELECT tool_name, user, status, execution_time
+        FROM `tab{AUDIT_DOCTYPE}`
+        WHERE creation >= %s AND creation < %s
+        """,
+        (start, end),
+    )
+
+    counts = defaultdict(int)
+    times = defaultdict(list)
+    for tool_name, user, status, execution_time in rows:
+        key = (tool_name, user, status)
+        counts[key] += 1
+        if execution_time is not None:
+            times[key].append(flt(execution_time))
+
+    frappe.db.delete(ROLLUP_DOCTYPE, {"period_start": start})
+    if not counts:
+        return
+
+    now = now_datetime()
+    values = []
+    for key, call_count in counts.items():
+        tool_name, user, status = key
+        durations = times.get(key) or []
+        digest = hashlib.sha256(f"{tool_name}|{user}|{status}".encode()).hexdigest()[:12]
+        values.append(
+            (
+                f"{start:%Y%m%d%H}-{digest}",
+                now,
+                now,
+                "Administrator",
+                "Administrator",
+                start,
+                tool_name,
+                user,
+                status,
+                call_count,
+                len(durations),
+                sum(durations),
+                min(durations) if durations else None,
+                max(durations) if durations else None,
+                _p95(durations) if durations else None,
+            )
+        )
+
+    frappe.db.bulk_insert(ROLLUP_DOCTYPE, fields=_ROLLUP_FIELDS, values=values)
+
+
+def rollup_audit_logs():
+    """
+    Scheduled job: aggregate every completed hour since the watermark.
+
+    Each hour is committed with its watermark so an interrupted run resumes
+    where it stopped. Stretches with no audit rows are skipped in one step.
+    """
+    current_hour = _hour_floor(now_datetime())
+    start = get_rollup_watermark() or _next_audit_hour()
+    if start is None:
+        _set_watermark(current_hour)
+        frappe.db.commit()
+        return
+
+    processed = 0
+    while start < current_hour and processed < _MAX_HOURS_PER_RUN:
+        end = start + timedelta(hours=1)
+        _rollup_hour(start, end)
+        processed += 1
+
+        next_hour = _next_audit_hour(end)
+        start = min(next_hour, current_hour) if next_hour else current_hour
+        _set_watermark(start)
+        frappe.db.commit()
+
+    if not processed and get_rollup_watermark() is None:
+        _set_watermark(min(start, current_hour))
+        frappe.db.commit()
+
+    if processed:
+        frappe.logger().info(f"Audit rollup: aggregated {processed} hour(s), watermark {start}")
+
+
+def purge_audit_rollups(days_to_keep: int, time_budget: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Delete rollup hours that ended before the audit retention cutoff.
+
+    Runs from ``cleanup_old_logs`` alongside the audit purge, so summaries
+    never count calls whose audit rows are gone. Uses the same committed
+    batches as ``utils.audit_retention``.
+
+    Returns:
+        Dict with ``deleted`` and ``complete``.
+    """
+    if time_budget is None:
+        time_budget = audit_retention.RUN_TIME_BUDGET_SECONDS
+    cutoff = _hour_floor(add_days(now_datetime(), -days_to_keep))
+
+    result = audit_retention._run_in_batches(
+        cutoff,
+        lambda names: frappe.db.delete(ROLLUP_DOCTYPE, {"name": ("in", names)}),
+        time.monotonic() + time_budget,
+        doctype=ROLLUP_DOCTYPE,
+        date_field="period_start",
+    )
+    return {"deleted": result["processed"], "complete": result["complete"]}
+
+
+def _split_range(since: Optional[datetime]):
+    """
+    Split [since, now) into a rollup part and a live tail.
+
+    Returns (rollup_from, rollup_to, tail_from); rollup_to is None when there
+    is nothing rolled up to read. ``since`` is floored to the hour.
+    """
+    since = _hour_floor(since) if since else None
+    watermark = get_rollup_watermark()
+    if watermark is None:
+        return since, None, since
+    if since and since >= watermark:
+        return since, None, since
+    return since, watermark, watermark
+
+
+def _rollup_conditions(rollup_from, rollup_to) -> Tuple[str, list]:
+    conditions = ["period_start < %s"]
+    values = [rollup_to]
+    if rollup_from:
+        conditions.append("period_start >= %s")
+        values.append(rollup_from)
+    return " AND ".join(conditions), values
+
+
+def _tail_conditions(tail_from) -> Tuple[str, list]:
+    if tail_from:
+        return "creation >= %s", [tail_from]
+    return "1=1", []
+
+
+def get_audit_summary(since: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Call counts and timing for audit rows created at or after ``since``.
+
+    Args:
+        since: Start of the window, floored to the hour. None means all rows
+            ever rolled up plus the live tail.
+
+    Returns:
+        Dict with ``total``, ``by_status`` (status -> count) and
+        ``avg_execution_time`` (seconds, over calls that recorded one).
+    """
+    rollup_from, rollup_to, tail_from = _split_range(since)
+    by_status = defaultdict(int)
+    timed_count = 0
+    total_time = 0.0
+
+    if rollup_to:
+        where, values = _rollup_conditions(rollup_from, rollup_to)
+        for status, count, timed, seconds in frappe.db.sql(
+            f"""
+            SELECT status, SUM(call_count), SUM(timed_count), SUM(total_execution_time)
+            FROM `tab{ROLLUP_DOCTYPE}`
+            WHERE {where}
+            GROUP BY status
+            """,
+            values,
+        ):
+            by_status[status] += cint(count)
+            timed_count += cint(timed)
+            total_time += flt(seconds)
+
+    where, values = _tail_conditions(tail_from)
+    for status, count, timed, seconds in frappe.db.sql(
+        f"""
+        SELECT status, COUNT(*), COUNT(execution_time), SUM(execution_time)
+        FROM `tab{AUDIT_DOCTYPE}`
+        WHERE {where}
+        GROUP BY status
+        """,
+        values,
+    ):
+        by_status[status] += cint(count)
+        timed_count += cint(timed)
+        total_time += flt(seconds)
+
+    return {
+        "total": sum(by_status.values()),
+        "by_status": dict(by_status),
+        "avg_execution_time": (total_time / timed_count) if timed_count else 0,
+    }
+
+
+def get_tool_stats(since: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-tool call counts and timing since ``since`` (rows without a tool_name
+    are excluded).
+
+    Returns:
+        tool_name -> {"count", "timed_count", "total_execution_time",
+        "max_execution_time"}
+    """
+    rollup_from, rollup_to, tail_from = _split_range(since)
+    stats = defaultdict(
+        lambda: {"count": 0, "timed_count": 0, "total_execution_time": 0.0, "max_execution_time": 0.0}
+    )
+
+    def _merge(rows):
+        for tool_name, count, timed, seconds, slowest in rows:
+            entry = stats[tool_name]
+            entry["count"] += cint(count)
+            entry["timed_count"] += cint(timed)
+            entry["total_execution_time"] += flt(seconds)
+            entry["max_execution_time"] = max(entry["max_execution_time"], flt(slowest))
+
+    if rollup_to:
+        where, values = _rollup_conditions(rollup_from, rollup_to)
+        _merge(
+            frappe.db.sql(
+                f"""
+                SELECT tool_name, SUM(call_count), SUM(timed_count),
+                    SUM(total_execution_time), MAX(max_execution_time)
+                FROM `tab{ROLLUP_DOCTYPE}`
+                WHERE {where} AND tool_name IS NOT NULL
+                GROUP BY tool_name
+                """,
+                values,
+            )
+        )
+
+    where, values = _tail_conditions(tail_from)
+    _merge(
+        frappe.db.sql(
+            f"""
+            SELECT tool_name, COUNT(*), COUNT(execution_time), SUM(execution_time), MAX(execution_time)
+            FROM `tab{AUDIT_DOCTYPE}`
+            WHERE {where} AND tool_name IS NOT NULL
+            GROUP BY tool_name
+            """,
+            values,
+        )
+    )
+
+    return dict(stats)
+
+
+def get_most_used_tools(since: Optional[datetime] = None, limit: int = 5) -> List[Dict[str, Any]]:
+    """Top tools by call count, shaped like the old ``GROUP BY tool_name`` query."""
+    ranked = sorted(get_tool_stats(since).items(), key=lambda item: item[1]["count"], reverse=True)
+    return [frappe._dict(tool_name=name, count=entry["count"]) for name, entry in ranked[:limit]]
@@ -70,6 +70,8 @@ def log_tool_execution(
     error_type: Optional[str] = None,
     traceback_str: Optional[str] = None,
     output_data: Optional[Any] = None,
+    profile: Optional[str] = None,
+    query_stats: Optional[Dict[str, Any]] = None,
 ):
     """
     Log tool execution for comprehensive audit trail.
@@ -88,6 +90,8 @@ def log_tool_execution(
             "PermissionError", "ValidationError", "ToolReportedError")
         traceback_str: Full Python traceback (exception paths only)
         output_data: Tool output data for audit trail
+        profile: Assistant Tool Profile captured for this call, if any
+        query_stats: SQL accounting for the call (see ``utils.query_stats``)
     """
     try:
         if status not in _VALID_STATUSES:
@@ -116,6 +120,11 @@ def log_tool_execution(
             except (TypeError, ValueError):
                 input_data_str = str(sanitized_arguments)[:_OUTPUT_DATA_MAX_BYTES]
 
+        query_stats = query_stats or {}
+        n_plus_one = "\n".join(
+            f"{entry['count']}x {entry['query']}" for entry in query_stats.get("n_plus_one") or []
+        )
+
         audit_doc = frappe.get_doc(
             {
                 "doctype": "Assistant Audit Log",
@@ -137,6 +146,12 @@ def log_tool_execution(
                 "error_message": error_message,
                 "error_type": error_type,
                 "traceback": traceback_str,
+                "profile": profile,
+                "query_count": query_stats.get("query_count"),
+                "db_time": query_stats.get("db_time"),
+                "rows_returned": query_stats.get("rows_returned"),
+                "duplicate_queries": query_stats.get("duplicate_queries"),
+                "n_plus_one_queries": n_plus_one[:_OUTPUT_DATA_MAX_BYTES] or None,
             }
         )
 
@@ -14,8 +14,11 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import hashlib
+
 import frappe
 from frappe import _
+from frappe.utils import now_datetime
 
 
 def get_user_roles(user):
@@ -75,3 +78,108 @@ def validate_api_credentials(api_key, api_secret):
         return None
     except Exception:
         return None
+
+
+# MCP authentication cache
+# ------------------------
+# Successful MCP credential checks are cached for a short TTL, keyed by a
+# SHA-256 of the credential so raw tokens and secrets never reach Redis.
+# Each user keeps a set of their live cache keys so a User save (disable,
+# API secret rotation, assistant_enabled toggle) or a bearer token update
+# can drop them immediately. Token revocation through the OAuth revoke
+# endpoint uses db.set_value and fires no doc events, so entries for bearer
+# tokens also re-read the token's status (a primary-key lookup) on every hit.
+
+AUTH_CACHE_TTL = 60  # seconds
+
+
+def _auth_cache_key(credential: str) -> str:
+    return "fac_mcp_auth_" + hashlib.sha256(credential.encode()).hexdigest()
+
+
+def _auth_index_key(user: str) -> str:
+    return f"fac_mcp_auth_keys_{user}"
+
+
+def get_cached_auth(credential: str):
+    """
+    Return the cached auth entry (``user``, ``expires_at``,
+    ``assistant_enabled``) for a credential, or None on miss/expiry or when
+    the cached bearer token is no longer Active.
+    """
+    from frappe_assistant_core.utils.metrics import record_cache_lookup
+
+    key = _auth_cache_key(credential)
+    try:
+        entry = frappe.cache.get_value(key)
+    except Exception:
+        return None
+
+    if entry and entry.get("expires_at") and entry["expires_at"] < now_datetime():
+        entry = None
+    if entry and entry.get("token_name"):
+        if frappe.db.get_value("OAuth Bearer Token", entry["token_name"], "status") != "Active":
+            entry = None
+            try:
+                frappe.cache.delete_value(key)
+            except Exception as e:
+                frappe.logger().debug(f"Failed to drop revoked MCP auth cache entry: {e}")
+    record_cache_lookup("auth", bool(entry))
+    return entry or None
+
+
+def set_cached_auth(
+    credential: str, user: str, assistant_enabled: bool, expires_at=None, token_name: str = None
+):
+    """
+    Cache a validated credential, never beyond the credential's own expiry.
+
+    ``token_name`` is the OAuth Bearer Token the credential resolved to; its
+    status is re-checked whenever the entry is served.
+    """
+    ttl = AUTH_CACHE_TTL
+    if expires_at:
+        remaining = int((expires_at - now_datetime()).total_seconds())
+        if remaining <= 0:
+            return
+        ttl = min(ttl, remaining)
+
+    key = _auth_cache_key(credential)
+    index_key = _auth_index_key(user)
+    try:
+        frappe.cache.set_value(
+            key,
+            {
+                "user": user,
+                "expires_at": expires_at,
+                "assistant_enabled": assistant_enabled,
+                "token_name": token_name,
+            },
+            expires_in_sec=ttl,
+        )
+        frappe.cache.sadd(index_key, key)
+        frappe.cache.expire(frappe.cache.make_key(index_key), AUTH_CACHE_TTL)
+    except Exception as e:
+        frappe.logger().debug(f"Failed to cache MCP auth for {user}: {e}")
+
+
+def invalidate_auth_cache(doc=None, method=None):
+    """
+    Drop cached MCP auth entries for a user.
+
+    Wired to User and OAuth Bearer Token doc events; ``doc.user`` is used for
+    bearer tokens and ``doc.name`` for users.
+    """
+    user = getattr(doc, "user", None) if getattr(doc, "doctype", None) == "OAuth Bearer Token" else None
+    user = user or getattr(doc, "name", None)
+    if not user:
+        return
+
+    index_key = _auth_index_key(user)
+    try:
+        keys = [frappe.safe_decode(k) for k in frappe.cache.smembers(index_key)]
+        if keys:
+            frappe.cache.delete_value(keys)
+        frappe.cache.delete_value(index_key)
+    except Exception as e:
+        frappe.logger().warning(f"Failed to invalidate MCP auth cache for {user}: {e}")
@@ -19,6 +19,7 @@ Enhanced caching system for Frappe Assistant Core
 Leverages Frappe's built-in Redis caching with smart invalidation
 """
 
+import hashlib
 import json
 import time
 from functools import wraps
@@ -28,6 +29,8 @@ import frappe
 from frappe.utils import cint, flt
 from frappe.utils.caching import redis_cache, site_cache
 
+from frappe_assistant_core.utils.metrics import record_cache_lookup
+
 # Cache TTL constants (in seconds)
 CACHE_TTL = {
     "dashboard_stats": 300,  # 5 minutes - frequently accessed
@@ -39,6 +42,10 @@ CACHE_TTL = {
     "analytics": 600,  # 10 minutes - performance analytics
 }
 
+# Minimum seconds between invalidations triggered by high-frequency sources
+# (audit inserts). Readers apply a suppressed invalidation once the window ends.
+DASHBOARD_INVALIDATION_WINDOW = 30
+
 # Cache key prefixes
 CACHE_KEYS = {
     "dashboard": "assistant_dashboard",
@@ -58,6 +65,130 @@ def get_cache_key(prefix: str, *args) -> str:
     return prefix
 
 
+# Generation counters and their gate/pending markers live under "fac_gen_",
+# which no pattern delete matches ("assistant_*" is wiped on every settings
+# save). A counter reset to 0 could climb back to a generation that a
+# per-worker memo still holds, which would then be served as current.
+
+
+def _version_key(name: str) -> str:
+    """Site-namespaced Redis key holding the generation counter for ``name``."""
+    return frappe.cache.make_key(f"fac_gen_version_{name}")
+
+
+def get_cache_version(name: str) -> int:
+    """
+    Return the current generation of a cache family.
+
+    Generation counters are plain Redis integers, so they are read with a raw
+    GET rather than ``frappe.cache.get_value`` (which expects pickled values).
+    Returns 0 when the counter was never bumped or Redis is unreachable.
+    """
+    try:
+        return cint(frappe.cache.get(_version_key(name)))
+    except Exception:
+        return 0
+
+
+def get_cache_versions(*names: str) -> tuple:
+    """Generations of several cache families in one Redis round trip (0 on failure)."""
+    try:
+        return tuple(cint(v) for v in frappe.cache.mget([_version_key(name) for name in names]))
+    except Exception:
+        return (0,) * len(names)
+
+
+def bump_cache_version(name: str) -> int:
+    """
+    Atomically advance the generation of a cache family.
+
+    Entries keyed by the previous generation are never read again and simply
+    expire through their TTL, so invalidation costs a single INCR.
+    """
+    try:
+        return cint(frappe.cache.incr(_version_key(name)))
+    except Exception as e:
+        frappe.logger().warning(f"Failed to bump cache version for {name}: {e}")
+        return 0
+
+
+def _gate_key(name: str) -> str:
+    return frappe.cache.make_key(f"fac_gen_gate_{name}")
+
+
+def _pending_key(name: str) -> str:
+    return frappe.cache.make_key(f"fac_gen_pending_{name}")
+
+
+def invalidate_cache_family(name: str, coalesce_seconds: int = 0):
+    """
+    Invalidate every entry of a cache family.
+
+    With ``coalesce_seconds``, at most one generation bump happens per window:
+    the first call bumps immediately, later calls in the window only leave a
+    pending marker, which the next reader after the window applies (see
+    ``_settled_cache_version``). Entries therefore lag a suppressed
+    invalidation by no more than the window.
+    """
+    if not coalesce_seconds:
+        bump_cache_version(name)
+        return
+
+    try:
+        if frappe.cache.set(_gate_key(name), 1, ex=coalesce_seconds, nx=True):
+            bump_cache_version(name)
+        else:
+            frappe.cache.set(_pending_key(name), 1, ex=max(CACHE_TTL.values()))
+    except Exception as e:
+        frappe.logger().warning(f"Failed to invalidate cache family {name}: {e}")
+
+
+def _settled_cache_version(name: str) -> int:
+    """Current generation of ``name``, applying a pending coalesced invalidation."""
+    try:
+        version, pending, gate = frappe.cache.mget([_version_key(name), _pending_key(name), _gate_key(name)])
+    except Exception:
+        return 0
+
+    if pending and not gate:
+        frappe.cache.delete(_pending_key(name))
+        return bump_cache_version(name)
+    return cint(version)
+
+
+def versioned_cache(family: str, ttl: int, user: bool = False):
+    """
+    Cache decorator whose keys embed the generation of ``family``.
+
+    Invalidating the family (``invalidate_cache_family``) is a single INCR;
+    entries of older generations are never read again and expire via ``ttl``.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = [func.__name__, f"v{_settled_cache_version(family)}"]
+            if user:
+                parts.append(frappe.session.user)
+            if args or kwargs:
+                parts.append(hashlib.sha256(frappe.as_json([args, kwargs]).encode()).hexdigest()[:16])
+            cache_key = get_cache_key(f"assistant_{family}", *parts)
+
+            cached_result = frappe.cache.get_value(cache_key)
+            record_cache_lookup(family, cached_result is not None)
+            if cached_result is not None:
+                return cached_result
+
+            result = func(*args, **kwargs)
+            frappe.cache.set_value(cache_key, result, expires_in_sec=ttl)
+            return result
+
+        wrapper.cache_family = family
+        return wrapper
+
+    return decorator
+
+
 def cache_with_user_context(ttl=300, shared=False):
     """Custom cache decorator that includes user context"""
 
@@ -113,10 +244,12 @@ def cache_with_invalidation(ttl=300, invalidation_keys=None):
     return decorator
 
 
-@redis_cache(ttl=CACHE_TTL["server_settings"])
+@versioned_cache("server_settings", ttl=CACHE_TTL["server_settings"])
 def get_cached_server_settings():
     """Cached version of server settings"""
-    settings = frappe.get_single("Assistant Core Settings")
+    from frappe_assistant_core.utils.settings import get_assistant_settings
+
+    settings = get_assistant_settings()
 
     # Get full server URL for MCP endpoint
     frappe_url = frappe.utils.get_url()
@@ -130,20 +263,22 @@ def get_cached_server_settings():
     }
 
 
-@redis_cache(ttl=CACHE_TTL["dashboard_stats"], user=True)
+@versioned_cache("dashboard", ttl=CACHE_TTL["dashboard_stats"], user=True)
 def get_cached_dashboard_stats():
     """Cached dashboard statistics - user-specific for permission context"""
     from frappe.utils import today
 
+    from frappe_assistant_core.utils.audit_rollup import get_audit_summary
+
     # Batch all database queries for efficiency
     stats_data = {}
 
-    # API usage statistics (replacing connection stats)
-    api_usage_today = frappe.db.count("Assistant Audit Log", filters={"creation": [">=", today()]})
+    # One rollup-backed summary serves both API usage and action statistics
+    summary_today = get_audit_summary(today())
 
     stats_data["connections"] = {
         "active": 0,  # No persistent connections in HTTP-based MCP
-        "today_total": api_usage_today or 0,  # API calls today
+        "today_total": summary_today["total"],  # API calls today
     }
 
     # Tool statistics from plugin manager
@@ -161,20 +296,8 @@ def get_cached_dashboard_stats():
         stats_data["tools"] = {"total": 0, "enabled": 0}
 
     # Action statistics for today
-    action_stats = frappe.db.sql(
-        """
-        SELECT
-            COUNT(*) as total_actions,
-            COUNT(CASE WHEN status = 'Success' THEN 1 END) as successful_actions
-        FROM `tabAssistant Audit Log`
-        WHERE DATE(creation) = %s
-    """,
-        (today(),),
-        as_dict=True,
-    )
-
-    total_actions = action_stats[0]["total_actions"] if action_stats else 0
-    successful_actions = action_stats[0]["successful_actions"] if action_stats else 0
+    total_actions = summary_today["total"]
+    successful_actions = summary_today["by_status"].get("Success", 0)
     success_rate = (successful_actions / total_actions * 100) if total_actions > 0 else 0
 
     stats_data["performance"] = {"actions_today": total_actions, "success_rate": round(success_rate, 2)}
@@ -182,58 +305,55 @@ def get_cached_dashboard_stats():
     return stats_data
 
 
-@redis_cache(ttl=CACHE_TTL["dashboard_stats"])
+@versioned_cache("dashboard", ttl=CACHE_TTL["dashboard_stats"])
 def get_cached_most_used_tools():
     """Cache most used tools separately - can have different TTL"""
     from frappe.utils import today
 
-    most_used_tools = frappe.db.sql(
-        """
-        SELECT tool_name, COUNT(*) as count
-        FROM `tabAssistant Audit Log`
-        WHERE DATE(creation) = %s AND tool_name IS NOT NULL
-        GROUP BY tool_name
-        ORDER BY count DESC
-        LIMIT 5
-    """,
-        (today(),),
-        as_dict=True,
-    )
+    from frappe_assistant_core.utils.audit_rollup import get_most_used_tools
 
-    return most_used_tools
+    return get_most_used_tools(today(), limit=5)
 
 
-@redis_cache(ttl=CACHE_TTL["analytics"])
+@versioned_cache("dashboard", ttl=CACHE_TTL["analytics"])
 def get_cached_category_performance():
     """Cache category performance analytics"""
     from frappe.utils import today
 
-    # Since we no longer have tool categories in a registry, group by tool name patterns
-    category_performance = frappe.db.sql(
-        """
-        SELECT
-            CASE
-                WHEN tool_name LIKE 'document_%' THEN 'Document Operations'
-                WHEN tool_name LIKE 'report_%' THEN 'Reports'
-                WHEN tool_name LIKE 'search_%' THEN 'Search'
-                WHEN tool_name LIKE 'metadata_%' THEN 'Metadata'
-                WHEN tool_name LIKE 'execute_%' OR tool_name LIKE 'analyze_%' THEN 'Analysis'
-                ELSE 'Other'
-            END as category,
-            AVG(execution_time) as avg_time,
-            COUNT(*) as count
-        FROM `tabAssistant Audit Log`
-        WHERE DATE(creation) = %s AND execution_time IS NOT NULL
-        GROUP BY category
-        ORDER BY avg_time DESC
-    """,
-        (today(),),
-        as_dict=True,
-    )
+    from frappe_assistant_core.utils.audit_rollup import get_tool_stats
 
+    # Since we no longer have tool categories in a registry, group by tool name patterns
+    totals = {}
+    for tool_name, entry in get_tool_stats(today()).items():
+        if not entry["timed_count"]:
+            continue
+        category = _category_for_tool_name(tool_name)
+        count, seconds = totals.get(category, (0, 0.0))
+        totals[category] = (count + entry["timed_count"], seconds + entry["total_execution_time"])
+
+    category_performance = [
+        frappe._dict(category=category, avg_time=seconds / count, count=count)
+        for category, (count, seconds) in totals.items()
+    ]
+    category_performance.sort(key=lambda row: row.avg_time, reverse=True)
     return category_performance
 
 
+def _category_for_tool_name(tool_name: str) -> str:
+    """Dashboard category from tool name prefix."""
+    if tool_name.startswith("document_"):
+        return "Document Operations"
+    if tool_name.startswith("report_"):
+        return "Reports"
+    if tool_name.startswith("search_"):
+        return "Search"
+    if tool_name.startswith("metadata_"):
+        return "Metadata"
+    if tool_name.startswith(("execute_", "analyze_")):
+        return "Analysis"
+    return "Other"
+
+
 @site_cache(ttl=CACHE_TTL["tool_registry"])
 def get_cached_tool_registry_stats():
     """Cache tool registry statistics - process-local cache"""
@@ -268,7 +388,7 @@ def get_cached_user_tool_permissions(user=None):
     }
 
 
-@redis_cache(ttl=CACHE_TTL["system_health"])
+@versioned_cache("dashboard", ttl=CACHE_TTL["system_health"])
 def get_cached_system_health():
     """Cache system health check results"""
     from frappe.utils import today
@@ -297,9 +417,9 @@ def get_cached_system_health():
             health_status["checks_passed"] += len(required_doctypes)
 
         # Check recent error rates from audit logs
-        recent_errors = frappe.db.count(
-            "Assistant Audit Log", filters={"status": "Error", "creation": [">=", today()]}
-        )
+        from frappe_assistant_core.utils.audit_rollup import get_audit_summary
+
+        recent_errors = get_audit_summary(today())["by_status"].get("Error", 0)
 
         if recent_errors > 10:
             health_status["warnings"] += 1
@@ -315,10 +435,12 @@ def get_cached_system_health():
 # Cache invalidation functions
 def invalidate_settings_cache(doc=None, method=None):
     """Invalidate settings-related caches"""
-    cache_keys = [get_cache_key(CACHE_KEYS["settings"]), "get_cached_server_settings"]
+    from frappe_assistant_core.utils.settings import invalidate_assistant_settings
 
-    for key in cache_keys:
-        frappe.cache.delete_key(key)
+    invalidate_assistant_settings()
+    invalidate_cache_family("server_settings")
+
+    frappe.cache.delete_key(get_cache_key(CACHE_KEYS["settings"]))
 
     # Mark settings as modified for dependent caches
     frappe.cache.set_value("settings_modified", frappe.utils.now(), expires_in_sec=3600)
@@ -327,15 +449,19 @@ def invalidate_settings_cache(doc=None, method=None):
 def invalidate_dashboard_cache(doc=None, method=None):
     """Invalidate dashboard-related caches
 
+    Runs after every audit insert, so invalidation is a coalesced generation
+    bump rather than pattern deletes over the keyspace.
+
     Args:
         doc: Document instance (passed by hooks)
         method: Method name (passed by hooks)
     """
-    # Clear all user-specific dashboard caches
-    frappe.cache.delete_keys("get_cached_dashboard_stats_*")
-    frappe.cache.delete_keys("assistant_dashboard_*")
-    frappe.cache.delete_key("get_cached_most_used_tools")
-    frappe.cache.delete_key("get_cached_category_performance")
+    invalidate_cache_family("dashboard", coalesce_seconds=DASHBOARD_INVALIDATION_WINDOW)
+
+
+def invalidate_search_doctypes_cache(doc=None, method=None):
+    """Invalidate the readable-DocType lists of global search (DocType / permission changes)"""
+    invalidate_cache_family("search_doctypes")
 
 
 def invalidate_tool_registry_cache():
@@ -160,9 +160,10 @@ def get_system_health_check():
             health_status["checks"].append(f"{enabled_tools} of {tool_count} tools enabled")
 
         # Check 4: Recent connection issues (using audit log as proxy)
-        recent_errors = frappe.db.count(
-            "Assistant Audit Log", filters={"status": "Error", "creation": [">=", today()]}
-        )
+        from frappe_assistant_core.utils.audit_rollup import get_audit_summary
+
+        summary_today = get_audit_summary(today())
+        recent_errors = summary_today["by_status"].get("Error", 0)
 
         if recent_errors > 10:
             health_status["warnings"].append(f"High number of tool errors today: {recent_errors}")
@@ -172,12 +173,8 @@ def get_system_health_check():
             health_status["checks"].append("No tool errors today")
 
         # Check 5: Tool execution health
-        failed_executions = frappe.db.count(
-            "Assistant Audit Log",
-            filters={"status": ["in", ["Error", "Timeout"]], "creation": [">=", today()]},
-        )
-
-        total_executions = frappe.db.count("Assistant Audit Log", filters={"creation": [">=", today()]})
+        failed_executions = recent_errors + summary_today["by_status"].get("Timeout", 0)
+        total_executions = summary_today["total"]
 
         if total_executions > 0:
             failure_rate = (failed_executions / total_executions) * 100
@@ -31,7 +31,6 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
 import frappe
-import psutil
 
 from frappe_assistant_core.utils.cache import get_cached_server_settings
 from frappe_assistant_core.utils.logger import api_logger
@@ -184,6 +183,8 @@ class ResourceMonitor:
 
     def _monitor_resources(self, operation_id: str):
         """Monitor resources in background thread"""
+        import psutil
+
         try:
             process = psutil.Process()
 
@@ -553,6 +554,8 @@ def get_resource_usage_stats() -> Dict[str, Any]:
         if not frappe.has_permission("System Manager"):
             return {"success": False, "message": "Insufficient permissions"}
 
+        import psutil
+
         # Get current system stats
         cpu_percent = psutil.cpu_percent(interval=1)
         memory = psutil.virtual_memory()
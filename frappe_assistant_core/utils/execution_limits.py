@@ -263,21 +263,15 @@ def get_execution_limits_from_settings() -> Dict[str, int]:
         Dict with timeout_seconds, max_memory_mb, max_cpu_seconds, max_recursion_depth
     """
     try:
-        settings = frappe.get_cached_doc("Assistant Core Settings")
+        from frappe_assistant_core.utils.settings import get_assistant_settings
+
+        settings = get_assistant_settings()
 
         return {
-            "timeout_seconds": getattr(settings, "code_execution_timeout", DEFAULT_TIMEOUT_SECONDS)
-            or DEFAULT_TIMEOUT_SECONDS,
-            "max_memory_mb": getattr(settings, "code_execution_max_memory_mb", DEFAULT_MAX_MEMORY_MB)
-            or DEFAULT_MAX_MEMORY_MB,
-            "max_cpu_seconds": getattr(
-                settings, "code_execution_max_cpu_seconds", DEFAULT_MAX_CPU_TIME_SECONDS
-            )
-            or DEFAULT_MAX_CPU_TIME_SECONDS,
-            "max_recursion_depth": getattr(
-                settings, "code_execution_max_recursion", DEFAULT_MAX_RECURSION_DEPTH
-            )
-            or DEFAULT_MAX_RECURSION_DEPTH,
+            "timeout_seconds": settings.code_execution_timeout or DEFAULT_TIMEOUT_SECONDS,
+            "max_memory_mb": settings.code_execution_max_memory_mb or DEFAULT_MAX_MEMORY_MB,
+            "max_cpu_seconds": settings.code_execution_max_cpu_seconds or DEFAULT_MAX_CPU_TIME_SECONDS,
+            "max_recursion_depth": settings.code_execution_max_recursion or DEFAULT_MAX_RECURSION_DEPTH,
         }
     except Exception:
         # Return defaults if settings can't be loaded
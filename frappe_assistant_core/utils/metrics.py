@@ -0,0 +1,221 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Process-local metrics registry aggregated across workers through Redis.
+
+Each worker accumulates counter and histogram deltas in memory and flushes
+them to a per-site Redis hash (one pipelined HINCRBYFLOAT per changed
+series) at most every ``FLUSH_INTERVAL`` seconds. ``render_metrics`` reads
+the hash and renders the Prometheus text exposition format, so any worker
+can serve a scrape covering all of them. Deltas not yet flushed by another
+worker show up on its next flush.
+
+Collection can be turned off with ``"fac_metrics_enabled": 0`` in
+site_config.json.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import frappe
+
+FLUSH_INTERVAL = 5.0
+
+_DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# name -> (type, help, histogram buckets)
+METRICS = {
+    "fac_tool_call_duration_seconds": (
+        "histogram",
+        "Tool execution time by tool, status and plugin",
+        _DEFAULT_BUCKETS,
+    ),
+    "fac_mcp_requests_total": ("counter", "MCP JSON-RPC requests by method", None),
+    "fac_auth_duration_seconds": ("histogram", "MCP request authentication time by result", _DEFAULT_BUCKETS),
+    "fac_cache_requests_total": ("counter", "Cache lookups by cache family and result", None),
+    "fac_subprocess_spawn_seconds": ("histogram", "Time to spawn a sandbox subprocess", _DEFAULT_BUCKETS),
+    "fac_subprocess_duration_seconds": (
+        "histogram",
+        "Wall time of sandbox subprocess runs",
+        _DEFAULT_BUCKETS,
+    ),
+}
+
+# Gauges computed at scrape time rather than accumulated
+_QUEUE_DEPTH_METRIC = "fac_background_queue_depth"
+
+_lock = threading.Lock()
+# site -> series line (e.g. 'fac_mcp_requests_total{method="ping"}') -> delta
+_pending: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+_last_flush: Dict[str, float] = {}
+
+
+def _enabled() -> bool:
+    return bool(getattr(frappe.local, "site", None)) and frappe.conf.get("fac_metrics_enabled", 1)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _series(name: str, labels: Optional[Dict] = None) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{_escape(labels[key])}"' for key in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+def _redis_key() -> str:
+    return frappe.cache.make_key("fac_metrics")
+
+
+def _record(deltas: Dict[str, float]):
+    site = frappe.local.site
+    with _lock:
+        pending = _pending[site]
+        for series, value in deltas.items():
+            pending[series] += value
+        due = time.monotonic() - _last_flush.get(site, 0) >= FLUSH_INTERVAL
+    if due:
+        flush()
+
+
+def inc(name: str, labels: Optional[Dict] = None, value: float = 1):
+    """Increment a counter."""
+    if not _enabled():
+        return
+    _record({_series(name, labels): value})
+
+
+def observe(name: str, value: float, labels: Optional[Dict] = None):
+    """Record one histogram observation (cumulative buckets, sum and count)."""
+    if not _enabled():
+        return
+
+    labels = labels or {}
+    deltas = {
+        _series(f"{name}_sum", labels): value,
+        _series(f"{name}_count", labels): 1,
+        _series(f"{name}_bucket", {**labels, "le": "+Inf"}): 1,
+    }
+    for bound in METRICS[name][2]:
+        if value <= bound:
+            deltas[_series(f"{name}_bucket", {**labels, "le": repr(bound)})] = 1
+    _record(deltas)
+
+
+@contextmanager
+def timer(name: str, labels: Optional[Dict] = None):
+    """Observe the wall time of the enclosed block."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, labels)
+
+
+def record_cache_lookup(family: str, hit: bool):
+    inc("fac_cache_requests_total", {"family": family, "result": "hit" if hit else "miss"})
+
+
+def flush_if_due(*args, **kwargs):
+    """after_request hook: flush when the interval has elapsed."""
+    site = getattr(frappe.local, "site", None)
+    if site and _pending.get(site) and time.monotonic() - _last_flush.get(site, 0) >= FLUSH_INTERVAL:
+        flush()
+
+
+def flush():
+    """Push this worker's pending deltas for the current site to Redis."""
+    site = getattr(frappe.local, "site", None)
+    if not site:
+        return
+
+    with _lock:
+        pending = _pending.pop(site, None)
+        _last_flush[site] = time.monotonic()
+    if not pending:
+        return
+
+    try:
+        pipe = frappe.cache.pipeline()
+        key = _redis_key()
+        for series, value in pending.items():
+            pipe.hincrbyfloat(key, series, value)
+        pipe.execute()
+    except Exception as e:
+        frappe.logger().warning(f"Failed to flush metrics: {e}")
+
+
+def _family_of(series: str) -> str:
+    name = series.split("{", 1)[0]
+    for suffix in ("_bucket", "_sum", "_count"):
+        base = name[: -len(suffix)]
+        if name.endswith(suffix) and METRICS.get(base, ("",))[0] == "histogram":
+            return base
+    return name
+
+
+def _queue_depths() -> Dict[str, int]:
+    try:
+        from frappe.utils.background_jobs import get_queue, get_queue_list
+
+        return {queue: get_queue(queue).count for queue in get_queue_list()}
+    except Exception:
+        return {}
+
+
+def _format_value(value: float) -> str:
+    """Full precision: counters and sums past 1e6 must not be rounded to 6 digits."""
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render_metrics() -> str:
+    """Render all series for the current site in Prometheus text format."""
+    flush()
+
+    # Raw HGETALL: the key is already site-namespaced and the values are
+    # HINCRBYFLOAT strings, which frappe.cache.hgetall would re-prefix and unpickle
+    try:
+        raw = frappe.cache.execute_command("HGETALL", _redis_key()) or {}
+    except Exception as e:
+        frappe.logger().warning(f"Failed to read metrics: {e}")
+        raw = {}
+    families = defaultdict(list)
+    for series, value in raw.items():
+        series = series.decode() if isinstance(series, bytes) else series
+        value = float(value.decode() if isinstance(value, bytes) else value)
+        families[_family_of(series)].append(f"{series} {_format_value(value)}")
+
+    lines = []
+    for name in sorted(families):
+        metric_type, help_text, _buckets = METRICS.get(name, ("untyped", "", None))
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(sorted(families[name]))
+
+    depths = _queue_depths()
+    if depths:
+        lines.append(f"# HELP {_QUEUE_DEPTH_METRIC} Jobs waiting in each background queue")
+        lines.append(f"# TYPE {_QUEUE_DEPTH_METRIC} gauge")
+        lines.extend(f"{_series(_QUEUE_DEPTH_METRIC, {'queue': q})} {n}" for q, n in sorted(depths.items()))
+
+    return "\n".join(lines) + "\n"
@@ -71,12 +71,53 @@ def after_migrate():
     # Install/update skills from other apps
     _install_app_skills()
 
+    # Patches may touch FAC Skill rows without going through the controller
+    _invalidate_skill_catalog()
+
     # Sync plugin configurations from discovered plugins
     _sync_plugin_configurations()
 
+    # Describe plugin tools so workers can list them without importing them
+    _build_tool_manifest()
+
     # Sync tool configurations from discovered plugins
     _sync_tool_configurations()
 
+    # Reports and their .js files may have changed
+    _build_report_requirements_index()
+
+
+def _build_tool_manifest():
+    """Record each plugin tool's listing metadata so workers import tools on first use."""
+    try:
+        from frappe_assistant_core.utils.tool_manifest import build_tool_manifest
+
+        built = build_tool_manifest()
+        frappe.logger("migration_hooks").info(f"Built tool manifest for {built} tools")
+    except Exception as e:
+        frappe.logger("migration_hooks").warning(f"Failed to build tool manifest: {e}")
+
+
+def _build_report_requirements_index():
+    """Parse report filters once so report_requirements serves them from the index."""
+    try:
+        from frappe_assistant_core.plugins.core.tools.report_index import build_report_index
+
+        built = build_report_index()
+        frappe.logger("migration_hooks").info(f"Built report requirements index for {built} reports")
+    except Exception as e:
+        frappe.logger("migration_hooks").warning(f"Failed to build report requirements index: {e}")
+
+
+def _invalidate_skill_catalog():
+    """Drop the cached skill catalog so workers reload it after migration."""
+    try:
+        from frappe_assistant_core.api.handlers.resources import invalidate_skill_catalog
+
+        invalidate_skill_catalog()
+    except Exception as e:
+        frappe.logger("migration_hooks").warning(f"Failed to invalidate skill catalog: {e}")
+
 
 def before_migrate():
     """
@@ -141,6 +182,9 @@ def after_install():
     # Sync plugin configurations from discovered plugins
     _sync_plugin_configurations()
 
+    # Describe plugin tools so workers can list them without importing them
+    _build_tool_manifest()
+
     # Sync tool configurations from discovered plugins
     _sync_tool_configurations()
 
@@ -937,7 +981,8 @@ def _sync_tool_configurations():
     2. Creates FAC Tool Configuration records for new tools
     3. Auto-detects tool categories
     4. Removes orphan configurations for tools that no longer exist
-    5. Does NOT modify existing configurations (preserves user changes)
+    5. Re-detects the category of existing tools whose source file changed,
+       unless the category was overridden (other user changes are preserved)
     """
     try:
         # Check if FAC Tool Configuration table exists
@@ -947,8 +992,10 @@ def _sync_tool_configurations():
             )
             return
 
+        from frappe_assistant_core.utils.cache import bump_cache_version
         from frappe_assistant_core.utils.plugin_manager import get_plugin_manager
-        from frappe_assistant_core.utils.tool_category_detector import detect_tool_category
+        from frappe_assistant_core.utils.tool_category_detector import detect_tool_category, get_source_hash
+        from frappe_assistant_core.utils.tool_manifest import unwrap_tool
 
         plugin_manager = get_plugin_manager()
 
@@ -962,21 +1009,46 @@ def _sync_tool_configurations():
         # Build set of all discovered tool names
         discovered_tool_names = set(all_tools.keys()) | set(external_tools.keys())
 
+        existing = {
+            row.name: row
+            for row in frappe.get_all(
+                "FAC Tool Configuration",
+                fields=["name", "category_override", "auto_detected_category", "category_source_hash"],
+            )
+        }
+
         created_count = 0
         skipped_count = 0
         deleted_count = 0
+        redetected_count = 0
+
+        def _detect(instance):
+            try:
+                return detect_tool_category(instance), get_source_hash(instance.__class__)
+            except Exception:
+                return "read_write", ""
+
+        def _refresh_category(tool_name, instance):
+            row = existing[tool_name]
+            source_hash = get_source_hash(instance.__class__)
+            if row.category_override or not source_hash or row.category_source_hash == source_hash:
+                return 0
+            category, source_hash = _detect(instance)
+            values = {"auto_detected_category": category, "category_source_hash": source_hash}
+            if category != row.auto_detected_category:
+                values["tool_category"] = category
+            frappe.db.set_value("FAC Tool Configuration", tool_name, values, update_modified=False)
+            return 1
 
         # Process plugin tools
         for tool_name, tool_info in all_tools.items():
-            if frappe.db.exists("FAC Tool Configuration", tool_name):
+            instance = unwrap_tool(tool_info.instance)
+            if tool_name in existing:
+                redetected_count += _refresh_category(tool_name, instance)
                 skipped_count += 1
                 continue
 
-            # Detect category
-            try:
-                category = detect_tool_category(tool_info.instance)
-            except Exception:
-                category = "read_write"
+            category, source_hash = _detect(instance)
 
             # Create configuration
             config = frappe.new_doc("FAC Tool Configuration")
@@ -986,12 +1058,11 @@ def _sync_tool_configurations():
             config.enabled = 1  # Default to enabled
             config.tool_category = category
             config.auto_detected_category = category
+            config.category_source_hash = source_hash
             config.category_override = 0
             config.role_access_mode = "Allow All"
-            config.source_app = getattr(tool_info.instance, "source_app", "frappe_assistant_core")
-            config.module_path = (
-                f"{tool_info.instance.__class__.__module__}.{tool_info.instance.__class__.__name__}"
-            )
+            config.source_app = getattr(instance, "source_app", "frappe_assistant_core")
+            config.module_path = f"{instance.__class__.__module__}.{instance.__class__.__name__}"
 
             config.flags.ignore_permissions = True
             config.insert()
@@ -999,17 +1070,21 @@ def _sync_tool_configurations():
 
         # Process external tools
         for tool_name, tool_data in external_tools.items():
-            if frappe.db.exists("FAC Tool Configuration", tool_name):
+            if tool_name in existing:
+                redetected_count += _refresh_category(tool_name, tool_data["instance"])
                 skipped_count += 1
                 continue
 
+            category, source_hash = _detect(tool_data["instance"])
+
             config = frappe.new_doc("FAC Tool Configuration")
             config.tool_name = tool_name
             config.plugin_name = "custom_tools"
             config.description = tool_data.get("description", "")
             config.enabled = 1
-            config.tool_category = "read_write"  # Default for external tools
-            config.auto_detected_category = "read_write"
+            config.tool_category = category
+            config.auto_detected_category = category
+            config.category_source_hash = source_hash
             config.category_override = 0
             config.role_access_mode = "Allow All"
             config.source_app = tool_data.get("source_app", "external")
@@ -1019,9 +1094,13 @@ def _sync_tool_configurations():
             config.insert()
             created_count += 1
 
+        if redetected_count:
+            # set_value skips on_update, so drop the registry's config cache here
+            frappe.cache.delete_keys("fac_tool_registry_*")
+            bump_cache_version("tool_catalog")
+
         # Cleanup orphan tool configurations (tools that no longer exist)
-        existing_configs = frappe.get_all("FAC Tool Configuration", pluck="tool_name")
-        for config_name in existing_configs:
+        for config_name in existing:
             if config_name not in discovered_tool_names:
                 try:
                     frappe.delete_doc(
@@ -1040,7 +1119,8 @@ def _sync_tool_configurations():
         frappe.db.commit()
 
         frappe.logger("migration_hooks").info(
-            f"Tool configurations synced: {created_count} created, {skipped_count} already exist, {deleted_count} removed"
+            f"Tool configurations synced: {created_count} created, {skipped_count} already exist, "
+            f"{redetected_count} re-categorized, {deleted_count} removed"
         )
 
     except Exception as e:
@@ -1065,6 +1145,7 @@ def _get_external_tools_for_sync() -> dict:
 
                     external_tools[tool_name] = {
                         "name": tool_name,
+                        "instance": tool_instance,
                         "description": getattr(tool_instance, "description", "External tool"),
                         "source_app": getattr(tool_instance, "source_app", parts[0].split(".")[0]),
                         "module_path": tool_path,
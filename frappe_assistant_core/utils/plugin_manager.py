@@ -20,17 +20,16 @@ Replaces the old implementation with thread-safe, production-ready code.
 """
 
 import importlib
-import inspect
 import json
 import threading
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set
 
 import frappe
 
-from frappe_assistant_core.core.base_tool import BaseTool
 from frappe_assistant_core.plugins.base_plugin import BasePlugin
 
 
@@ -63,7 +62,7 @@ class ToolInfo:
     name: str
     plugin_name: str
     description: str
-    instance: BaseTool
+    instance: Any  # BaseTool, or a LazyTool standing in for one
 
 
 class PluginError(Exception):
@@ -99,6 +98,11 @@ class PluginConfig:
         """Get plugins directory path"""
         return Path(__file__).parent.parent / "plugins"
 
+    @classmethod
+    def get_tool_module_path(cls, plugin_name: str, tool_module: str) -> Path:
+        """Path of a plugin tool module, found without importing it"""
+        return cls.get_plugins_directory() / plugin_name / "tools" / f"{tool_module}.py"
+
 
 class PluginDiscovery:
     """Stateless plugin discovery service"""
@@ -273,17 +277,30 @@ class PluginPersistence:
             return False
 
 
+@dataclass(frozen=True)
+class SitePluginState:
+    """Enabled plugins and their tools for one site, shared read-only by requests"""
+
+    version: int
+    enabled_plugins: FrozenSet[str]
+    tools: Mapping[str, ToolInfo]
+
+
 class PluginManager:
     """
     Central plugin management service with proper state management.
     Thread-safe, transactional operations, clear responsibilities.
+
+    Enabled plugins are read from the database only when the ``plugin_state``
+    generation changes (FAC Plugin Configuration bumps it on every save), and
+    that generation is checked at most once per request. Each site's tools
+    are held in a read-only mapping that all requests share.
     """
 
     def __init__(self):
         self._lock = threading.RLock()
         self._discovered_plugins: Dict[str, PluginInfo] = {}
-        self._enabled_plugins: Set[str] = set()
-        self._loaded_tools: Dict[str, ToolInfo] = {}
+        self._site_states: Dict[str, SitePluginState] = {}
         self._discovery = PluginDiscovery()
         self._persistence = PluginPersistence()
         self.logger = frappe.logger("plugin_manager")
@@ -297,17 +314,61 @@ class PluginManager:
             # Discover available plugins
             self._discovered_plugins = self._discovery.discover_plugins()
 
-            # Load enabled plugins from persistence
-            self._enabled_plugins = self._persistence.load_enabled_plugins()
-
-            # Load tools from enabled plugins
-            self._load_tools()
+            # Load enabled plugins and their tools for this site
+            self._site_states.clear()
+            clear_request_plugin_state()
+            state = self._get_state()
 
             self.logger.info(
                 f"Plugin manager initialized: {len(self._discovered_plugins)} discovered, "
-                f"{len(self._enabled_plugins)} enabled, {len(self._loaded_tools)} tools loaded"
+                f"{len(state.enabled_plugins)} enabled, {len(state.tools)} tools loaded"
             )
 
+    def _get_state(self) -> SitePluginState:
+        """
+        Plugin state for the current site.
+
+        The first call in a request compares the ``plugin_state`` generation
+        with the one this worker loaded; later calls reuse the result.
+        """
+        state = getattr(frappe.local, "fac_plugin_state", None)
+        if state is not None:
+            return state
+
+        from frappe_assistant_core.utils.cache import get_cache_version
+
+        site = getattr(frappe.local, "site", None)
+        version = get_cache_version("plugin_state")
+        state = self._site_states.get(site)
+        if state is None or state.version != version:
+            with self._lock:
+                state = self._site_states.get(site)
+                if state is None or state.version != version:
+                    state = self._load_state(version, state)
+                    self._site_states[site] = state
+
+        frappe.local.fac_plugin_state = state
+        return state
+
+    def _load_state(self, version: int, previous: Optional[SitePluginState] = None) -> SitePluginState:
+        """Read enabled plugins from the database, reusing tools when they are unchanged"""
+        enabled = frozenset(self._persistence.load_enabled_plugins())
+        if previous is not None and previous.enabled_plugins == enabled:
+            tools = previous.tools
+        else:
+            tools = MappingProxyType(self._load_tools(enabled))
+        return SitePluginState(version=version, enabled_plugins=enabled, tools=tools)
+
+    def _reload_state(self) -> SitePluginState:
+        """Reload this site's state after an enable/disable in this worker"""
+        from frappe_assistant_core.utils.cache import get_cache_version
+
+        with self._lock:
+            state = self._load_state(get_cache_version("plugin_state"))
+            self._site_states[getattr(frappe.local, "site", None)] = state
+            frappe.local.fac_plugin_state = state
+            return state
+
     def refresh_plugins(self) -> bool:
         """Refresh plugin discovery and reload state"""
         try:
@@ -320,6 +381,7 @@ class PluginManager:
 
     def get_discovered_plugins(self) -> List[Dict[str, Any]]:
         """Get all discovered plugins in legacy format for compatibility"""
+        enabled_plugins = self._get_state().enabled_plugins
         with self._lock:
             plugins = []
             for plugin_info in self._discovered_plugins.values():
@@ -332,41 +394,23 @@ class PluginManager:
                         "discovered": True,
                         "can_enable": plugin_info.state != PluginState.ERROR,
                         "validation_error": plugin_info.error_message,
-                        "loaded": plugin_info.name in self._enabled_plugins,
+                        "loaded": plugin_info.name in enabled_plugins,
                         "tools": plugin_info.tools,
                     }
                 )
             return plugins
 
     def get_enabled_plugins(self) -> Set[str]:
-        """Get currently enabled plugin names.
+        """Get currently enabled plugin names."""
+        return set(self._get_state().enabled_plugins)
 
-        Always reads from database to ensure consistency across workers.
-        """
-        with self._lock:
-            # Always read from database for cross-worker consistency
-            db_enabled = self._persistence.load_enabled_plugins()
-
-            # Update in-memory state if different (another worker may have changed it)
-            if db_enabled != self._enabled_plugins:
-                self._enabled_plugins = db_enabled
-                self._load_tools()
-
-            return self._enabled_plugins.copy()
-
-    def get_all_tools(self) -> Dict[str, ToolInfo]:
+    def get_all_tools(self) -> Mapping[str, ToolInfo]:
         """Get tools from enabled plugins only.
 
-        Ensures state is synced from database for cross-worker consistency.
+        The mapping is shared and read-only; copy it with ``dict()`` to add
+        entries (e.g. external tools).
         """
-        with self._lock:
-            # Sync state from database (this also reloads tools if needed)
-            db_enabled = self._persistence.load_enabled_plugins()
-            if db_enabled != self._enabled_plugins:
-                self._enabled_plugins = db_enabled
-                self._load_tools()
-
-            return self._loaded_tools.copy()
+        return self._get_state().tools
 
     def enable_plugin(self, plugin_name: str) -> bool:
         """Enable a plugin atomically using DocType-based persistence."""
@@ -378,28 +422,24 @@ class PluginManager:
             if plugin_info.state == PluginState.ERROR:
                 raise PluginValidationError(f"Plugin '{plugin_name}' has errors: {plugin_info.error_message}")
 
-            if plugin_name in self._enabled_plugins:
+            state = self._get_state()
+            if plugin_name in state.enabled_plugins:
                 return True  # Already enabled
 
             try:
                 # Load plugin tools
                 plugin_tools = self._load_plugin_tools(plugin_name, plugin_info)
 
-                # Add to enabled set
-                self._enabled_plugins.add(plugin_name)
-
-                # Add tools to loaded tools
-                self._loaded_tools.update(plugin_tools)
-
                 # Persist state using new atomic method
                 if not self._persistence.save_plugin_state(plugin_name, True, plugin_info):
                     raise PluginError("Failed to persist plugin state")
 
                 # Also update legacy JSON for backward compatibility
-                self._persistence.save_enabled_plugins(self._enabled_plugins)
+                self._persistence.save_enabled_plugins(state.enabled_plugins | {plugin_name})
 
                 # Update plugin state
                 plugin_info.state = PluginState.ENABLED
+                self._reload_state()
 
                 self.logger.info(
                     f"Plugin '{plugin_name}' enabled successfully with {len(plugin_tools)} tools"
@@ -407,39 +447,30 @@ class PluginManager:
                 return True
 
             except Exception as e:
-                # Rollback on failure
-                self._enabled_plugins.discard(plugin_name)
-                for tool_name in plugin_info.tools:
-                    self._loaded_tools.pop(tool_name, None)
-
                 self.logger.error(f"Failed to enable plugin '{plugin_name}': {e}")
                 raise PluginError(f"Failed to enable plugin '{plugin_name}': {e}")
 
     def disable_plugin(self, plugin_name: str) -> bool:
         """Disable a plugin atomically using DocType-based persistence."""
         with self._lock:
-            if plugin_name not in self._enabled_plugins:
+            state = self._get_state()
+            if plugin_name not in state.enabled_plugins:
                 return True  # Already disabled
 
             try:
                 plugin_info = self._discovered_plugins.get(plugin_name)
-                if plugin_info:
-                    # Remove tools
-                    for tool_name in plugin_info.tools:
-                        self._loaded_tools.pop(tool_name, None)
-
-                    # Update plugin state
-                    plugin_info.state = PluginState.DISABLED
-
-                # Remove from enabled set
-                self._enabled_plugins.discard(plugin_name)
 
                 # Persist state using new atomic method
                 if not self._persistence.save_plugin_state(plugin_name, False, plugin_info):
                     raise PluginError("Failed to persist plugin state")
 
                 # Also update legacy JSON for backward compatibility
-                self._persistence.save_enabled_plugins(self._enabled_plugins)
+                self._persistence.save_enabled_plugins(state.enabled_plugins - {plugin_name})
+
+                if plugin_info:
+                    # Update plugin state
+                    plugin_info.state = PluginState.DISABLED
+                self._reload_state()
 
                 self.logger.info(f"Plugin '{plugin_name}' disabled successfully")
                 return True
@@ -448,42 +479,52 @@ class PluginManager:
                 self.logger.error(f"Failed to disable plugin '{plugin_name}': {e}")
                 raise PluginError(f"Failed to disable plugin '{plugin_name}': {e}")
 
-    def _load_tools(self):
+    def _load_tools(self, enabled_plugins: FrozenSet[str]) -> Dict[str, ToolInfo]:
         """Load tools from all enabled plugins"""
-        self._loaded_tools.clear()
+        from frappe_assistant_core.utils.tool_manifest import load_manifest
 
-        for plugin_name in self._enabled_plugins:
+        loaded_tools = {}
+        manifest = load_manifest()
+
+        for plugin_name in enabled_plugins:
             plugin_info = self._discovered_plugins.get(plugin_name)
             if plugin_info and plugin_info.state != PluginState.ERROR:
                 try:
-                    plugin_tools = self._load_plugin_tools(plugin_name, plugin_info)
-                    self._loaded_tools.update(plugin_tools)
+                    plugin_tools = self._load_plugin_tools(plugin_name, plugin_info, manifest)
+                    loaded_tools.update(plugin_tools)
                 except Exception as e:
                     self.logger.error(f"Failed to load tools for plugin '{plugin_name}': {e}")
 
-    def _load_plugin_tools(self, plugin_name: str, plugin_info: PluginInfo) -> Dict[str, ToolInfo]:
-        """Load tools for a specific plugin"""
+        return loaded_tools
+
+    def _load_plugin_tools(
+        self, plugin_name: str, plugin_info: PluginInfo, manifest: Optional[Dict[str, dict]] = None
+    ) -> Dict[str, ToolInfo]:
+        """
+        Register tools for a specific plugin.
+
+        Tools are described from the tool manifest and imported on first
+        execution; a module is imported here only when its manifest entry is
+        missing or stale.
+        """
+        from frappe_assistant_core.utils.tool_manifest import get_lazy_tool, load_manifest
+
         tools = {}
+        if manifest is None:
+            manifest = load_manifest()
+        overrides = {"source_app": "frappe_assistant_core", "category": plugin_info.display_name}
 
         for tool_name in plugin_info.tools:
             try:
-                # Import tool module
                 module_name = f"{PluginConfig.PLUGIN_BASE_PATH}.{plugin_name}.tools.{tool_name}"
-                module = importlib.import_module(module_name)
-
-                # Find tool class
-                tool_class = None
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if inspect.isclass(attr) and issubclass(attr, BaseTool) and attr is not BaseTool:
-                        tool_class = attr
-                        break
-
-                if tool_class:
-                    tool_instance = tool_class()
-                    tool_instance.source_app = "frappe_assistant_core"
-                    tool_instance.category = plugin_info.display_name
+                tool_instance = get_lazy_tool(
+                    module_name,
+                    PluginConfig.get_tool_module_path(plugin_name, tool_name),
+                    manifest,
+                    overrides,
+                )
 
+                if tool_instance:
                     # Validate dependencies
                     deps_valid, deps_error = tool_instance.validate_dependencies()
                     if not deps_valid:
@@ -508,13 +549,13 @@ class PluginManager:
     @property
     def loaded_plugins(self) -> Dict[str, Any]:
         """Legacy compatibility property"""
-        return {name: None for name in self._enabled_plugins}
+        return {name: None for name in self._get_state().enabled_plugins}
 
     @property
     def plugin_tools(self) -> Dict[str, List[Any]]:
         """Legacy compatibility property"""
         tools_by_plugin = {}
-        for tool_info in self._loaded_tools.values():
+        for tool_info in self.get_all_tools().values():
             if tool_info.plugin_name not in tools_by_plugin:
                 tools_by_plugin[tool_info.plugin_name] = []
             tools_by_plugin[tool_info.plugin_name].append(tool_info.instance)
@@ -538,6 +579,12 @@ def get_plugin_manager() -> PluginManager:
     return _plugin_manager
 
 
+def clear_request_plugin_state():
+    """Make the next plugin lookup in this request re-check the plugin_state generation"""
+    if getattr(frappe.local, "fac_plugin_state", None) is not None:
+        frappe.local.fac_plugin_state = None
+
+
 def refresh_plugin_manager() -> PluginManager:
     """Force refresh the global plugin manager"""
     global _plugin_manager
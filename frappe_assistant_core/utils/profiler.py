@@ -0,0 +1,255 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Opt-in sampling profiler for tool executions.
+
+When a tool call is selected (Assistant Core Settings > Security > Tool
+Profiling: by tool name, by user or by sample rate), ``BaseTool._safe_execute``
+runs ``execute()`` inside ``profile_tool_call``. A daemon thread samples the
+executing thread's Python stack at a fixed interval while ``QueryStats``
+counts and times the SQL. The result is stored as an Assistant Tool Profile
+in collapsed-stack format (``frame;frame;frame count`` per line, root first),
+which speedscope and flamegraph.pl render directly, and the audit row for the
+call links to it.
+
+Calls that are not selected pay for one settings lookup and nothing else.
+"""
+
+import contextlib
+import functools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import frappe
+from frappe.utils import add_days, now_datetime
+
+from frappe_assistant_core.utils.query_stats import QueryStats
+
+PROFILE_DOCTYPE = "Assistant Tool Profile"
+
+# Frames above this depth are dropped (runaway recursion)
+_MAX_STACK_DEPTH = 200
+# Distinct stacks kept per profile; the rarest are folded into one line
+_MAX_STORED_STACKS = 2000
+
+
+@functools.lru_cache(maxsize=64)
+def _split_lines(value: str) -> frozenset:
+    return frozenset(line.strip() for line in (value or "").splitlines() if line.strip())
+
+
+def should_profile(tool_name: str, user: Optional[str] = None) -> bool:
+    """Whether this call is selected for profiling by the current settings."""
+    from frappe_assistant_core.utils.settings import get_assistant_settings
+
+    settings = get_assistant_settings()
+    if not settings.enable_tool_profiling:
+        return False
+
+    if tool_name in _split_lines(settings.profiling_tools):
+        return True
+    if (user or frappe.session.user) in _split_lines(settings.profiling_users):
+        return True
+
+    rate = settings.profiling_sample_rate
+    return rate > 0 and random.random() * 100 < rate
+
+
+def _frame_label(code) -> str:
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_name}"
+
+
+class StackSampler:
+    """
+    Sample one thread's Python stack from a daemon thread.
+
+    The sampler needs the GIL to run, so against CPU-bound pure-Python code
+    the effective interval is bounded by ``sys.getswitchinterval()`` (5 ms
+    by default); time spent in I/O and C extensions is sampled at full rate.
+    """
+
+    def __init__(self, thread_id: int, interval: float, root_frame=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root_frame = root_frame
+        self.stacks: Counter = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="fac-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._collapse(frame)] += 1
+                self.sample_count += 1
+
+    def _collapse(self, frame) -> str:
+        """Walk from the sampled frame up to the profiled root, root first."""
+        labels = []
+        while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+            labels.append(_frame_label(frame.f_code))
+            if frame is self.root_frame:
+                break
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+
+def format_collapsed(stacks: Counter) -> str:
+    """Collapsed-stack text, most frequent stacks first."""
+    ordered = stacks.most_common()
+    lines = [f"{stack} {count}" for stack, count in ordered[:_MAX_STORED_STACKS]]
+    folded = sum(count for _, count in ordered[_MAX_STORED_STACKS:])
+    if folded:
+        lines.append(f"[other stacks] {folded}")
+    return "\n".join(lines)
+
+
+class ToolProfiler:
+    """
+    Context manager that profiles the enclosed block and stores the result.
+
+    Stacks are trimmed at the frame that entered the profiler, so the
+    flame graph starts at ``_safe_execute`` rather than at the web server.
+    """
+
+    def __init__(self, tool_name: str, interval_ms: int = 5):
+        self.tool_name = tool_name
+        self.interval_ms = max(1, interval_ms)
+        self.profile_name = None
+        self._sampler = None
+        self._queries = None
+
+    def __enter__(self):
+        self._started_at = now_datetime()
+        self._queries = QueryStats().__enter__()
+        self._sampler = StackSampler(
+            threading.get_ident(), self.interval_ms / 1000.0, root_frame=sys._getframe(1)
+        )
+        self._start = time.perf_counter()
+        self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall_time = time.perf_counter() - self._start
+        self._sampler.stop()
+        self._queries.__exit__(None, None, None)
+        self.profile_name = self._save(wall_time)
+        frappe.local.fac_tool_profile = self.profile_name
+        return False
+
+    def _save(self, wall_time: float) -> Optional[str]:
+        try:
+            doc = frappe.get_doc(
+                {
+                    "doctype": PROFILE_DOCTYPE,
+                    "tool_name": self.tool_name,
+                    "user": frappe.session.user,
+                    "started_at": self._started_at,
+                    "wall_time": wall_time,
+                    "sample_count": self._sampler.sample_count,
+                    "sample_interval_ms": self.interval_ms,
+                    "query_count": self._queries.query_count,
+                    "db_time": self._queries.db_time,
+                    "collapsed_stacks": format_collapsed(self._sampler.stacks),
+                }
+            )
+            doc.insert(ignore_permissions=True)
+            return doc.name
+        except Exception as e:
+            frappe.logger("profiler").warning(f"Failed to store profile for {self.tool_name}: {e}")
+            return None
+
+
+def profile_tool_call(tool_name: str):
+    """A ``ToolProfiler`` when this call is selected, else a no-op context."""
+    try:
+        if should_profile(tool_name):
+            from frappe_assistant_core.utils.settings import get_assistant_settings
+
+            return ToolProfiler(tool_name, get_assistant_settings().profiling_interval_ms)
+    except Exception as e:
+        frappe.logger("profiler").warning(f"Profiling check failed for {tool_name}: {e}")
+    return contextlib.nullcontext()
+
+
+def pop_current_profile() -> Optional[str]:
+    """Name of the profile stored for the call being logged, cleared on read."""
+    name = getattr(frappe.local, "fac_tool_profile", None)
+    frappe.local.fac_tool_profile = None
+    return name
+
+
+def summarize_collapsed(text: str, limit: int = 25) -> Dict[str, List[Dict]]:
+    """
+    Hottest frames of a collapsed-stack profile.
+
+    ``self`` counts samples where the frame was executing (leaf); ``total``
+    counts samples where it was anywhere on the stack.
+    """
+    own: Counter = Counter()
+    total: Counter = Counter()
+    samples = 0
+    for line in (text or "").splitlines():
+        stack, _, count = line.rpartition(" ")
+        if not stack or not count.isdigit():
+            continue
+        count = int(count)
+        samples += count
+        frames = stack.split(";")
+        own[frames[-1]] += count
+        for frame in set(frames):
+            total[frame] += count
+
+    def rows(counter):
+        return [
+            {"frame": frame, "samples": count, "percent": round(100.0 * count / samples, 1)}
+            for frame, count in counter.most_common(limit)
+        ]
+
+    return {"samples": samples, "self": rows(own), "total": rows(total)}
+
+
+def purge_tool_profiles(days_to_keep: int) -> int:
+    """
+    Delete profiles older than ``days_to_keep`` days in committed batches
+    (see ``utils.audit_retention``). Returns rows removed; a backlog beyond
+    the time budget is finished by later runs.
+    """
+    from frappe_assistant_core.utils import audit_retention
+
+    result = audit_retention._run_in_batches(
+        add_days(now_datetime(), -days_to_keep),
+        lambda names: frappe.db.delete(PROFILE_DOCTYPE, {"name": ("in", names)}),
+        time.monotonic() + audit_retention.RUN_TIME_BUDGET_SECONDS,
+        doctype=PROFILE_DOCTYPE,
+    )
+    return result["processed"]
@@ -17,6 +17,12 @@
 """
 Progress Streaming System for Frappe Assistant Core
 Provides real-time progress updates for long-running operations
+
+Every update is appended (XADD) to a capped Redis stream per operation, so
+any worker can read an operation's latest state or follow it with XREAD.
+Operations are indexed per user in a sorted set written once, when they
+start. Cancellation is a Redis flag that the running tracker polls at most
+every ``_CANCEL_POLL_SECONDS``, so it reaches tools on any worker.
 """
 
 import json
@@ -32,6 +38,61 @@ import frappe
 from frappe_assistant_core.utils.cache import get_cached_server_settings
 from frappe_assistant_core.utils.logger import api_logger
 
+# Entries kept per operation stream (approximate trim on XADD)
+_STREAM_MAXLEN = 100
+_STREAM_TTL = 3600
+# Operations listed per user, and how long the index outlives its last start
+_USER_OPERATIONS_LIMIT = 50
+_USER_INDEX_TTL = 7200
+_CANCEL_TTL = 3600
+_CANCEL_POLL_SECONDS = 1.0
+
+
+def _stream_key(operation_id: str) -> str:
+    return frappe.cache.make_key(f"fac_progress_stream_{operation_id}")
+
+
+def _user_index_key(user: str) -> str:
+    return frappe.cache.make_key(f"fac_progress_operations_{user}")
+
+
+def _cancel_key(operation_id: str) -> str:
+    return frappe.cache.make_key(f"fac_progress_cancel_{operation_id}")
+
+
+def _decode_entry(entry) -> Dict[str, Any]:
+    """A stream entry ``(id, fields)`` as the update dict, with its stream id."""
+    entry_id, fields = entry
+    data = json.loads(fields.get(b"data") or fields.get("data"))
+    data["stream_id"] = frappe.safe_decode(entry_id)
+    return data
+
+
+def read_latest_update(operation_id: str) -> Optional[Dict[str, Any]]:
+    """Latest update of an operation from any worker, or None."""
+    entries = frappe.cache.xrevrange(_stream_key(operation_id), count=1)
+    return _decode_entry(entries[0]) if entries else None
+
+
+def read_operation_updates(
+    operation_id: str, after: str = "0", block_ms: Optional[int] = None, count: int = _STREAM_MAXLEN
+) -> List[Dict[str, Any]]:
+    """
+    Updates of an operation newer than stream id ``after`` (XREAD).
+
+    Pass the ``stream_id`` of the last update seen to follow an operation;
+    ``block_ms`` waits that long for a new update when there is none.
+    """
+    result = frappe.cache.xread({_stream_key(operation_id): after}, count=count, block=block_ms)
+    if not result:
+        return []
+    return [_decode_entry(entry) for entry in result[0][1]]
+
+
+def is_cancel_requested(operation_id: str) -> bool:
+    # Raw command: _cancel_key is already prefixed and the wrapper's exists() would prefix it again
+    return bool(frappe.cache.execute_command("EXISTS", _cancel_key(operation_id)))
+
 
 class ProgressStatus(Enum):
     STARTED = "started"
@@ -84,6 +145,7 @@ class ProgressTracker:
         self.updates: List[ProgressUpdate] = []
         self._callbacks: List[Callable] = []
         self.cancelled = False
+        self._next_cancel_poll = 0.0
 
     def add_callback(self, callback: Callable[[ProgressUpdate], None]):
         """Add a callback for progress updates"""
@@ -102,7 +164,7 @@ class ProgressTracker:
     ):
         """Update progress with new information"""
 
-        if self.cancelled and status not in [ProgressStatus.CANCELLED, ProgressStatus.FAILED]:
+        if status not in [ProgressStatus.CANCELLED, ProgressStatus.FAILED] and self.is_cancelled():
             return  # Don't update if cancelled
 
         # Get previous update for defaults
@@ -142,29 +204,25 @@ class ProgressTracker:
             api_logger.info(f"Operation {self.operation_id}: {status.value} - {message}")
 
     def _cache_update(self, update: ProgressUpdate):
-        """Cache the update for real-time access"""
+        """Append the update to the operation's stream for real-time access"""
         try:
-            cache_key = f"progress_{self.operation_id}"
-            frappe.cache.set_value(cache_key, update.to_dict(), expires_in_sec=3600)
-
-            # Also maintain a user-specific list of active operations
-            user_ops_key = f"user_operations_{self.user}"
-            user_ops = frappe.cache.get_value(user_ops_key) or []
-
-            # Update or add operation
-            found = False
-            for i, op in enumerate(user_ops):
-                if op.get("operation_id") == self.operation_id:
-                    user_ops[i] = update.to_dict()
-                    found = True
-                    break
-
-            if not found:
-                user_ops.append(update.to_dict())
-
-            # Keep only recent operations (last 50)
-            user_ops = user_ops[-50:]
-            frappe.cache.set_value(user_ops_key, user_ops, expires_in_sec=7200)
+            stream_key = _stream_key(self.operation_id)
+            pipe = frappe.cache.pipeline()
+            pipe.xadd(
+                stream_key,
+                {"data": json.dumps(update.to_dict(), default=str)},
+                maxlen=_STREAM_MAXLEN,
+                approximate=True,
+            )
+            pipe.expire(stream_key, _STREAM_TTL)
+
+            # Index the operation for its user once, when it starts
+            if update.status == ProgressStatus.STARTED:
+                index_key = _user_index_key(self.user)
+                pipe.zadd(index_key, {self.operation_id: update.timestamp.timestamp()})
+                pipe.zremrangebyrank(index_key, 0, -(_USER_OPERATIONS_LIMIT + 1))
+                pipe.expire(index_key, _USER_INDEX_TTL)
+            pipe.execute()
 
         except Exception as e:
             api_logger.error(f"Failed to cache progress update: {str(e)}")
@@ -182,6 +240,30 @@ class ProgressTracker:
         self.cancelled = True
         self.update_progress(status=ProgressStatus.CANCELLED, message="Operation cancelled by user")
 
+    def is_cancelled(self) -> bool:
+        """
+        Whether the operation was cancelled, here or from another worker.
+
+        The Redis flag is checked at most every ``_CANCEL_POLL_SECONDS``, so
+        tools can call this on every loop iteration.
+        """
+        if self.cancelled:
+            return True
+
+        now = time.monotonic()
+        if now < self._next_cancel_poll:
+            return False
+        self._next_cancel_poll = now + _CANCEL_POLL_SECONDS
+
+        try:
+            requested = is_cancel_requested(self.operation_id)
+        except Exception as e:
+            api_logger.error(f"Failed to check cancellation of {self.operation_id}: {str(e)}")
+            return False
+        if requested:
+            self.cancel()
+        return requested
+
     def get_latest_update(self) -> Optional[ProgressUpdate]:
         """Get the latest progress update"""
         return self.updates[-1] if self.updates else None
@@ -225,24 +307,36 @@ class ProgressStreamingService:
                 del self.active_trackers[operation_id]
 
     def cancel_operation(self, operation_id: str, user: str = None) -> bool:
-        """Cancel an operation"""
-        with self._lock:
-            tracker = self.active_trackers.get(operation_id)
-            if not tracker:
-                return False
+        """
+        Cancel an operation running on any worker.
+
+        Sets the operation's cancel flag, which its tracker picks up on its
+        next poll; a tracker in this worker is cancelled immediately.
+        """
+        latest = read_latest_update(operation_id)
+        if not latest or latest["status"] in ["completed", "failed", "cancelled"]:
+            return False
 
-            # Check user permission
-            if user and tracker.user != user and not frappe.has_permission("System Manager"):
-                return False
+        # Check user permission
+        if user and latest["user"] != user and "System Manager" not in frappe.get_roles(user):
+            return False
 
+        frappe.cache.set(_cancel_key(operation_id), 1, ex=_CANCEL_TTL)
+
+        with self._lock:
+            tracker = self.active_trackers.get(operation_id)
+        if tracker:
             tracker.cancel()
-            return True
+        return True
 
     def get_user_operations(self, user: str) -> List[Dict[str, Any]]:
         """Get active operations for a user"""
         try:
-            cache_key = f"user_operations_{user}"
-            operations = frappe.cache.get_value(cache_key) or []
+            operation_ids = frappe.cache.zrevrange(_user_index_key(user), 0, _USER_OPERATIONS_LIMIT - 1)
+            pipe = frappe.cache.pipeline()
+            for operation_id in operation_ids:
+                pipe.xrevrange(_stream_key(frappe.safe_decode(operation_id)), count=1)
+            operations = [_decode_entry(entries[0]) for entries in pipe.execute() if entries]
 
             # Filter out completed operations older than 1 hour
             current_time = datetime.now()
@@ -358,8 +452,7 @@ class ProgressContext:
 def get_operation_progress(operation_id: str) -> Dict[str, Any]:
     """Get progress for a specific operation"""
     try:
-        cache_key = f"progress_{operation_id}"
-        progress_data = frappe.cache.get_value(cache_key)
+        progress_data = read_latest_update(operation_id)
 
         if not progress_data:
             return {"success": False, "message": "Operation not found"}
@@ -370,6 +463,30 @@ def get_operation_progress(operation_id: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+@frappe.whitelist()
+def get_operation_updates(operation_id: str, after: str = "0", wait_ms: int = 0) -> Dict[str, Any]:
+    """
+    Updates of an operation after stream id ``after``; pass the last
+    ``stream_id`` received to follow it. Waits up to ``wait_ms`` (capped
+    at 25 seconds) for a new update.
+    """
+    try:
+        latest = read_latest_update(operation_id)
+        if not latest or not _can_view_operation(latest):
+            return {"success": False, "message": "Operation not found"}
+
+        wait_ms = min(frappe.utils.cint(wait_ms), 25000)
+        updates = read_operation_updates(operation_id, after=after, block_ms=wait_ms or None)
+        return {"success": True, "updates": updates}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def _can_view_operation(update: Dict[str, Any]) -> bool:
+    return update.get("user") == frappe.session.user or "System Manager" in frappe.get_roles()
+
+
 @frappe.whitelist()
 def get_user_operations() -> Dict[str, Any]:
     """Get all operations for the current user"""
@@ -430,6 +547,12 @@ def get_current_progress_tracker() -> Optional[ProgressTracker]:
     return getattr(threading.current_thread(), "progress_tracker", None)
 
 
+def is_operation_cancelled() -> bool:
+    """Whether the current thread's operation was cancelled; cheap enough to call per iteration."""
+    tracker = get_current_progress_tracker()
+    return bool(tracker and tracker.is_cancelled())
+
+
 def update_progress(progress_percent: int = None, message: str = "", current_step: str = "", **kwargs):
     """Convenience function to update current operation progress"""
     tracker = get_current_progress_tracker()
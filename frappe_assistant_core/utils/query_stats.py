@@ -0,0 +1,119 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Per-call SQL accounting for tool executions.
+
+``QueryStats`` shadows ``sql`` on the request's database connection for the
+duration of a ``with`` block. Every frappe.db helper (get_value, get_all,
+get_doc, qb ``run()``) goes through that method, so the block sees each
+statement: it counts them, times them, totals the rows returned and groups
+them by fingerprint (the SQL with literals and placeholders normalized).
+
+A fingerprint executed more than ``fac_n_plus_one_threshold`` times (site
+config, default 10) is reported as a likely N+1 pattern, e.g. one
+``frappe.get_doc`` per row of an earlier result.
+"""
+
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import frappe
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(query: str) -> str:
+    """Normalize a statement so repeats with different values compare equal."""
+    query = _STRING_LITERAL.sub("?", query)
+    query = _PLACEHOLDER.sub("?", query)
+    query = _NUMBER.sub("?", query)
+    query = _VALUE_LIST.sub("(...)", query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def get_n_plus_one_threshold() -> int:
+    return frappe.utils.cint(frappe.conf.get("fac_n_plus_one_threshold")) or DEFAULT_N_PLUS_ONE_THRESHOLD
+
+
+class QueryStats:
+    """Context manager counting the SQL issued on ``frappe.db`` inside it."""
+
+    def __init__(self, db=None):
+        self.db = db
+        self.query_count = 0
+        self.db_time = 0.0
+        self.rows_returned = 0
+        self._statements: Counter = Counter()
+        self._original = None
+        self._shadowed = False
+
+    def __enter__(self):
+        self.db = self.db or frappe.local.db
+        if self.db is not None:
+            self._shadowed = "sql" in vars(self.db)
+            self._original = self.db.sql
+            self.db.sql = self._sql
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.db is not None and self._original is not None:
+            if self._shadowed:
+                self.db.sql = self._original
+            else:
+                vars(self.db).pop("sql", None)
+        return False
+
+    def _sql(self, query, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = self._original(query, *args, **kwargs)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.query_count += 1
+            self._statements[str(query)] += 1
+        if isinstance(result, (list, tuple)):
+            self.rows_returned += len(result)
+        return result
+
+    def fingerprints(self) -> Counter:
+        """Executions per normalized statement."""
+        counts: Counter = Counter()
+        for statement, count in self._statements.items():
+            counts[fingerprint(statement)] += count
+        return counts
+
+    def as_dict(self, n_plus_one_threshold: Optional[int] = None) -> Dict:
+        threshold = n_plus_one_threshold or get_n_plus_one_threshold()
+        counts = self.fingerprints()
+        n_plus_one: List[Dict] = [
+            {"query": query, "count": count} for query, count in counts.most_common() if count > threshold
+        ]
+        return {
+            "query_count": self.query_count,
+            "db_time": round(self.db_time, 6),
+            "rows_returned": self.rows_returned,
+            "duplicate_queries": sum(count - 1 for count in counts.values()),
+            "n_plus_one": n_plus_one,
+        }
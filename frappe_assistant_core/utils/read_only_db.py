@@ -20,9 +20,146 @@ Provides secure, read-only access to Frappe database operations
 """
 
 import re
+from functools import lru_cache
+from typing import Optional
 
 import frappe
 
+# Keywords that start a write (or procedure/dynamic SQL) statement
+DANGEROUS_KEYWORDS = (
+    "DELETE",
+    "DROP",
+    "INSERT",
+    "UPDATE",
+    "ALTER",
+    "CREATE",
+    "TRUNCATE",
+    "REPLACE",
+    "MERGE",
+    "UPSERT",
+    "CALL",
+    "EXECUTE",
+)
+ALLOWED_STATEMENTS = ("SELECT", "SHOW", "DESCRIBE", "DESC", "EXPLAIN")
+
+# Longer query texts (usually with inlined values) are checked without being cached
+_CACHEABLE_QUERY_LENGTH = 4096
+
+# One pass over the query: comments and quoted strings/identifiers are consumed
+# whole so keywords inside them are ignored, following each database's lexer.
+# Executable comments (/*! ... */, /*M! ... */) run their contents, so only
+# their markers are skipped; PostgreSQL treats them as plain comments, for
+# which scanning the contents is merely stricter.
+_TOKENS = {
+    # "-- " needs a following space or control character; "#" comments to end of line
+    "mariadb": re.compile(
+        r"""
+        (?P<exec_marker>/\*M?!\d*|\*/)
+        | (?P<comment>(?:--(?=\s|$)|\#)[^\r\n]*|/\*.*?\*/)
+        | (?P<quoted>'(?:[^']|'')*'|"(?:[^"]|"")*"|`(?:[^`]|``)*`)
+        | (?P<word>[A-Za-z0-9_$]+)
+        | (?P<space>\s+)
+        | (?P<other>.)
+        """,
+        re.VERBOSE | re.DOTALL,
+    ),
+    # "#" is an operator; $tag$ ... $tag$ is a string. Nested block comments
+    # end early here, which only means more of them is scanned.
+    "postgres": re.compile(
+        r"""
+        (?P<exec_marker>/\*M?!\d*|\*/)
+        | (?P<comment>--[^\r\n]*|/\*.*?\*/)
+        | (?P<quoted>'(?:[^']|'')*'|"(?:[^"]|"")*"|`(?:[^`]|``)*`
+            |\$(?P<tag>[A-Za-z_][A-Za-z0-9_]*|)\$.*?\$(?P=tag)\$)
+        | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+        | (?P<space>\s+)
+        | (?P<other>.)
+        """,
+        re.VERBOSE | re.DOTALL,
+    ),
+}
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_$]*")
+_CALL_PAREN = re.compile(r"\s*\(")
+_SEMICOLON = re.compile(";")
+_IGNORED = ("exec_marker", "comment", "space")
+
+
+def _nested_keyword(query: str, word) -> Optional[str]:
+    keyword = word.group().upper()
+    # REPLACE(...) and INSERT(...) are also string functions
+    if keyword in DANGEROUS_KEYWORDS and not _CALL_PAREN.match(query, word.end()):
+        return f"🚫 Security: Nested {keyword} operations not allowed in read-only mode"
+    return None
+
+
+def _classify(query: str, dialect: str) -> Optional[str]:
+    """
+    Why ``query`` is not a read-only statement for ``dialect``, or None if it is.
+
+    The first keyword must be an allowed statement, no dangerous keyword may
+    appear outside strings and comments, and only one statement is allowed.
+    Backslash escapes depend on server settings (and E'' strings on
+    PostgreSQL), so when the query contains a backslash every word is
+    scanned, strings and comments included.
+    """
+    tokens = (m for m in _TOKENS[dialect].finditer(query) if m.lastgroup not in _IGNORED)
+    first = next(tokens, None)
+    if first is None:
+        return "🚫 Security: Empty query not allowed"
+
+    statement = first.group().upper()
+    if statement in DANGEROUS_KEYWORDS:
+        return (
+            f"🚫 Security: {statement} operations not allowed in read-only mode. "
+            f"Only SELECT, SHOW, DESCRIBE, and EXPLAIN queries are permitted."
+        )
+    if first.lastgroup != "word" or statement not in ALLOWED_STATEMENTS:
+        return (
+            f"🚫 Security: Only SELECT, SHOW, DESCRIBE, and EXPLAIN queries are allowed in read-only mode. "
+            f"Query starts with: {statement}"
+        )
+
+    # Most reads contain no dangerous keyword or ";" at all; nothing more to check then
+    upper = query.upper()
+    if ";" not in query and not any(keyword in upper for keyword in DANGEROUS_KEYWORDS):
+        return None
+
+    if "\\" in query:
+        for word in _WORD.finditer(query, first.end()):
+            error = _nested_keyword(query, word)
+            if error:
+                return error
+        # Any ";" might end the statement, so each one may only be followed by
+        # whitespace and comments (which backslashes do not affect)
+        for semicolon in _SEMICOLON.finditer(query, first.end()):
+            following = _TOKENS[dialect].finditer(query, semicolon.end())
+            if any(token.lastgroup not in _IGNORED for token in following):
+                return "🚫 Security: Multiple statements not allowed in read-only mode"
+        return None
+
+    ended = False
+    for token in tokens:
+        if ended:
+            return "🚫 Security: Multiple statements not allowed in read-only mode"
+        if token.lastgroup == "word":
+            error = _nested_keyword(query, token)
+            if error:
+                return error
+        elif token.group() == ";":
+            ended = True
+    return None
+
+
+_classify_cached = lru_cache(maxsize=1024)(_classify)
+
+
+def classify_query(query: str, db_type: str = "mariadb") -> Optional[str]:
+    """``_classify`` with an LRU cache, so a repeated query text is validated once."""
+    dialect = "postgres" if db_type == "postgres" else "mariadb"
+    if len(query) > _CACHEABLE_QUERY_LENGTH:
+        return _classify(query, dialect)
+    return _classify_cached(query, dialect)
+
 
 class ReadOnlyDatabase:
     """
@@ -92,57 +229,13 @@ class ReadOnlyDatabase:
 
         Blocks all write operations with clear error messages.
         """
-        if not query or not query.strip():
+        if not query or not str(query).strip():
             raise frappe.ValidationError("🚫 Security: Empty query not allowed")
 
-        # Clean and normalize query for analysis
-        query_upper = query.strip().upper()
-
-        # Remove comments and normalize whitespace for better detection
-        query_normalized = re.sub(r"--.*$", "", query_upper, flags=re.MULTILINE)
-        query_normalized = re.sub(r"/\*.*?\*/", "", query_normalized, flags=re.DOTALL)
-        query_normalized = " ".join(query_normalized.split())
-
-        # Define dangerous keywords that indicate write operations
-        dangerous_keywords = [
-            "DELETE",
-            "DROP",
-            "INSERT",
-            "UPDATE",
-            "ALTER",
-            "CREATE",
-            "TRUNCATE",
-            "REPLACE",
-            "MERGE",
-            "UPSERT",
-            "CALL",
-            "EXECUTE",
-        ]
-
-        # Check if query starts with dangerous operations
-        for keyword in dangerous_keywords:
-            if query_normalized.startswith(keyword + " ") or query_normalized == keyword:
-                raise frappe.ValidationError(
-                    f"🚫 Security: {keyword} operations not allowed in read-only mode. "
-                    f"Only SELECT, SHOW, DESCRIBE, and EXPLAIN queries are permitted."
-                )
-
-        # Define allowed read-only query types
-        allowed_prefixes = ["SELECT ", "SHOW ", "DESCRIBE ", "DESC ", "EXPLAIN "]
-
-        # Check if query starts with allowed operations
-        if not any(query_normalized.startswith(prefix) for prefix in allowed_prefixes):
-            raise frappe.ValidationError(
-                f"🚫 Security: Only SELECT, SHOW, DESCRIBE, and EXPLAIN queries are allowed in read-only mode. "
-                f"Query starts with: {query_normalized.split()[0] if query_normalized else 'unknown'}"
-            )
-
-        # Additional security check for nested dangerous operations
-        for keyword in dangerous_keywords:
-            if f" {keyword} " in query_normalized or query_normalized.endswith(f" {keyword}"):
-                raise frappe.ValidationError(
-                    f"🚫 Security: Nested {keyword} operations not allowed in read-only mode"
-                )
+        # Query builder objects are validated by their SQL text
+        error = classify_query(str(query), getattr(self._original_db, "db_type", "mariadb"))
+        if error:
+            raise frappe.ValidationError(error)
 
         try:
             # Execute the validated read-only query
@@ -0,0 +1,140 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Process-wide snapshot of Assistant Core Settings.
+
+Hot paths (MCP initialize/tools/list, code execution limits, OCR, status)
+read settings through ``get_assistant_settings()``. The snapshot is memoized
+per worker and keyed by the ``assistant_settings`` generation counter, which
+``invalidate_settings_cache`` advances whenever the Single is saved. After
+warmup a settings read costs one Redis GET and no database queries.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict
+
+import frappe
+from frappe.utils import cint, flt
+
+SETTINGS_DOCTYPE = "Assistant Core Settings"
+_SETTINGS_VERSION = "assistant_settings"
+
+# site -> (generation, AssistantSettings)
+_settings_state: Dict[str, tuple] = {}
+
+
+@dataclass(frozen=True)
+class AssistantSettings:
+    """Typed, read-only view of the fields read on request paths."""
+
+    server_enabled: bool = True
+    mcp_server_name: str = "frappe-assistant-core"
+    mcp_protocol_version: str = "2025-06-18"
+    mcp_transport_type: str = "StreamableHTTP"
+    skill_mode: str = "supplementary"
+    code_execution_timeout: int = 30
+    code_execution_max_memory_mb: int = 512
+    code_execution_max_cpu_seconds: int = 60
+    code_execution_max_recursion: int = 500
+    audit_log_retention_days: int = 180
+    audit_payload_retention_days: int = 0
+    enable_tool_profiling: bool = False
+    profiling_sample_rate: float = 0.0
+    profiling_interval_ms: int = 5
+    profiling_tools: str = ""
+    profiling_users: str = ""
+    ocr_backend: str = "paddleocr"
+    ocr_language: str = "en"
+    paddleocr_timeout: int = 120
+    paddleocr_max_memory_mb: int = 2048
+    ollama_api_url: str = "http://localhost:11434"
+    ollama_vision_model: str = "deepseek-ocr:latest"
+    ollama_request_timeout: int = 120
+    ollama_max_concurrency: int = 2
+
+    @classmethod
+    def from_values(cls, values: Dict) -> "AssistantSettings":
+        """
+        Build a snapshot from raw Singles values.
+
+        Blank (unset) values fall back to the field default; an explicit 0 is
+        kept, since some fields (e.g. audit_log_retention_days) treat it as
+        "disabled".
+        """
+        kwargs = {}
+        for field in fields(cls):
+            value = values.get(field.name)
+            if value in (None, ""):
+                continue
+            if field.type is bool:
+                kwargs[field.name] = bool(cint(value))
+            elif field.type is int:
+                kwargs[field.name] = cint(value)
+            elif field.type is float:
+                kwargs[field.name] = flt(value)
+            else:
+                kwargs[field.name] = str(value)
+        return cls(**kwargs)
+
+
+def _load_settings() -> AssistantSettings:
+    """Read the Single in one query (no Document construction)."""
+    return AssistantSettings.from_values(frappe.db.get_singles_dict(SETTINGS_DOCTYPE))
+
+
+def get_assistant_settings() -> AssistantSettings:
+    """
+    Return the settings snapshot for the current site.
+
+    Falls back to defaults when the Single cannot be read (e.g. during
+    install before the DocType exists); the fallback is not memoized.
+    """
+    from frappe_assistant_core.utils.cache import get_cache_version
+
+    site = frappe.local.site
+    version = get_cache_version(_SETTINGS_VERSION)
+    state = _settings_state.get(site)
+    if state and state[0] == version:
+        return state[1]
+
+    from frappe_assistant_core.utils.metrics import record_cache_lookup
+
+    record_cache_lookup("assistant_settings", False)
+    try:
+        settings = _load_settings()
+    except Exception as e:
+        frappe.logger().warning(f"Failed to load {SETTINGS_DOCTYPE}, using defaults: {e}")
+        return AssistantSettings()
+
+    _settings_state[site] = (version, settings)
+    return settings
+
+
+def invalidate_assistant_settings():
+    """
+    Advance the settings generation so every worker reloads its snapshot.
+    Bumped again after commit so a worker that reloaded mid-transaction
+    cannot pin the pre-commit values.
+    """
+    from frappe_assistant_core.utils.cache import bump_cache_version
+
+    _settings_state.pop(frappe.local.site, None)
+    bump_cache_version(_SETTINGS_VERSION)
+    try:
+        frappe.db.after_commit.add(lambda: bump_cache_version(_SETTINGS_VERSION))
+    except AttributeError:
+        pass
@@ -14,16 +14,60 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+"""
+Jinja helpers registered through ``hooks.jenv``.
+
+get_assistant_status and get_tool_count are memoized on ``frappe.local`` for
+the current request and shared across workers for ``_SHARED_TTL`` seconds,
+keyed by the plugin_state and assistant_settings generations, so a plugin
+or settings change is picked up on the next request.
+"""
+
 import frappe
 from frappe import _
 
+_SHARED_TTL = 60
+_VERSION_FAMILIES = ("plugin_state", "assistant_settings")
+
+
+def _cached(name: str, compute):
+    memo = getattr(frappe.local, "fac_template_helpers", None)
+    if memo is None:
+        memo = frappe.local.fac_template_helpers = {}
+    if name in memo:
+        return memo[name]
+
+    from frappe_assistant_core.utils.cache import get_cache_versions
+    from frappe_assistant_core.utils.metrics import record_cache_lookup
+
+    versions = "_".join(str(v) for v in get_cache_versions(*_VERSION_FAMILIES))
+    cache_key = f"fac_template_{name}_{versions}"
+    value = frappe.cache.get_value(cache_key)
+    record_cache_lookup("template_helpers", value is not None)
+    if value is None:
+        value = compute()
+        frappe.cache.set_value(cache_key, value, expires_in_sec=_SHARED_TTL)
+
+    memo[name] = value
+    return value
+
+
+def _compute_assistant_status():
+    from frappe_assistant_core.assistant_core.server import get_server_status
+
+    return get_server_status()
+
+
+def _compute_tool_count():
+    from frappe_assistant_core.utils.plugin_manager import get_plugin_manager
+
+    return len(get_plugin_manager().get_all_tools())
+
 
 def get_assistant_status():
     """Template helper to get assistant server status"""
     try:
-        from frappe_assistant_core.assistant_core.server import get_server_status
-
-        return get_server_status()
+        return _cached("assistant_status", _compute_assistant_status)
     except Exception:
         return {"running": False, "enabled": False}
 
@@ -31,11 +75,7 @@ def get_assistant_status():
 def get_tool_count():
     """Template helper to get count of enabled tools"""
     try:
-        from frappe_assistant_core.utils.plugin_manager import get_plugin_manager
-
-        plugin_manager = get_plugin_manager()
-        all_tools = plugin_manager.get_all_tools()
-        return len(all_tools)
+        return _cached("tool_count", _compute_tool_count)
     except Exception:
         return 0
 
@@ -17,8 +17,10 @@ Categories:
 """
 
 import ast
+import hashlib
 import inspect
-from typing import Optional, Set
+import os
+from typing import Dict, Optional, Set, Tuple
 
 import frappe
 
@@ -212,6 +214,11 @@ class ToolCategoryDetector:
 # Global detector instance
 _detector: Optional[ToolCategoryDetector] = None
 
+# (source file, mtime_ns, size) -> sha1 of the file
+_source_hashes: Dict[Tuple[str, int, int], str] = {}
+# (class path, tool name, source hash) -> category
+_detected_categories: Dict[Tuple[str, str, str], str] = {}
+
 
 def get_detector() -> ToolCategoryDetector:
     """Get or create the global detector instance."""
@@ -221,17 +228,54 @@ def get_detector() -> ToolCategoryDetector:
     return _detector
 
 
+def get_source_hash(tool_class) -> str:
+    """
+    SHA-1 of the file defining ``tool_class``, or "" when it has no file.
+
+    The digest is kept per (path, mtime, size), so repeat calls cost a stat.
+    """
+    try:
+        path = inspect.getsourcefile(tool_class)
+        stat = os.stat(path)
+    except (TypeError, OSError):
+        return ""
+
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _source_hashes.get(key)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        _source_hashes[key] = digest
+    return digest
+
+
 def detect_tool_category(tool_instance) -> str:
     """
     Convenience function to detect a tool's category.
 
+    The result is memoized per tool class and source file hash, so the
+    source is parsed once per worker until the file changes.
+
     Args:
         tool_instance: An instance of a tool class
 
     Returns:
         Category string: 'read_only', 'write', 'read_write', or 'privileged'
     """
-    return get_detector().detect_category(tool_instance)
+    from frappe_assistant_core.utils.tool_manifest import unwrap_tool
+
+    tool_instance = unwrap_tool(tool_instance)
+    tool_class = tool_instance.__class__
+    key = (
+        f"{tool_class.__module__}.{tool_class.__qualname__}",
+        getattr(tool_instance, "name", None) or "",
+        get_source_hash(tool_class),
+    )
+    category = _detected_categories.get(key)
+    if category is None:
+        category = get_detector().detect_category(tool_instance)
+        _detected_categories[key] = category
+    return category
 
 
 def category_to_annotations(category: str) -> dict:
@@ -0,0 +1,231 @@
+# Frappe Assistant Core - AI Assistant integration for Frappe Framework
+# Copyright (C) 2025 Paul Clinton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tool manifest: what tools/list needs from a plugin tool, without importing it.
+
+Each entry holds a tool module's class name, the attributes read when listing
+tools (name, description, inputSchema, ...) and whether the class overrides
+``check_permission``. Entries are stamped with the module file's mtime and
+size, record which of the tool's (optional) dependencies are installed, since
+a description may depend on them, and live in the ``fac_tool_manifest`` Redis
+hash, which ``build_tool_manifest`` fills for every discovered plugin after
+migrate.
+
+The plugin manager registers a ``LazyTool`` per entry, so a worker imports a
+tool module (and whatever it imports, e.g. pandas) only when that tool is
+first executed. A missing or stale entry is rebuilt by importing the module.
+"""
+
+import importlib
+import importlib.util
+import inspect
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import frappe
+
+from frappe_assistant_core.core.base_tool import BaseTool
+
+_MANIFEST_KEY = "fac_tool_manifest"
+
+# Instance attributes copied into the manifest and onto LazyTool
+MANIFEST_ATTRIBUTES = (
+    "name",
+    "description",
+    "inputSchema",
+    "annotations",
+    "requires_permission",
+    "dependencies",
+    "default_config",
+)
+
+
+def module_stamp(path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def installed_modules(modules) -> Dict[str, bool]:
+    """Whether each of ``modules`` can be imported, without importing it."""
+    return {module: importlib.util.find_spec(module) is not None for module in modules}
+
+
+def find_tool_class(module) -> Optional[type]:
+    """First BaseTool subclass defined in or imported into ``module``."""
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if inspect.isclass(attr) and issubclass(attr, BaseTool) and attr is not BaseTool:
+            return attr
+    return None
+
+
+def build_entry(module_name: str, stamp) -> Tuple[Optional[dict], Optional[BaseTool]]:
+    """Import ``module_name`` and describe its tool. Returns (entry, instance)."""
+    tool_class = find_tool_class(importlib.import_module(module_name))
+    if not tool_class:
+        return None, None
+
+    instance = tool_class()
+    entry = {
+        "stamp": stamp,
+        "class_name": tool_class.__name__,
+        "custom_permission_check": tool_class.check_permission is not BaseTool.check_permission,
+        "modules": installed_modules(
+            [*getattr(instance, "dependencies", []), *getattr(instance, "optional_dependencies", [])]
+        ),
+    }
+    for attr in MANIFEST_ATTRIBUTES:
+        entry[attr] = getattr(instance, attr, None)
+    return entry, instance
+
+
+def load_manifest() -> Dict[str, dict]:
+    """All stored entries, keyed by module name."""
+    try:
+        return frappe.cache.hgetall(_MANIFEST_KEY) or {}
+    except Exception as e:
+        frappe.logger("plugin_manager").warning(f"Failed to read tool manifest: {e}")
+        return {}
+
+
+def store_entry(module_name: str, entry: dict):
+    try:
+        frappe.cache.hset(_MANIFEST_KEY, module_name, entry)
+    except Exception as e:
+        frappe.logger("plugin_manager").warning(f"Failed to store tool manifest entry for {module_name}: {e}")
+
+
+def get_lazy_tool(module_name: str, path, manifest: Dict[str, dict], overrides: dict) -> Optional["LazyTool"]:
+    """
+    A ``LazyTool`` for ``module_name`` from ``manifest``, rebuilding (and
+    importing) the entry when it is missing, its stamp no longer matches or a
+    dependency has been installed or removed since.
+    """
+    stamp = module_stamp(path)
+    entry = manifest.get(module_name)
+    instance = None
+    if (
+        not entry
+        or stamp is None
+        or entry.get("stamp") != stamp
+        or installed_modules(entry.get("modules") or {}) != (entry.get("modules") or {})
+    ):
+        entry, instance = build_entry(module_name, stamp)
+        if entry is None:
+            return None
+        store_entry(module_name, entry)
+    return LazyTool(module_name, entry, overrides, instance=instance)
+
+
+def build_tool_manifest() -> int:
+    """Rebuild the manifest for every tool of every discovered plugin (after_migrate)."""
+    from frappe_assistant_core.utils.plugin_manager import PluginConfig, PluginDiscovery
+
+    frappe.cache.delete_value(_MANIFEST_KEY)
+    built = 0
+    for plugin_name, plugin_info in PluginDiscovery().discover_plugins().items():
+        for tool_module in plugin_info.tools:
+            module_name = f"{PluginConfig.PLUGIN_BASE_PATH}.{plugin_name}.tools.{tool_module}"
+            path = PluginConfig.get_tool_module_path(plugin_name, tool_module)
+            try:
+                entry, _instance = build_entry(module_name, module_stamp(path))
+                if entry:
+                    store_entry(module_name, entry)
+                    built += 1
+            except Exception as e:
+                frappe.logger("plugin_manager").warning(f"Skipping {module_name} in tool manifest: {e}")
+    return built
+
+
+class LazyTool:
+    """
+    Stand-in for a plugin tool, built from its manifest entry.
+
+    The attributes read when listing tools are set from the manifest; any
+    other attribute (``_safe_execute``, ``execute``, ...) imports the module,
+    creates the tool once and is forwarded to it.
+    """
+
+    def __init__(self, module_name: str, entry: dict, overrides: dict, instance: Optional[BaseTool] = None):
+        self._module_name = module_name
+        self._class_name = entry["class_name"]
+        self._custom_permission_check = entry.get("custom_permission_check", True)
+        self._overrides = overrides
+        self._lock = threading.Lock()
+        self._instance = None
+
+        for attr in MANIFEST_ATTRIBUTES:
+            setattr(self, attr, entry.get(attr))
+        for attr, value in overrides.items():
+            setattr(self, attr, value)
+        if instance is not None:
+            self._set_instance(instance)
+
+    def _set_instance(self, instance: BaseTool):
+        for attr, value in self._overrides.items():
+            setattr(instance, attr, value)
+        self._instance = instance
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._instance is not None
+
+    def load(self) -> BaseTool:
+        """The real tool, importing its module on first use."""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    module = importlib.import_module(self._module_name)
+                    self._set_instance(getattr(module, self._class_name)())
+        return self._instance
+
+    def __getattr__(self, name):
+        # Only reached for attributes not copied from the manifest
+        if name.startswith("__") or name in ("_instance", "_lock", "_overrides"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def check_permission(self) -> None:
+        if self._custom_permission_check:
+            return self.load().check_permission()
+        return BaseTool.check_permission(self)
+
+    def validate_dependencies(self):
+        return BaseTool.validate_dependencies(self)
+
+    def get_metadata(self) -> dict:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "class": self._class_name,
+            "module": self._module_name,
+            "source_app": self.source_app,
+            "category": self.category,
+            "requires_permission": self.requires_permission,
+            "dependencies": self.dependencies,
+            "inputSchema": self.inputSchema,
+            "default_config": self.default_config,
+        }
+
+
+def unwrap_tool(tool):
+    """The real tool behind a ``LazyTool``; other tools are returned as-is."""
+    return tool.load() if isinstance(tool, LazyTool) else tool
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Ollama PDF OCR page throughput
+
+Starts a local stand-in Ollama server that answers /api/generate after a
+fixed per-page delay and measures pages/minute for:
+
+  * baseline   - one ``requests.post`` per page, one page at a time
+  * pipelined  - ``OllamaOCRClient.extract_pages`` (pooled session,
+                 background rendering, concurrent requests)
+
+The stand-in handles requests in parallel, like an Ollama server started
+with OLLAMA_NUM_PARALLEL; real speedups depend on that setting and the GPU.
+
+Usage:
+    python scripts/benchmark_ollama_ocr.py [--pages 40] [--page-ms 200] [--render-ms 30] [--concurrency 4]
+"""
+
+import argparse
+import base64
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from frappe_assistant_core.plugins.data_science.tools.ollama_ocr import OCR_PROMPT, OllamaOCRClient  # noqa: E402
+
+
+def make_handler(page_seconds):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            time.sleep(page_seconds)
+            data = json.dumps({"response": "lorem ipsum " * 50}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def render(pages, render_seconds, jpeg):
+    """Stand-in for PyMuPDF rendering: a fixed delay per page."""
+    for page_num in range(pages):
+        time.sleep(render_seconds)
+        yield page_num, jpeg
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--page-ms", type=int, default=200)
+    parser.add_argument("--render-ms", type=int, default=30)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.page_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    jpeg = b"\xff\xd8" + b"\0" * 200_000
+
+    start = time.perf_counter()
+    for _page_num, image in render(args.pages, args.render_ms / 1000, jpeg):
+        payload = {
+            "model": "stand-in",
+            "prompt": OCR_PROMPT,
+            "images": [base64.b64encode(image).decode()],
+            "stream": False,
+        }
+        requests.post(f"{url}/api/generate", json=payload, timeout=30).raise_for_status()
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with OllamaOCRClient(url, "stand-in", timeout=30, concurrency=args.concurrency) as client:
+        texts = client.extract_pages(render(args.pages, args.render_ms / 1000, jpeg))
+    pipelined = time.perf_counter() - start
+    assert sorted(texts) == list(range(args.pages))
+
+    server.shutdown()
+
+    print(
+        f"{args.pages} pages, {args.page_ms} ms/page OCR, {args.render_ms} ms/page render, "
+        f"concurrency {args.concurrency}"
+    )
+    for label, seconds in (("baseline", baseline), ("pipelined", pipelined)):
+        print(f"{label:<10} {seconds:6.2f} s  {args.pages / seconds * 60:7.1f} pages/min")
+
+
+if __name__ == "__main__":
+    main()